@@ -1,4 +1,4 @@
-'# -*- coding: utf-8 -*-
+# -*- coding: utf-8 -*-
 """
 Created on Mon Jan 19 23:16:39 2026
 
@@ -54,45 +54,3109 @@ Tem bom equilíbrio entre complexidade e performance
 """
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import time
+STARTUP_T0 = time.perf_counter()
+# matplotlib, scikit-learn, joblib, scipy e pyarrow são importados dentro das funções que os usam:
+# a janela abre sem pagar por eles
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, scrolledtext
+from tkinter import ttk, messagebox, filedialog, scrolledtext, simpledialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import seaborn as sns
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
-from sklearn.preprocessing import StandardScaler
 import datetime
 import os
 import json
-import time
+import hashlib
+import pickle
+import copy
+import shutil
 import threading
+import itertools
+import multiprocessing
+import queue
+import collections
+import logging
+import logging.handlers
 import warnings
+import math
+import argparse
+import operator
+import glob
+import io
+import base64
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 warnings.filterwarnings('ignore')
+IMPORTS_DONE = time.perf_counter()
+
+INGEST_CHUNK_ROWS = 250_000
+SUPPORTED_EXTENSIONS = ('.csv', '.xlsx', '.xls', '.json', '.jsonl', '.ndjson', '.parquet')
+INGEST_POLL_MS = 200
+INGEST_SHARD_WORKERS = max(2, min(8, os.cpu_count() or 2))
+SCHEMA_SAMPLE_ROWS = 1000
+PUSHDOWN_PREDICATE_ROWS = 3
+PREDICATE_OPS = {'==': operator.eq, '!=': operator.ne, '<': operator.lt,
+                 '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+TOURNAMENT_FOLDS = 5
+TOURNAMENT_WORKERS = max(1, os.cpu_count() or 1)
+PREDICT_CHUNK_ROWS = 100_000
+PREDICT_WORKERS = max(1, os.cpu_count() or 1)
+PREDICT_POLL_MS = 250
+APPROX_SAMPLE_ROWS = 200_000
+APPROX_AUTO_ROWS = 5_000_000
+APPROX_CONFIDENCE = 0.95
+APPROX_Z = 1.959963984540054
+COMPACT_ON_LOAD = True
+# Texto só vira 'category' com baixa cardinalidade: até 5% de valores distintos e no máximo COMPACT_CATEGORY_MAX
+COMPACT_CATEGORY_RATIO = 0.05
+COMPACT_CATEGORY_MAX = 10_000
+INGEST_STATUS_LABELS = {
+    'queued': "⏳ Na fila",
+    'running': "⛏️ Minerando",
+    'done': "✅ Concluído",
+    'cancelled': "🛑 Cancelado",
+    'error': "❌ Erro"
+}
+
+AUTOSAVE_DIR = os.path.join(os.path.expanduser("~"), ".minecraft_databackup")
+AUTOSAVE_INTERVAL_SEC = 300
+AUTOSAVE_KEEP_SNAPSHOTS = 3
+AUTOSAVE_MAX_MB = 2048
+LOG_FILE = os.path.join(AUTOSAVE_DIR, "minerador.log")
+LOG_FILE_MAX_MB = 5
+LOG_FILE_BACKUPS = 3
+LOG_MAX_LINES = 1000
+UI_DISPATCH_MS = 50
+GOLEM_STORE_DIR = os.path.join(AUTOSAVE_DIR, "golems")
+GOLEM_COMPRESS_LEVEL = 3
+GOLEM_MMAP_MIN_MB = 256
+TRAIN_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+FEATURE_CACHE_BYTES = 1024 * 1024 * 1024
+INCREMENTAL_DIR = os.path.join(AUTOSAVE_DIR, "incremental")
+INCREMENTAL_PARAMS = {'loss': 'squared_error', 'penalty': 'l2', 'alpha': 1e-4, 'learning_rate': 'invscaling', 'eta0': 0.01, 'random_state': 42}
+INCREMENTAL_CHUNK_ROWS = 50_000
+INCREMENTAL_HOLDOUT = 0.1
+INCREMENTAL_WINDOW_ROWS = 50_000
+INCREMENTAL_CHECKPOINT_ROWS = 1_000_000
+INCREMENTAL_LABEL = "🌱 Incremental (SGD)"
+TRAIN_POLL_MS = 300
+AUTOML_N_CANDIDATES = 24
+AUTOML_ETA = 3
+AUTOML_MIN_ROWS = 500
+AUTOML_TOP_K = 3
+AUTOML_POLL_MS = 500
+AUTOML_TEST_FRACTION = 0.2
+# Floresta adaptativa: cresce de ADAPTIVE_FOREST_STEP em ADAPTIVE_FOREST_STEP árvores (warm_start) até o erro OOB
+# parar de cair mais que ADAPTIVE_FOREST_TOL (relativo) por ADAPTIVE_FOREST_PATIENCE incrementos seguidos
+ADAPTIVE_FOREST_STEP = 25
+ADAPTIVE_FOREST_MAX = 500
+ADAPTIVE_FOREST_TOL = 0.002
+ADAPTIVE_FOREST_PATIENCE = 2
+ADAPTIVE_FOREST_KEYS = ('n_estimators_step', 'max_estimators', 'oob_tol', 'patience')
+# Detalhes de treino que vão do resultado da forja para o registro do Golem (e para o índice do estábulo)
+TRAINING_RESULT_KEYS = ('iterations', 'n_estimators', 'oob_curve')
+# Tipos de Golem oferecidos em "Forjar Golem": rótulo + hiperparâmetros padrão
+GOLEM_TYPES = {
+    'RandomForest': ("🌲 Floresta Aleatória", {'n_estimators': 100, 'random_state': 42}),
+    'AdaptiveForest': ("🌳 Floresta Adaptativa (OOB)", {'n_estimators_step': ADAPTIVE_FOREST_STEP, 'max_estimators': ADAPTIVE_FOREST_MAX,
+                                                        'oob_tol': ADAPTIVE_FOREST_TOL, 'patience': ADAPTIVE_FOREST_PATIENCE, 'random_state': 42}),
+    # Binning em histograma: NaN tratado nativamente, parada antecipada numa validação interna e
+    # todos os núcleos via OpenMP; escala para milhões de linhas com pouca memória
+    'HistGradientBoosting': ("📊 Gradient Boosting (histograma)", {'max_iter': 500, 'early_stopping': True, 'validation_fraction': 0.1,
+                                                                   'n_iter_no_change': 20, 'random_state': 42}),
+}
+AUTOML_SEARCH_SPACE = {
+    'RandomForest': {'n_estimators': [50, 100, 200], 'max_depth': [None, 8, 16], 'min_samples_leaf': [1, 3, 10], 'max_features': [1.0, 0.5, 'sqrt']},
+    'ExtraTrees': {'n_estimators': [100, 200], 'max_depth': [None, 12], 'min_samples_leaf': [1, 5], 'max_features': [1.0, 0.5]},
+    'HistGradientBoosting': {'learning_rate': [0.03, 0.1, 0.3], 'max_leaf_nodes': [15, 31, 63], 'l2_regularization': [0.0, 1.0], 'max_iter': [200, 500]},
+    'Ridge': {'alpha': [0.1, 1.0, 10.0, 100.0]},
+    'KNN': {'n_neighbors': [5, 15, 30], 'weights': ['uniform', 'distance']}
+}
+STATS_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+STATS_BLOCK_BYTES = 256 * 1024 * 1024
+CORR_BLOCK_COLS = 128
+CORR_TOP_K = 25
+CORR_HEATMAP_MAX_COLS = 40
+CORR_BLOCK_CACHE_BYTES = 1024 * 1024 * 1024
+DANGER_CHUNK_ROWS = 500_000
+DANGER_SAMPLE_ROWS = 100_000
+DANGER_WORST_N = 10
+DANGER_SENTINELS = (-999, -9999, 9999, 99999, 999999)
+DANGER_ROBUST_Z = 3.5
+DANGER_NEAR_CONSTANT = 0.99
+DANGER_ZERO_SPIKE = 0.3
+# Hashes de linha vão para disco em partições (hash % N); cada partição é contada sozinha, então a
+# memória da contagem de duplicatas é ~16 bytes * linhas / DANGER_HASH_PARTITIONS
+DANGER_HASH_PARTITIONS = 256
+SCATTER_MAX_POINTS = 50_000
+SCATTER_BINS = 200
+SCATTER_STRATA = 64
+SCATTER_CACHE_ENTRIES = 32
+SCATTER_MODES = {'auto': "🤖 Automático", 'density': "🌡️ Densidade", 'sample': "🎲 Amostra estratificada"}
+BACKGROUND_PIXEL_SIZE = 16
+BACKGROUND_BASE_COLOR = "#2F2F2F"
+BACKGROUND_BLOCK_COLORS = ("#3A3A3A", "#4A4A4A", "#2F2F2F", "#363636")
+BACKGROUND_BLOCK_DENSITY = 0.15
+GRID_VISIBLE_ROWS = 20
+GRID_MAX_COLUMNS = 12
+GRID_CELL_CHARS = 24
+DESCRIBE_COLUMNS = ['count', 'mean', 'std', 'min', 'q25', 'q50', 'q75', 'max']
+DESCRIBE_LABELS = {'q25': '25%', 'q50': '50%', 'q75': '75%'}
+STATS_TAB_BLOCOS, STATS_TAB_CONEXOES, STATS_TAB_PADROES, STATS_TAB_PERIGOS, STATS_TAB_CRISTAIS = range(5)
+TRAIN_STATUS_LABELS = {
+    'queued': "⏳ Na fila",
+    'running': "🔥 Forjando",
+    'done': "✅ Pronto",
+    'cancelled': "🛑 Cancelado",
+    'error': "❌ Erro"
+}
+
+
+def _iter_csv_chunks(path, chunk_rows, **read_kwargs):
+    total = max(os.path.getsize(path), 1)
+    with open(path, 'rb') as fh:
+        for chunk in pd.read_csv(fh, chunksize=chunk_rows, **read_kwargs):
+            yield chunk, min(fh.tell() / total, 1.0)
+
+
+def _iter_json_lines_chunks(path, chunk_rows):
+    total = max(os.path.getsize(path), 1)
+    with open(path, 'rb') as fh:
+        for chunk in pd.read_json(fh, lines=True, chunksize=chunk_rows):
+            yield chunk, min(fh.tell() / total, 1.0)
+
+
+def _iter_parquet_chunks(path, chunk_rows, columns=None, predicates=None, scan_report=None):
+    import pyarrow.parquet as pq
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    # Row groups cujas estatísticas (min/max) excluem algum predicado nem são lidos do disco
+    positions = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+    row_groups = [i for i in range(metadata.num_row_groups)
+                  if _row_group_may_match(metadata.row_group(i), predicates or (), positions)]
+    if scan_report is not None:
+        scan_report['row_groups'] = metadata.num_row_groups
+        scan_report['row_groups_skipped'] = metadata.num_row_groups - len(row_groups)
+    if not row_groups:
+        return
+    total_rows = max(sum(metadata.row_group(i).num_rows for i in row_groups), 1)
+    rows_read = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows, row_groups=row_groups, columns=columns):
+        rows_read += batch.num_rows
+        yield batch.to_pandas(), min(rows_read / total_rows, 1.0)
+
+
+def _coerce_like(value, sample):
+    # Converte o valor digitado para o tipo das estatísticas do row group
+    if isinstance(sample, bool):
+        return str(value).strip().lower() in ('1', 'true', 'sim')
+    if isinstance(sample, (int, float)):
+        return float(value)
+    if isinstance(sample, datetime.datetime):
+        return pd.Timestamp(value)
+    if isinstance(sample, bytes):
+        return str(value).encode()
+    return str(value)
+
+
+def _row_group_may_match(row_group, predicates, positions):
+    # Falso só quando min/max provam que nenhuma linha passa; na dúvida o row group é lido
+    for column, op, value in predicates:
+        position = positions.get(column)
+        if position is None:
+            continue
+        stats = row_group.column(position).statistics
+        if stats is None or not stats.has_min_max:
+            continue
+        try:
+            low, high = stats.min, stats.max
+            target = _coerce_like(value, low)
+            if op == '==' and not (low <= target <= high):
+                return False
+            if op == '!=' and low == high == target:
+                return False
+            if (op == '<' and not low < target) or (op == '<=' and not low <= target):
+                return False
+            if (op == '>' and not high > target) or (op == '>=' and not high >= target):
+                return False
+        except (TypeError, ValueError):
+            continue
+    return True
+
+
+def coerce_predicate_value(value, dtype):
+    if pd.api.types.is_bool_dtype(dtype):
+        return str(value).strip().lower() in ('1', 'true', 'sim')
+    if pd.api.types.is_numeric_dtype(dtype):
+        return float(value)
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return pd.Timestamp(value)
+    return str(value)
+
+
+def apply_predicates(df, predicates):
+    # Predicados (coluna, operador, valor-texto) combinados com E; nulos nunca passam
+    if not predicates or df.empty:
+        return df
+    mask = np.ones(len(df), dtype=bool)
+    for column, op, value in predicates:
+        series = df[column]
+        matched = PREDICATE_OPS[op](series, coerce_predicate_value(value, series.dtype))
+        mask &= matched.fillna(False).to_numpy(dtype=bool) & series.notna().to_numpy()
+    return df if mask.all() else df.loc[mask]
+
+
+def parse_predicate(text):
+    # "profundidade>=10" -> ('profundidade', '>=', '10'); operadores de dois caracteres primeiro.
+    # Nome de coluna com caractere de operador ("a=>3" viraria a coluna 'a=') é recusado
+    operator_chars = set("".join(PREDICATE_OPS))
+    for op in sorted(PREDICATE_OPS, key=len, reverse=True):
+        column, found, value = text.partition(op)
+        if found and column.strip() and not operator_chars & set(column):
+            return column.strip(), op, value.strip()
+    raise ValueError(f"Filtro inválido: {text!r} (use coluna<op>valor, com op em {', '.join(PREDICATE_OPS)})")
+
+
+def check_pushdown_columns(path, schema, columns=None, predicates=None):
+    # Colunas e filtros conferidos contra o esquema antes de minerar, com erro legível em vez de KeyError
+    known = [column for column, _ in schema['columns']]
+    missing_columns = [column for column in columns or () if column not in known]
+    missing_filters = [column for column, _, _ in predicates or () if column not in known]
+    if missing_columns or missing_filters:
+        problems = []
+        if missing_columns:
+            problems.append(f"colunas inexistentes: {', '.join(map(repr, missing_columns))}")
+        if missing_filters:
+            problems.append(f"filtros em colunas inexistentes: {', '.join(map(repr, missing_filters))}")
+        raise ValueError(f"{os.path.basename(path)}: {'; '.join(problems)} (colunas do bloco: {', '.join(map(str, known))})")
+
+
+def read_file_schema(path, sample_rows=SCHEMA_SAMPLE_ROWS):
+    # Esquema antes da mineração: rodapé do Parquet (sem ler dados) ou cabeçalho + amostra inferida
+    file_ext = os.path.splitext(path)[1].lower()
+    if file_ext == '.parquet':
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        return {'columns': [(field.name, str(field.type)) for field in parquet_file.schema_arrow],
+                'rows': parquet_file.metadata.num_rows, 'row_groups': parquet_file.metadata.num_row_groups,
+                'sampled': False}
+    if file_ext == '.csv':
+        sample = pd.read_csv(path, nrows=sample_rows)
+    else:
+        sample = next(iter_file_chunks(path, sample_rows), (pd.DataFrame(), 1.0))[0].head(sample_rows)
+    return {'columns': [(column, str(dtype)) for column, dtype in sample.dtypes.items()],
+            'rows': None, 'row_groups': None, 'sampled': True}
+
+
+def iter_file_chunks(path, chunk_rows=INGEST_CHUNK_ROWS, columns=None, predicates=None, scan_report=None):
+    # Gera (chunk, fração lida) para qualquer formato suportado.
+    # Excel e JSON "inteiro" não têm leitura parcial: chegam em um único chunk.
+    # columns/predicates descem até o leitor quando o formato permite (usecols no CSV,
+    # colunas + poda de row groups no Parquet); o resto é filtrado chunk a chunk.
+    file_ext = os.path.splitext(path)[1].lower()
+    predicates = list(predicates or ())
+    read_columns = None
+    if columns is not None:
+        read_columns = list(columns) + [c for c, _, _ in predicates if c not in columns]
+        read_columns = list(dict.fromkeys(read_columns))
+    if file_ext == '.csv':
+        source = _iter_csv_chunks(path, chunk_rows, usecols=read_columns)
+    elif file_ext in ['.jsonl', '.ndjson']:
+        source = _iter_json_lines_chunks(path, chunk_rows)
+    elif file_ext == '.parquet':
+        source = _iter_parquet_chunks(path, chunk_rows, read_columns, predicates, scan_report)
+    elif file_ext in ['.xlsx', '.xls']:
+        source = iter([(pd.read_excel(path, usecols=read_columns), 1.0)])
+    elif file_ext == '.json':
+        source = iter([(pd.read_json(path), 1.0)])
+    else:
+        raise ValueError(f"Formato de bloco não suportado: {file_ext}")
+    if columns is None and not predicates:
+        yield from source
+        return
+    for chunk, fraction in source:
+        if scan_report is not None:
+            scan_report['rows_scanned'] = scan_report.get('rows_scanned', 0) + len(chunk)
+        chunk = apply_predicates(chunk, predicates)
+        if columns is not None:
+            chunk = chunk[list(columns)]
+        yield chunk, fraction
+
+
+def resolve_shards(source, pattern="*"):
+    # Diretório (+ padrão) ou glob direto -> arquivos suportados, em ordem estável
+    if os.path.isdir(source):
+        source = os.path.join(source, pattern)
+    return sorted(path for path in glob.glob(source, recursive=True)
+                  if os.path.isfile(path) and os.path.splitext(path)[1].lower() in SUPPORTED_EXTENSIONS)
+
+
+def read_shard_table(path):
+    # Cada shard vira uma tabela Arrow; Parquet e CSV usam os leitores nativos (multithread, sem pandas no meio)
+    import pyarrow as pa
+    file_ext = os.path.splitext(path)[1].lower()
+    if file_ext == '.parquet':
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    elif file_ext == '.csv':
+        import pyarrow.csv as pa_csv
+        table = pa_csv.read_csv(path)
+    else:
+        chunks = [chunk for chunk, _ in iter_file_chunks(path)]
+        table = pa.Table.from_pandas(pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(), preserve_index=False)
+    # Datas puras (o CSV infere date32) viram timestamp para combinar com shards Parquet/pandas
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.timestamp('us')))
+    return table
+
+
+def check_shard_schema(reference_path, reference, path, table):
+    import pyarrow as pa
+    expected, found = set(reference.schema.names), set(table.schema.names)
+    if expected != found:
+        missing, extra = sorted(map(str, expected - found)), sorted(map(str, found - expected))
+        raise ValueError(f"Shard {os.path.basename(path)} incompatível com {os.path.basename(reference_path)}: "
+                         f"faltam {missing or '—'}, sobram {extra or '—'}")
+    try:
+        pa.unify_schemas([reference.schema, table.schema], promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise ValueError(f"Shard {os.path.basename(path)} com tipos incompatíveis: {e}")
+
+
+def read_shards(paths, on_shard=None, cancel_event=None, max_workers=None):
+    # Shards lidos em paralelo; o esquema de cada um é conferido assim que chega, antes de juntar.
+    # Devolve as tabelas na ordem de `paths`, ou None se cancel_event for acionado no meio.
+    def read(path):
+        start_time = time.perf_counter()
+        table = read_shard_table(path)
+        return table, time.perf_counter() - start_time
+    
+    tables = {}
+    reference = None
+    with ThreadPoolExecutor(max_workers=max_workers or min(INGEST_SHARD_WORKERS, len(paths)), thread_name_prefix="shard") as pool:
+        pending = {pool.submit(read, path): path for path in paths}
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                if cancel_event is not None and cancel_event.is_set():
+                    tables.clear()
+                    return None
+                for future in done:
+                    path = pending.pop(future)
+                    table, seconds = future.result()
+                    if reference is None:
+                        reference = (path, table)
+                    check_shard_schema(reference[0], reference[1], path, table)
+                    tables[path] = table
+                    if on_shard is not None:
+                        on_shard(path, table, seconds, len(tables))
+        finally:
+            for future in pending:
+                future.cancel()
+    return [tables.pop(path) for path in paths]
+
+
+def concat_shard_tables(tables):
+    # Junta as tabelas Arrow sem copiar (só referencia os chunks) e converte para pandas uma única vez
+    import pyarrow as pa
+    table = pa.concat_tables(tables, promote_options='permissive')
+    tables.clear()
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def profile_dataframe(df):
+    # Varredura única e cara (memory_usage deep=True) — deve rodar uma vez por versão do dataset
+    rows, cols = df.shape
+    null_by_column = df.isnull().sum()
+    null_count = int(null_by_column.sum())
+    memory_by_column = df.memory_usage(deep=True, index=False)
+    dtype_counts = df.dtypes.astype(str).value_counts()
+    return {
+        'rows': rows,
+        'cols': cols,
+        'null_count': null_count,
+        'null_pct': (null_count / (rows * cols)) * 100 if (rows * cols) > 0 else 0.0,
+        'null_by_column': {col: int(count) for col, count in null_by_column.items()},
+        'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'dtype_counts': dtype_counts.to_dict(),
+        'main_dtype': dtype_counts.index[0] if not dtype_counts.empty else "N/A",
+        'numeric_cols': df.select_dtypes(include=[np.number]).columns.tolist(),
+        'categorical_cols': df.select_dtypes(include=['object', 'category', 'string']).columns.tolist(),
+        'memory_by_column': {col: int(size) for col, size in memory_by_column.items()},
+        'memory_bytes': int(df.memory_usage(deep=True).sum()),
+        'profiled_at': datetime.datetime.now()
+    }
+
+
+def _smallest_int_dtype(low, high, nullable=False):
+    # Sem negativos também vale o unsigned da mesma largura (uint8 com 200 não precisa virar int16)
+    for dtype in (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32, np.int64, np.uint64):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return pd.api.types.pandas_dtype(dtype.__name__.replace('uint', 'UInt').replace('int', 'Int')) if nullable else np.dtype(dtype)
+    return None
+
+
+def compact_series(series, category_ratio=COMPACT_CATEGORY_RATIO, category_max=COMPACT_CATEGORY_MAX):
+    # Só conversões sem perda: todo valor volta idêntico ao ser lido como float64/objeto
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype) or series.empty:
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        if series.isna().all():
+            return series
+        target = _smallest_int_dtype(series.min(), series.max(), nullable=isinstance(dtype, pd.api.extensions.ExtensionDtype))
+        # Só estreita: um tipo de mesma largura (ou maior) não economiza nada
+        return series.astype(target) if target is not None and target.itemsize < dtype.itemsize else series
+    if pd.api.types.is_float_dtype(dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = values[~np.isnan(values)]
+        if len(present) and np.all(np.isfinite(present)) and np.all(present == np.round(present)):
+            target = _smallest_int_dtype(present.min(), present.max(), nullable=len(present) < len(values))
+            if target is not None:
+                return series.astype(target)
+        as_float32 = values.astype(np.float32)
+        if dtype != np.float32 and np.array_equal(as_float32.astype(np.float64), values, equal_nan=True):
+            return pd.Series(as_float32, index=series.index, name=series.name)
+        return series
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        if series.nunique(dropna=True) <= min(category_ratio * len(series), category_max):
+            return series.astype('category')
+        if pd.api.types.is_object_dtype(dtype) and pd.api.types.infer_dtype(series, skipna=True) == 'string':
+            try:
+                return series.astype(pd.StringDtype('pyarrow'))
+            except ImportError:
+                return series
+    return series
+
+
+def compact_dataframe(df, category_ratio=COMPACT_CATEGORY_RATIO, category_max=COMPACT_CATEGORY_MAX):
+    # Devolve (df compactado, relatório por coluna com dtype e bytes antes/depois)
+    compacted = df.copy(deep=False)
+    rows = []
+    for col in df.columns:
+        before = df[col]
+        after = compact_series(before, category_ratio, category_max)
+        if after is not before:
+            compacted[col] = after
+        bytes_before = int(before.memory_usage(deep=True, index=False))
+        bytes_after = int(after.memory_usage(deep=True, index=False))
+        rows.append((col, str(before.dtype), str(after.dtype), bytes_before, bytes_after))
+    report = pd.DataFrame(rows, columns=['column', 'dtype_before', 'dtype_after', 'bytes_before', 'bytes_after']).set_index('column')
+    report['ratio'] = report['bytes_before'] / report['bytes_after'].clip(lower=1)
+    return compacted, report
+
+
+class DatasetProfileCache:
+    # Perfis por dataset, válidos enquanto o objeto e a versão do dataset não mudarem
+    def __init__(self):
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def put(self, name, df, version, profile=None):
+        if profile is None:
+            profile = profile_dataframe(df)
+        with self._lock:
+            self._profiles[name] = ((id(df), version), profile)
+        return profile
+
+    def get(self, name, df, version):
+        with self._lock:
+            cached = self._profiles.get(name)
+        if cached and cached[0] == (id(df), version):
+            return cached[1]
+        return self.put(name, df, version)
+
+    def invalidate(self, name):
+        with self._lock:
+            self._profiles.pop(name, None)
+
+
+def numeric_block(df, columns, dtype=np.float64, copy=False):
+    # Bloco 2D (linhas x colunas) com NaN no lugar de nulos, inclusive para dtypes anuláveis.
+    # Sem copy=True o resultado pode ser uma view somente-leitura dos dados do DataFrame.
+    return df[columns].to_numpy(dtype=dtype, na_value=np.nan, copy=copy)
+
+
+def _sorted_quantiles(sorted_block, counts, quantiles):
+    # Quantis exatos (interpolação linear, como pandas) lidos do bloco já ordenado; NaN fica no fim de cada linha
+    n_cols = sorted_block.shape[0]
+    result = np.full((len(quantiles), n_cols), np.nan)
+    valid = counts > 0
+    if not valid.any():
+        return result
+    positions = np.outer(quantiles, np.maximum(counts - 1, 0))
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.ceil(positions).astype(np.int64)
+    rows = np.arange(n_cols)
+    low_values = sorted_block[rows, lower]
+    high_values = sorted_block[rows, upper]
+    result[:, valid] = (low_values + (high_values - low_values) * (positions - lower))[:, valid]
+    return result
+
+
+def compute_column_stats(df, columns=None, quantiles=STATS_QUANTILES, block_bytes=STATS_BLOCK_BYTES):
+    # Motor estatístico: cada bloco de colunas é materializado uma vez como array NumPy (colunas x linhas,
+    # contíguo por coluna) e todas as métricas — contagem, nulos, média, variância, min/max, assimetria,
+    # curtose e quantis — saem de reduções vetorizadas sobre ele
+    start_time = time.perf_counter()
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    n_rows = len(df)
+    block_width = max(1, int(block_bytes // max(n_rows * 8, 1)))
+    quantiles = np.asarray(quantiles)
+    rows = []
+    for start in range(0, len(columns), block_width):
+        block_cols = columns[start:start + block_width]
+        XT = np.ascontiguousarray(numeric_block(df, block_cols, copy=True).T)
+        mask = ~np.isnan(XT)
+        n = mask.sum(axis=1).astype(np.float64)
+        zeros = np.count_nonzero(XT == 0, axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            deviations = np.where(mask, XT, 0.0)
+            mean = deviations.sum(axis=1) / n
+            np.subtract(deviations, mean[:, None], out=deviations)
+            deviations[~mask] = 0.0
+            dev2 = deviations * deviations
+            m2 = dev2.sum(axis=1)
+            m3 = np.einsum('ij,ij->i', dev2, deviations)
+            m4 = np.einsum('ij,ij->i', dev2, dev2)
+            del deviations, dev2, mask
+            var = np.where(n > 1, m2 / (n - 1), np.nan)
+            skew = np.where(n > 2, np.where(m2 == 0, 0.0, n * np.sqrt(n - 1) / (n - 2) * m3 / m2 ** 1.5), np.nan)
+            kurt = np.where(n > 3, np.where(m2 == 0, 0.0, n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2) - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))), np.nan)
+        counts = n.astype(np.int64)
+        if n_rows:
+            # Ordenar cada coluna contígua é mais rápido que np.partition com vários kth, e já entrega min/max
+            XT.sort(axis=1)
+            quantile_values = _sorted_quantiles(XT, counts, quantiles)
+            col_min = XT[:, 0]
+            col_max = XT[np.arange(len(block_cols)), np.maximum(counts - 1, 0)]
+        else:
+            # Bloco sem linhas (filtro que não casou nada, arquivo vazio): nada a ordenar, tudo NaN
+            quantile_values = np.full((len(quantiles), len(block_cols)), np.nan)
+            col_min = col_max = np.full(len(block_cols), np.nan)
+        for j, col in enumerate(block_cols):
+            has_values = counts[j] > 0
+            row = {
+                'column': col,
+                'count': int(counts[j]),
+                'nulls': int(n_rows - counts[j]),
+                'null_pct': (n_rows - counts[j]) / n_rows * 100 if n_rows else 0.0,
+                'mean': mean[j],
+                'std': np.sqrt(var[j]),
+                'var': var[j],
+                'min': col_min[j] if has_values else np.nan,
+                'max': col_max[j] if has_values else np.nan,
+                'skew': skew[j],
+                'kurt': kurt[j],
+                'zeros': int(zeros[j])
+            }
+            for q, value in zip(quantiles, quantile_values[:, j]):
+                row[f"q{int(round(q * 100)):02d}"] = value
+            rows.append(row)
+        del XT
+    table = pd.DataFrame(rows).set_index('column') if rows else pd.DataFrame()
+    return {'table': table, 'rows': n_rows, 'quantiles': tuple(quantiles), 'elapsed': time.perf_counter() - start_time}
+
+
+class ReservoirSample:
+    # Amostra uniforme de tamanho fixo montada chunk a chunk (bottom-k de chaves aleatórias);
+    # o índice da amostra guarda a posição global de cada linha
+    def __init__(self, size=APPROX_SAMPLE_ROWS, random_state=42):
+        self.size = size
+        self.rng = np.random.default_rng(random_state)
+        self.rows_seen = 0
+        self.keys = np.empty(0)
+        self.frame = None
+    
+    def add(self, chunk):
+        keys = self.rng.random(len(chunk))
+        positions = np.arange(self.rows_seen, self.rows_seen + len(chunk))
+        self.rows_seen += len(chunk)
+        if self.frame is not None and len(self.keys) >= self.size:
+            # Reservatório cheio: só entram linhas com chave abaixo da maior mantida
+            candidates = keys < self.keys.max()
+            keys, positions, chunk = keys[candidates], positions[candidates], chunk.iloc[np.flatnonzero(candidates)]
+        if not len(keys):
+            return
+        chunk = chunk.set_axis(positions)
+        frame = chunk if self.frame is None else pd.concat([self.frame, chunk])
+        keys = np.concatenate([self.keys, keys])
+        if len(keys) > self.size:
+            keep = np.sort(np.argpartition(keys, self.size - 1)[:self.size])
+            frame, keys = frame.iloc[keep], keys[keep]
+        self.frame, self.keys = frame, keys
+    
+    def result(self):
+        return self.frame.sort_index() if self.frame is not None else None
+
+
+def sample_dataframe(df, size=APPROX_SAMPLE_ROWS, random_state=42):
+    # Mesma forma da amostra de ingestão, para blocos que não passaram pelo ReservoirSample
+    if len(df) <= size:
+        return df
+    positions = np.sort(np.random.default_rng(random_state).choice(len(df), size, replace=False))
+    return df.iloc[positions]
+
+
+def align_dtypes(sample, df):
+    # A amostra da ingestão nasce dos chunks crus; depois da compactação ela recebe os mesmos dtypes
+    # do bloco (category, inteiros estreitos), para o modo aproximado e o exato verem os mesmos tipos
+    changed = {col: dtype for col, dtype in df.dtypes.items() if col in sample.columns and sample[col].dtype != dtype}
+    return sample.astype(changed) if changed else sample
+
+
+def approximate_column_stats(sample, population_rows, columns=None, quantiles=STATS_QUANTILES, z=APPROX_Z):
+    # Estatísticas da amostra + meia-largura do intervalo de confiança (coluna <métrica>_ci).
+    # Média e nulos: aproximação normal com correção de população finita; desvio: sd/sqrt(2(n-1));
+    # quantis: postos de estatística de ordem n*q +- z*sqrt(n*q*(1-q)) na coluna ordenada.
+    start_time = time.perf_counter()
+    stats = compute_column_stats(sample, columns, quantiles)
+    table = stats['table']
+    n_sample = len(sample)
+    if not table.empty and n_sample:
+        fpc = np.sqrt(max(0.0, 1 - n_sample / max(population_rows, 1)))
+        scale = population_rows / n_sample
+        counts = table['count'].to_numpy(dtype=np.float64)
+        share = counts / n_sample
+        with np.errstate(invalid='ignore', divide='ignore'):
+            table['count_ci'] = z * np.sqrt(share * (1 - share) / n_sample) * fpc * population_rows
+            table['null_pct_ci'] = table['count_ci'] / population_rows * 100
+            table['mean_ci'] = z * table['std'] / np.sqrt(counts) * fpc
+            table['std_ci'] = z * table['std'] / np.sqrt(2 * np.maximum(counts - 1, 1))
+        table['count'] = np.rint(counts * scale).astype(np.int64)
+        table['nulls'] = population_rows - table['count']
+        table['null_pct'] = table['nulls'] / population_rows * 100
+        table['zeros'] = np.rint(table['zeros'].to_numpy() * scale).astype(np.int64)
+        for col, n in zip(table.index, counts.astype(np.int64)):
+            values = np.sort(sample[col].to_numpy(dtype=np.float64, na_value=np.nan))[:n]
+            for q in quantiles:
+                name = f"q{int(round(q * 100)):02d}"
+                if n < 2:
+                    table.at[col, f"{name}_ci"] = np.nan
+                    continue
+                half = z * np.sqrt(n * q * (1 - q))
+                low, high = values[max(int(np.floor(n * q - half)), 0)], values[min(int(np.ceil(n * q + half)), n - 1)]
+                table.at[col, f"{name}_ci"] = (high - low) / 2
+    return {'table': table, 'rows': population_rows, 'quantiles': stats['quantiles'], 'approximate': True,
+            'sample_rows': n_sample, 'confidence': APPROX_CONFIDENCE, 'elapsed': time.perf_counter() - start_time}
+
+
+def correlation_interval(r, n, z=APPROX_Z):
+    # Intervalo de Fisher para r estimado em n linhas
+    if n <= 3 or not np.isfinite(r):
+        return (np.nan, np.nan)
+    center = np.arctanh(np.clip(r, -0.999999, 0.999999))
+    half = z / np.sqrt(n - 3)
+    return (float(np.tanh(center - half)), float(np.tanh(center + half)))
+
+
+def _prepare_correlation_block(df, columns, method):
+    X = numeric_block(df, columns, copy=True)
+    if method == 'spearman':
+        X = pd.DataFrame(X).rank(method='average').to_numpy(copy=True)
+    mask = ~np.isnan(X)
+    has_nulls = not mask.all()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(mask, X, 0.0).sum(axis=0) / mask.sum(axis=0)
+        np.subtract(X, mean, out=X)
+        if has_nulls:
+            X[~mask] = 0.0
+        # Correlação é invariante à escala: normalizar só evita overflow e deixa o caso sem nulos num único matmul
+        norms = np.sqrt(np.einsum('ij,ij->j', X, X))
+        X /= np.where(norms > 0, norms, np.nan)
+    return {'X': X, 'M': mask.astype(X.dtype) if has_nulls else None}
+
+
+def _correlate_blocks(a, b):
+    Xa, Xb = a['X'], b['X']
+    if a['M'] is None and b['M'] is None:
+        return Xa.T @ Xb
+    # Nulos tratados par a par (pairwise-complete) com somas mascaradas, sem copiar o DataFrame
+    Ma = a['M'] if a['M'] is not None else np.ones_like(Xa)
+    Mb = b['M'] if b['M'] is not None else np.ones_like(Xb)
+    n = Ma.T @ Mb
+    sum_a = Xa.T @ Mb
+    sum_b = Ma.T @ Xb
+    sum_aa = (Xa * Xa).T @ Mb
+    sum_bb = Ma.T @ (Xb * Xb)
+    sum_ab = Xa.T @ Xb
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = (n * sum_ab - sum_a * sum_b) / np.sqrt((n * sum_aa - sum_a ** 2) * (n * sum_bb - sum_b ** 2))
+    r[n < 3] = np.nan
+    return r
+
+
+def compute_correlation(df, columns, method='pearson', block_cols=CORR_BLOCK_COLS, top_k=CORR_TOP_K,
+                        max_workers=None, cache_bytes=CORR_BLOCK_CACHE_BYTES):
+    # Matriz de correlação em blocos de colunas; cada par de blocos vira um job de matmul em threads
+    start_time = time.perf_counter()
+    columns = list(columns)
+    n_cols = len(columns)
+    blocks = [columns[start:start + block_cols] for start in range(0, n_cols, block_cols)]
+    offsets = np.cumsum([0] + [len(block) for block in blocks])
+    keep_prepared = len(df) * n_cols * 8 * 2 <= cache_bytes
+    prepared = {}
+    prepared_lock = threading.Lock()
+    
+    def get_block(i):
+        with prepared_lock:
+            if i in prepared:
+                return prepared[i]
+        block = _prepare_correlation_block(df, blocks[i], method)
+        if keep_prepared:
+            with prepared_lock:
+                prepared.setdefault(i, block)
+        return block
+    
+    matrix = np.full((n_cols, n_cols), np.nan)
+    
+    def fill(i, j):
+        r = _correlate_blocks(get_block(i), get_block(j))
+        np.clip(r, -1.0, 1.0, out=r)
+        matrix[offsets[i]:offsets[i + 1], offsets[j]:offsets[j + 1]] = r
+        matrix[offsets[j]:offsets[j + 1], offsets[i]:offsets[i + 1]] = r.T
+    
+    pairs = [(i, j) for i in range(len(blocks)) for j in range(i, len(blocks))]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1, thread_name_prefix="corr") as executor:
+        list(executor.map(lambda pair: fill(*pair), pairs))
+    prepared.clear()
+    
+    top_pairs = []
+    if n_cols > 1:
+        upper_i, upper_j = np.triu_indices(n_cols, 1)
+        strength = np.abs(matrix[upper_i, upper_j])
+        strength = np.where(np.isnan(strength), -1.0, strength)
+        k = min(top_k, len(strength))
+        best = np.argpartition(-strength, k - 1)[:k]
+        best = best[np.argsort(-strength[best])]
+        top_pairs = [(columns[upper_i[p]], columns[upper_j[p]], float(matrix[upper_i[p], upper_j[p]])) for p in best if strength[p] >= 0]
+    return {'columns': columns, 'matrix': matrix, 'method': method, 'top_pairs': top_pairs, 'elapsed': time.perf_counter() - start_time}
+
+
+def clustered_heatmap_columns(correlation, max_cols=CORR_HEATMAP_MAX_COLS):
+    # Escolhe as colunas mais conectadas e as ordena por clusterização hierárquica (distância 1 - |r|)
+    from scipy.cluster.hierarchy import linkage, leaves_list
+    from scipy.spatial.distance import squareform
+    columns = correlation['columns']
+    index = {col: i for i, col in enumerate(columns)}
+    chosen = []
+    for a, b, _ in correlation['top_pairs']:
+        for col in (a, b):
+            if col not in chosen and len(chosen) < max_cols:
+                chosen.append(col)
+    if len(chosen) < min(max_cols, len(columns)):
+        strength = np.nanmean(np.abs(correlation['matrix']), axis=0)
+        for i in np.argsort(-np.nan_to_num(strength, nan=-1.0)):
+            if columns[i] not in chosen:
+                chosen.append(columns[i])
+            if len(chosen) >= max_cols:
+                break
+    positions = [index[col] for col in chosen]
+    sub = correlation['matrix'][np.ix_(positions, positions)]
+    if len(positions) > 2:
+        distance = 1.0 - np.abs(np.nan_to_num(sub, nan=0.0))
+        distance = (distance + distance.T) / 2
+        np.fill_diagonal(distance, 0.0)
+        order = leaves_list(linkage(squareform(np.clip(distance, 0.0, None), checks=False), method='average'))
+        positions = [positions[i] for i in order]
+        sub = correlation['matrix'][np.ix_(positions, positions)]
+    return [columns[i] for i in positions], sub
+
+
+def iter_frame_chunks(df, chunk_rows=DANGER_CHUNK_ROWS):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+class DuplicateCounter:
+    # Contagem de linhas duplicadas por hash de 64 bits (hash_pandas_object), com memória limitada: linhas
+    # distintas com o mesmo hash (chance ~n²/2⁶⁵) contariam como duplicata. (hash, linha) são gravados em
+    # partições no disco e, no fim, cada partição é ordenada e contada separadamente
+    RECORD = np.dtype([('hash', '<u8'), ('row', '<i8')])
+
+    def __init__(self, n_partitions=DANGER_HASH_PARTITIONS):
+        import tempfile
+        self.n_partitions = n_partitions
+        self._spill = tempfile.TemporaryDirectory(prefix="bmc_dups_")
+        self._written = set()
+
+    def _path(self, partition):
+        return os.path.join(self._spill.name, f"part_{partition:04d}.bin")
+
+    def add(self, chunk, row_offset):
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        records = np.empty(len(hashes), dtype=self.RECORD)
+        records['hash'] = hashes
+        records['row'] = np.arange(row_offset, row_offset + len(hashes))
+        partitions = hashes % np.uint64(self.n_partitions)
+        order = np.argsort(partitions, kind='stable')
+        bounds = np.searchsorted(partitions[order], np.arange(self.n_partitions + 1))
+        for partition in np.flatnonzero(np.diff(bounds)):
+            with open(self._path(partition), 'ab') as f:
+                records[order[bounds[partition]:bounds[partition + 1]]].tofile(f)
+            self._written.add(int(partition))
+
+    def finish(self, examples=DANGER_WORST_N):
+        # Primeira ocorrência de cada hash (menor linha) é a original; as demais contam como duplicatas
+        duplicates = 0
+        example_rows = np.empty(0, dtype=np.int64)
+        try:
+            for partition in sorted(self._written):
+                records = np.fromfile(self._path(partition), dtype=self.RECORD)
+                records = records[np.lexsort((records['row'], records['hash']))]
+                repeated = np.zeros(len(records), dtype=bool)
+                repeated[1:] = records['hash'][1:] == records['hash'][:-1]
+                duplicates += int(repeated.sum())
+                example_rows = np.sort(np.concatenate([example_rows, records['row'][repeated]]))[:examples]
+        finally:
+            self._spill.cleanup()
+        return duplicates, example_rows.tolist()
+
+
+def _merge_worst(scores, rows, new_scores, new_rows, worst_n):
+    # Mantém, por coluna, as worst_n linhas com maior |z robusto| (matrizes worst_n x colunas)
+    scores = np.concatenate([scores, new_scores])
+    rows = np.concatenate([rows, new_rows])
+    order = np.argsort(-scores, axis=0)[:worst_n]
+    return np.take_along_axis(scores, order, axis=0), np.take_along_axis(rows, order, axis=0)
+
+
+def scan_dangers(chunk_source, columns=None, sample_rows=DANGER_SAMPLE_ROWS, worst_n=DANGER_WORST_N,
+                 isolation_forest=False, random_state=42):
+    # Varredura de perigos em streaming: chunk_source() devolve um iterador novo de chunks (DataFrame),
+    # então o dataset nunca precisa caber inteiro na memória.
+    # Passe 1: contagens, sentinelas, hashes de linha (partições no disco) e uma amostra bottom-k para quartis/mediana/MAD.
+    # Passe 2: outliers IQR e z-robusto contra esses limites + as piores linhas por coluna.
+    # Duplicatas: contagem por hash de linha (64 bits), um passe O(linhas) sobre as partições, uma por vez.
+    start_time = time.perf_counter()
+    rng = np.random.default_rng(random_state)
+    n_rows = 0
+    totals = None
+    duplicates = DuplicateCounter()
+    sample_keys = np.empty(0)
+    sample_index = np.empty(0, dtype=np.int64)
+    sample_values = None
+    
+    for chunk in chunk_source():
+        if columns is None:
+            columns = chunk.select_dtypes(include=[np.number]).columns.tolist()
+        X = numeric_block(chunk, columns)
+        mask = ~np.isnan(X)
+        if totals is None:
+            totals = {name: np.zeros(len(columns), dtype=np.int64) for name in ('count', 'zeros', 'sentinels')}
+            totals['min'] = np.full(len(columns), np.inf)
+            totals['max'] = np.full(len(columns), -np.inf)
+            sample_values = np.empty((0, len(columns)))
+        totals['count'] += mask.sum(axis=0)
+        totals['zeros'] += (X == 0).sum(axis=0)
+        totals['sentinels'] += np.isin(X, DANGER_SENTINELS).sum(axis=0)
+        totals['min'] = np.minimum(totals['min'], np.where(mask, X, np.inf).min(axis=0, initial=np.inf))
+        totals['max'] = np.maximum(totals['max'], np.where(mask, X, -np.inf).max(axis=0, initial=-np.inf))
+        duplicates.add(chunk, n_rows)
+        
+        keys = np.concatenate([sample_keys, rng.random(len(X))])
+        index = np.concatenate([sample_index, np.arange(n_rows, n_rows + len(X))])
+        values = np.concatenate([sample_values, X])
+        if len(keys) > sample_rows:
+            keep = np.argpartition(keys, sample_rows - 1)[:sample_rows]
+            keys, index, values = keys[keep], index[keep], values[keep]
+        sample_keys, sample_index, sample_values = keys, index, values
+        n_rows += len(X)
+    
+    if totals is None or not columns:
+        duplicates.finish()
+        return {'rows': n_rows, 'columns': [], 'duplicates': 0, 'duplicate_examples': [], 'isolation': None,
+                'elapsed': time.perf_counter() - start_time}
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        q1, median, q3 = np.nanquantile(sample_values, [0.25, 0.5, 0.75], axis=0)
+        iqr = q3 - q1
+        low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        mad = np.nanmedian(np.abs(sample_values - median), axis=0)
+        # MAD zero (coluna quase constante): cai para o desvio absoluto médio, como no z-score modificado
+        mean_ad = np.nanmean(np.abs(sample_values - median), axis=0)
+        robust_scale = np.where(mad > 0, mad / 0.6745, mean_ad * 1.253314)
+    top_share = np.zeros(len(columns))
+    for j in range(len(columns)):
+        values = sample_values[:, j][~np.isnan(sample_values[:, j])]
+        if len(values):
+            top_share[j] = np.unique(values, return_counts=True)[1].max() / len(values)
+    
+    iqr_outliers = np.zeros(len(columns), dtype=np.int64)
+    robust_outliers = np.zeros(len(columns), dtype=np.int64)
+    worst_scores = np.full((0, len(columns)), -np.inf)
+    worst_rows = np.zeros((0, len(columns)), dtype=np.int64)
+    offset = 0
+    for chunk in chunk_source():
+        X = numeric_block(chunk, columns)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            iqr_outliers += ((X < low) | (X > high)).sum(axis=0)
+            z = np.abs(X - median) / robust_scale
+        z = np.where(np.isfinite(z), z, 0.0)
+        robust_outliers += (z > DANGER_ROBUST_Z).sum(axis=0)
+        take = min(worst_n, len(X))
+        if take:
+            top = np.argpartition(-z, take - 1, axis=0)[:take]
+            worst_scores, worst_rows = _merge_worst(worst_scores, worst_rows, np.take_along_axis(z, top, axis=0), top + offset, worst_n)
+        offset += len(X)
+    
+    duplicate_count, duplicate_examples = duplicates.finish(worst_n)
+    
+    report = []
+    for j, col in enumerate(columns):
+        count = int(totals['count'][j])
+        zero_share = totals['zeros'][j] / count if count else 0.0
+        worst = [int(row) for row, score in zip(worst_rows[:, j], worst_scores[:, j]) if score > DANGER_ROBUST_Z]
+        report.append({
+            'column': col,
+            'count': count,
+            'nulls': n_rows - count,
+            'iqr_outliers': int(iqr_outliers[j]),
+            'robust_outliers': int(robust_outliers[j]),
+            'constant': bool(count > 0 and totals['min'][j] == totals['max'][j]),
+            'near_constant': bool(top_share[j] >= DANGER_NEAR_CONSTANT),
+            'top_share': float(top_share[j]),
+            'sentinels': int(totals['sentinels'][j]),
+            'zero_spike': bool(zero_share >= DANGER_ZERO_SPIKE and totals['min'][j] != totals['max'][j]),
+            'zero_share': float(zero_share),
+            'worst_rows': worst
+        })
+    
+    isolation = None
+    if isolation_forest and len(sample_values):
+        from sklearn.ensemble import IsolationForest
+        filled = np.where(np.isnan(sample_values), median, sample_values)
+        forest = IsolationForest(n_estimators=200, n_jobs=-1, random_state=random_state).fit(filled)
+        scores = -forest.score_samples(filled)
+        worst = np.argsort(-scores)[:worst_n]
+        isolation = {
+            'sample_rows': len(filled),
+            'anomalies': int((forest.predict(filled) == -1).sum()),
+            'worst_rows': [int(sample_index[i]) for i in worst]
+        }
+    
+    return {
+        'rows': n_rows,
+        'columns': report,
+        'duplicates': duplicate_count,
+        'duplicate_examples': duplicate_examples,
+        'isolation': isolation,
+        'elapsed': time.perf_counter() - start_time
+    }
+
+
+def stratified_sample_xy(x, y, max_points=SCATTER_MAX_POINTS, strata=SCATTER_STRATA, random_state=42):
+    # Amostra estratificada numa grade strata x strata: cada célula mantém pelo menos um ponto,
+    # então regiões raras (outliers) continuam visíveis mesmo com milhões de linhas
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+    rng = np.random.default_rng(random_state)
+    xi = np.clip(((x - x.min()) / ((x.max() - x.min()) or 1.0) * strata).astype(np.int64), 0, strata - 1)
+    yi = np.clip(((y - y.min()) / ((y.max() - y.min()) or 1.0) * strata).astype(np.int64), 0, strata - 1)
+    cell = xi * strata + yi
+    order = np.lexsort((rng.random(n), cell))
+    sorted_cell = cell[order]
+    rank = np.arange(n) - np.searchsorted(sorted_cell, sorted_cell, side='left')
+    quota = np.maximum(1, np.ceil(np.bincount(cell, minlength=strata * strata) * max_points / n)).astype(np.int64)
+    return order[rank < quota[sorted_cell]]
+
+
+def render_scatter_png(df, x_col, y_col, mode='auto', max_points=SCATTER_MAX_POINTS, bins=SCATTER_BINS):
+    # Renderiza fora da tela (Figure + Agg, sem pyplot) para poder rodar num worker;
+    # devolve o PNG pronto e uma descrição de como os pontos foram desenhados
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    xy = numeric_block(df, [x_col, y_col])
+    xy = xy[~np.isnan(xy).any(axis=1)]
+    x, y = xy[:, 0], xy[:, 1]
+    if mode == 'auto':
+        mode = 'points' if len(x) <= max_points else 'density'
+    
+    fig = Figure(figsize=(10, 6), dpi=100, facecolor='#3A3A3A')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.set_facecolor('#2F2F2F')
+    if mode == 'density' and len(x):
+        counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+        image = ax.imshow(np.log1p(counts.T), origin='lower', aspect='auto', cmap='viridis', interpolation='nearest',
+                          extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]))
+        fig.colorbar(image, ax=ax, label='log(1 + pontos)')
+        detail = f"densidade {bins}x{bins} de {len(x):,} pontos"
+    else:
+        if mode == 'sample':
+            keep = stratified_sample_xy(x, y, max_points)
+            x, y = x[keep], y[keep]
+            detail = f"amostra estratificada de {len(keep):,}/{len(xy):,} pontos"
+        else:
+            detail = f"{len(x):,} pontos"
+        ax.scatter(x, y, s=6, alpha=0.5, color='#0078d7', linewidths=0, rasterized=True)
+    ax.set_title(f'Análise de Dispersão: {x_col} vs {y_col}', color='#FFD700', fontsize=12)
+    ax.set_xlabel(x_col, color='#E6D3A7', fontsize=10)
+    ax.set_ylabel(y_col, color='#E6D3A7', fontsize=10)
+    ax.tick_params(axis='both', colors='#E6D3A7')
+    ax.grid(True, alpha=0.3, color='#555555')
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', facecolor=fig.get_facecolor())
+    return buffer.getvalue(), detail
+
+
+def minecraft_background_ppm(width, height, pixel_size=BACKGROUND_PIXEL_SIZE, density=BACKGROUND_BLOCK_DENSITY, seed=None):
+    # Textura inteira como um PPM binário: um sorteio vetorizado por célula, ampliado com repeat
+    colors = (BACKGROUND_BASE_COLOR,) + BACKGROUND_BLOCK_COLORS
+    palette = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in colors], dtype=np.uint8)
+    weights = [1 - density] + [density / len(BACKGROUND_BLOCK_COLORS)] * len(BACKGROUND_BLOCK_COLORS)
+    rows, cols = -(-height // pixel_size), -(-width // pixel_size)
+    cells = np.random.default_rng(seed).choice(len(palette), size=(rows, cols), p=weights)
+    image = palette[cells].repeat(pixel_size, axis=0).repeat(pixel_size, axis=1)[:height, :width]
+    return f"P6 {width} {height} 255\n".encode('ascii') + image.tobytes()
+
+
+def benchmark_stats_engine(rows=10_000_000, cols=6, seed=42):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for j in range(cols):
+        if j % 3 == 2:
+            data[f"int_{j}"] = rng.integers(0, 1000, rows)
+        else:
+            values = rng.standard_normal(rows) * (j + 1)
+            values[rng.random(rows) < 0.02] = np.nan
+            data[f"float_{j}"] = values
+    df = pd.DataFrame(data)
+    
+    start_time = time.perf_counter()
+    described = df.describe(percentiles=[q for q in STATS_QUANTILES if q != 0.5])
+    describe_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    df.skew()
+    df.kurt()
+    df.isnull().sum()
+    describe_full_time = describe_time + time.perf_counter() - start_time
+    
+    stats = compute_column_stats(df)
+    table = stats['table']
+    max_error = float(np.nanmax(np.abs(table['mean'].to_numpy() - described.loc['mean'].to_numpy()) / (np.abs(described.loc['mean'].to_numpy()) + 1e-12)))
+    return {
+        'rows': rows,
+        'cols': cols,
+        'describe_s': describe_time,
+        'describe_skew_kurt_nulls_s': describe_full_time,
+        'engine_s': stats['elapsed'],
+        'speedup': describe_full_time / stats['elapsed'] if stats['elapsed'] else float('inf'),
+        'max_rel_error_mean': max_error
+    }
+
+
+def clean_filename(name):
+    return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+
+
+def golem_filename(model_name):
+    # clean_filename descarta caracteres; o hash do nome original evita que dois Golems dividam o arquivo
+    digest = hashlib.blake2b(model_name.encode('utf-8'), digest_size=4).hexdigest()
+    return f"golem_{clean_filename(model_name)}_{digest}.joblib"
+
+
+def fingerprint_dataframe(df):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint_json(data):
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def estimator_nbytes(model):
+    # Estimativa barata para florestas (nós + valores das árvores); demais modelos via pickle
+    estimators = getattr(model, 'estimators_', None)
+    if estimators is not None and len(estimators) and all(hasattr(est, 'tree_') for est in estimators):
+        return sum(est.tree_.node_count * 64 + est.tree_.value.nbytes for est in estimators)
+    return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class ModelStore:
+    # Estimadores em joblib + índice JSON só com metadados. Golems pequenos são comprimidos;
+    # a partir de GOLEM_MMAP_MIN_MB ficam sem compressão para abrir via memory-map.
+    INDEX_NAME = "golems_index.json"
+
+    @staticmethod
+    def metadata(model_name, model_info):
+        return {
+            'name': model_name,
+            'dataset': model_info['dataset'],
+            'target': model_info['target'],
+            'features': model_info['features'],
+            'metrics': model_info['metrics'],
+            'created': model_info['created'].isoformat(),
+            'algorithm': model_info.get('algorithm', 'unknown'),
+            'training_time': model_info.get('training_time', 0),
+            'model_bytes': model_info.get('model_bytes'),
+            'params': model_info.get('params', {}),
+            **{key: model_info[key] for key in TRAINING_RESULT_KEYS if key in model_info}
+        }
+
+    def save(self, directory, models, prune=False, track=None):
+        # track: dict que recebe, por Golem, (estimador, campos de arquivo) em vez de alterar model_info;
+        # quem chamou de outro thread aplica esses campos no thread dono dos dicionários
+        import joblib
+        os.makedirs(directory, exist_ok=True)
+        index = {}
+        bytes_written = 0
+        for model_name, model_info in list(models.items()):
+            meta = self.metadata(model_name, model_info)
+            filename = golem_filename(model_name)
+            path = os.path.join(directory, filename)
+            model = model_info.get('model')
+            source_path = model_info.get('model_path')
+            compressed = model_info.get('model_compressed', True)
+            if model is not None:
+                if not (source_path == path and model_info.get('_model_file_id') == id(model) and os.path.exists(path)):
+                    compressed = estimator_nbytes(model) < GOLEM_MMAP_MIN_MB * 1024 * 1024
+                    joblib.dump(model, path, compress=GOLEM_COMPRESS_LEVEL if compressed else 0)
+                    bytes_written += os.path.getsize(path)
+            elif source_path and os.path.exists(source_path):
+                if os.path.abspath(source_path) != os.path.abspath(path):
+                    shutil.copyfile(source_path, path)
+                    bytes_written += os.path.getsize(path)
+            else:
+                filename = None
+            meta.update({'file': filename, 'compressed': compressed})
+            if filename:
+                meta['bytes'] = os.path.getsize(path)
+                if track is not None:
+                    track[model_name] = (model, {
+                        'model_path': path,
+                        'model_compressed': compressed,
+                        '_model_file_id': id(model) if model is not None else model_info.get('_model_file_id')
+                    })
+            index[model_name] = meta
+
+        index_path = os.path.join(directory, self.INDEX_NAME)
+        with open(index_path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(index_path + ".tmp", index_path)
+
+        if prune:
+            keep = {meta['file'] for meta in index.values() if meta['file']}
+            for filename in os.listdir(directory):
+                if filename.startswith("golem_") and filename.endswith(".joblib") and filename not in keep:
+                    os.remove(os.path.join(directory, filename))
+        return len(index), bytes_written
+
+    def load_index(self, directory):
+        # Só metadados: os estimadores são lidos do disco no primeiro uso (load_estimator)
+        with open(os.path.join(directory, self.INDEX_NAME), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        models = {}
+        for model_name, meta in index.items():
+            models[model_name] = {
+                'model': None,
+                'model_path': os.path.join(directory, meta['file']) if meta.get('file') else None,
+                'model_compressed': meta.get('compressed', True),
+                'dataset': meta['dataset'],
+                'target': meta['target'],
+                'features': meta['features'],
+                'metrics': meta['metrics'],
+                'created': datetime.datetime.fromisoformat(meta['created']),
+                'algorithm': meta.get('algorithm', 'unknown'),
+                'training_time': meta.get('training_time', 0),
+                'model_bytes': meta.get('model_bytes'),
+                'params': meta.get('params', {}),
+                **{key: meta[key] for key in TRAINING_RESULT_KEYS if key in meta}
+            }
+        return models
+
+    def load_estimator(self, model_info):
+        import joblib
+        model = joblib.load(model_info['model_path'], mmap_mode=None if model_info.get('model_compressed', True) else 'r')
+        model_info['_model_file_id'] = id(model)
+        return model
+
+
+def build_estimator(algorithm, params):
+    from sklearn.ensemble import RandomForestRegressor, ExtraTreesRegressor, HistGradientBoostingRegressor
+    from sklearn.linear_model import Ridge
+    from sklearn.neighbors import KNeighborsRegressor
+    from sklearn.pipeline import make_pipeline
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import StandardScaler
+    if algorithm == 'RandomForest':
+        return RandomForestRegressor(**params)
+    if algorithm == 'ExtraTrees':
+        return ExtraTreesRegressor(**params)
+    if algorithm == 'AdaptiveForest':
+        # Fora de grow_forest (torneio, refit) vira uma floresta comum com o tamanho já escolhido pelo OOB
+        forest_params = {key: value for key, value in params.items() if key not in ADAPTIVE_FOREST_KEYS}
+        forest_params.setdefault('n_estimators', params.get('max_estimators', ADAPTIVE_FOREST_MAX))
+        return RandomForestRegressor(**forest_params)
+    if algorithm == 'HistGradientBoosting':
+        return HistGradientBoostingRegressor(**params)
+    if algorithm == 'Ridge':
+        return make_pipeline(SimpleImputer(), StandardScaler(), Ridge(**params))
+    if algorithm == 'KNN':
+        return make_pipeline(SimpleImputer(), StandardScaler(), KNeighborsRegressor(**params))
+    if algorithm == 'Incremental':
+        # Equivalente em lote do IncrementalGolem, para o torneio reavaliar com os mesmos folds
+        from sklearn.linear_model import SGDRegressor
+        from sklearn.compose import TransformedTargetRegressor
+        return TransformedTargetRegressor(make_pipeline(SimpleImputer(), StandardScaler(), SGDRegressor(**params)), transformer=StandardScaler())
+    raise ValueError(f"Tipo de Golem desconhecido: {algorithm}")
+
+
+def regression_metrics(y_true, y_pred):
+    from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
+    return {
+        'r2': float(r2_score(y_true, y_pred)),
+        'rmse': float(np.sqrt(mean_squared_error(y_true, y_pred))),
+        'mae': float(mean_absolute_error(y_true, y_pred))
+    }
+
+
+def build_feature_matrix(df, features, target, test_size=0.2, random_state=42):
+    # Matriz float32 contígua com as linhas já na ordem treino|teste (embaralhamento do
+    # train_test_split com random_state fixo): X_train/X_test viram fatias, sem cópia
+    from sklearn.model_selection import train_test_split
+    train_index, test_index = train_test_split(np.arange(len(df)), test_size=test_size, random_state=random_state)
+    order = np.concatenate([train_index, test_index])
+    X = np.empty((len(order), len(features)), dtype=np.float32)
+    for j, col in enumerate(features):
+        X[:, j] = df[col].to_numpy(dtype=np.float32, na_value=np.nan)[order]
+    y = df[target].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+    positions = np.empty(len(order), dtype=np.int64)
+    positions[order] = np.arange(len(order))
+    return {'X': X, 'y': y, 'n_train': len(train_index), 'order': order, 'positions': positions,
+            'nbytes': X.nbytes + y.nbytes + order.nbytes + positions.nbytes}
+
+
+def training_spec_from_matrix(matrix, algorithm, params):
+    n_train = matrix['n_train']
+    spec = {'algorithm': algorithm, 'params': params, 'X_train': matrix['X'][:n_train], 'y_train': matrix['y'][:n_train],
+            'X_test': matrix['X'][n_train:], 'y_test': matrix['y'][n_train:]}
+    # NaN nas features fica para o estimador; linhas sem alvo não servem nem para treino nem para teste
+    for part in ('train', 'test'):
+        known = ~np.isnan(spec[f"y_{part}"])
+        if not known.all():
+            spec[f"X_{part}"], spec[f"y_{part}"] = spec[f"X_{part}"][known], spec[f"y_{part}"][known]
+    return spec
+
+
+class FeatureMatrixCache:
+    # LRU de matrizes de features por (bloco, versão, features, alvo, divisão) sob um orçamento de memória;
+    # uma versão nova do bloco derruba as matrizes das versões anteriores
+    def __init__(self, budget_bytes=FEATURE_CACHE_BYTES):
+        self.budget_bytes = budget_bytes
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, name, version, df, features, target, test_size=0.2, random_state=42):
+        key = (name, version, tuple(features), target, test_size, random_state)
+        with self._lock:
+            matrix = self.entries.get(key)
+            if matrix is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return matrix
+        matrix = build_feature_matrix(df, list(features), target, test_size, random_state)
+        with self._lock:
+            self.misses += 1
+            for stale in [k for k in self.entries if k[0] == name and k[1] != version]:
+                del self.entries[stale]
+            self.entries[key] = matrix
+            while len(self.entries) > 1 and self.nbytes > self.budget_bytes:
+                self.entries.popitem(last=False)
+        return matrix
+
+    def invalidate(self, name):
+        with self._lock:
+            for key in [k for k in self.entries if k[0] == name]:
+                del self.entries[key]
+
+    @property
+    def nbytes(self):
+        return sum(matrix['nbytes'] for matrix in self.entries.values())
+
+
+def grow_forest(X_train, y_train, params):
+    # warm_start acrescenta árvores sem refazer as anteriores; a cada incremento mede o erro OOB.
+    # No fim a floresta é cortada no último incremento que ainda melhorou além da tolerância.
+    from sklearn.ensemble import RandomForestRegressor
+    step = params.get('n_estimators_step', ADAPTIVE_FOREST_STEP)
+    max_estimators = params.get('max_estimators', ADAPTIVE_FOREST_MAX)
+    tol = params.get('oob_tol', ADAPTIVE_FOREST_TOL)
+    patience = params.get('patience', ADAPTIVE_FOREST_PATIENCE)
+    forest_params = {key: value for key, value in params.items() if key not in ADAPTIVE_FOREST_KEYS + ('n_estimators',)}
+    forest_params.update({'warm_start': True, 'oob_score': True, 'bootstrap': True})
+    model = RandomForestRegressor(n_estimators=step, **forest_params)
+    curve = []
+    best_error, chosen, stalls = np.inf, step, 0
+    n_estimators = step
+    while True:
+        model.set_params(n_estimators=n_estimators)
+        model.fit(X_train, y_train)
+        oob = model.oob_prediction_
+        scored = ~np.isnan(oob)
+        error = float(np.mean((y_train[scored] - oob[scored]) ** 2)) if scored.any() else np.nan
+        curve.append({'trees': n_estimators, 'oob_r2': float(model.oob_score_), 'oob_rmse': float(np.sqrt(error))})
+        if np.isfinite(error) and (not np.isfinite(best_error) or best_error - error > tol * best_error):
+            best_error, chosen, stalls = error, n_estimators, 0
+        else:
+            stalls += 1
+        if stalls >= patience or n_estimators >= max_estimators:
+            break
+        n_estimators = min(n_estimators + step, max_estimators)
+    # Árvores além do ponto escolhido só custam memória e tempo de previsão
+    model.estimators_ = model.estimators_[:chosen]
+    model.set_params(n_estimators=chosen, warm_start=False)
+    model.oob_score_ = next(point['oob_r2'] for point in curve if point['trees'] == chosen)
+    del model.oob_prediction_
+    return model, curve
+
+
+def fit_golem(spec):
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    curve = None
+    if spec['algorithm'] == 'AdaptiveForest':
+        model, curve = grow_forest(spec['X_train'], spec['y_train'], spec['params'])
+    else:
+        model = build_estimator(spec['algorithm'], spec['params'])
+        model.fit(spec['X_train'], spec['y_train'])
+    training_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+    metrics = regression_metrics(spec['y_test'], model.predict(spec['X_test']))
+    result = {'model': model, 'metrics': metrics, 'training_time': training_time, 'cpu_time': cpu_time, 'model_bytes': estimator_nbytes(model)}
+    if hasattr(model, 'n_iter_'):
+        result['iterations'] = int(model.n_iter_)
+    if curve is not None:
+        result.update({'n_estimators': len(model.estimators_), 'oob_curve': curve,
+                       'params': dict(spec['params'], n_estimators=len(model.estimators_))})
+    return result
+
+
+class IncrementalGolem:
+    # Golem que aprende chunk a chunk (StandardScaler.partial_fit + SGDRegressor.partial_fit, alvo padronizado).
+    # Uma fração de cada chunk nunca é treinada: vira a janela de validação móvel (buffer circular de
+    # tamanho fixo), então a memória não cresce com o número de linhas que passaram.
+    def __init__(self, features, target, params=None, holdout_fraction=INCREMENTAL_HOLDOUT,
+                 window_rows=INCREMENTAL_WINDOW_ROWS, checkpoint_path=None, checkpoint_rows=INCREMENTAL_CHECKPOINT_ROWS, random_state=42):
+        from sklearn.linear_model import SGDRegressor
+        from sklearn.preprocessing import StandardScaler
+        self.features = list(features)
+        self.target = target
+        self.params = dict(INCREMENTAL_PARAMS if params is None else params)
+        self.scaler = StandardScaler()
+        self.target_scaler = StandardScaler()
+        self.model = SGDRegressor(**self.params)
+        self.holdout_fraction = holdout_fraction
+        self.rng = np.random.default_rng(random_state)
+        self.window_true = np.full(window_rows, np.nan)
+        self.window_pred = np.full(window_rows, np.nan)
+        self.window_next = 0
+        self.window_count = 0
+        self.fitted = False
+        self.rows_seen = 0
+        self.rows_trained = 0
+        self.chunks_seen = 0
+        self.fit_seconds = 0.0
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_rows = checkpoint_rows
+        self.checkpoints = 0
+        self._rows_at_checkpoint = 0
+        self.checkpoint_error = None
+        self._lock = threading.Lock()
+        # Checkpoints vêm da ingestão, de alimentações manuais e do thread do Tk: um de cada vez
+        self._checkpoint_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Cópia consistente mesmo com um partial_fit em andamento em outro thread
+        with self._lock:
+            return copy.deepcopy({key: value for key, value in self.__dict__.items() if key not in ('_lock', '_checkpoint_lock')})
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('checkpoint_error', None)
+        self._lock = threading.Lock()
+        self._checkpoint_lock = threading.Lock()
+
+    def accepts(self, columns):
+        return self.target in columns and all(col in columns for col in self.features)
+
+    def _transform(self, X):
+        # NaN vira a média corrente da coluna antes de padronizar
+        missing = np.isnan(X)
+        if missing.any():
+            X = np.where(missing, np.nan_to_num(self.scaler.mean_), X)
+        return self.scaler.transform(X)
+
+    def _predict(self, X):
+        scaled = self.model.predict(self._transform(X))
+        return self.target_scaler.inverse_transform(scaled.reshape(-1, 1)).ravel()
+
+    def predict(self, X):
+        with self._lock:
+            return self._predict(np.asarray(X, dtype=np.float64))
+
+    def _record(self, y_true, y_pred):
+        size = len(self.window_true)
+        y_true, y_pred = y_true[-size:], y_pred[-size:]
+        slots = (self.window_next + np.arange(len(y_true))) % size
+        self.window_true[slots], self.window_pred[slots] = y_true, y_pred
+        self.window_next = int((self.window_next + len(y_true)) % size)
+        self.window_count = min(self.window_count + len(y_true), size)
+
+    def partial_fit(self, chunk):
+        X = chunk[self.features].to_numpy(dtype=np.float64, na_value=np.nan)
+        y = chunk[self.target].to_numpy(dtype=np.float64, na_value=np.nan)
+        known = ~np.isnan(y)
+        X, y = X[known], y[known]
+        holdout = self.rng.random(len(y)) < self.holdout_fraction
+        with self._lock:
+            start_time = time.perf_counter()
+            if self.fitted and holdout.any():
+                self._record(y[holdout], self._predict(X[holdout]))
+            train = ~holdout
+            if train.any():
+                self.scaler.partial_fit(X[train])
+                self.target_scaler.partial_fit(y[train].reshape(-1, 1))
+                self.model.partial_fit(self._transform(X[train]), self.target_scaler.transform(y[train].reshape(-1, 1)).ravel())
+                self.fitted = True
+            self.rows_seen += len(chunk)
+            self.rows_trained += int(train.sum())
+            self.chunks_seen += 1
+            self.fit_seconds += time.perf_counter() - start_time
+        if self.checkpoint_path and self.rows_trained - self._rows_at_checkpoint >= self.checkpoint_rows:
+            # O chunk já foi aprendido: uma falha de disco fica registrada (e o próximo checkpoint tenta de novo)
+            # em vez de desligar o Golem da mineração
+            try:
+                self.checkpoint()
+            except Exception as e:
+                self.checkpoint_error = str(e)
+
+    def metrics(self):
+        with self._lock:
+            filled = ~np.isnan(self.window_true)
+            if filled.sum() < 2:
+                return {'r2': float('nan'), 'rmse': float('nan'), 'mae': float('nan'), 'window_rows': int(filled.sum())}
+            metrics = regression_metrics(self.window_true[filled], self.window_pred[filled])
+        metrics['window_rows'] = int(filled.sum())
+        return metrics
+
+    def checkpoint(self):
+        # Escrita atômica num temporário exclusivo da mesma pasta: um checkpoint interrompido (ou concorrente)
+        # nunca substitui o anterior pela metade
+        import joblib
+        import tempfile
+        if not self.checkpoint_path:
+            return None
+        directory = os.path.dirname(self.checkpoint_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with self._checkpoint_lock:
+            rows_at_checkpoint = self.rows_trained
+            self.checkpoints += 1
+            fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.checkpoint_path) + ".", suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    joblib.dump(self, f)
+                os.replace(tmp_path, self.checkpoint_path)
+            except BaseException:
+                self.checkpoints -= 1
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._rows_at_checkpoint = rows_at_checkpoint
+            self.checkpoint_error = None
+        return self.checkpoint_path
+
+
+def feed_incremental_golem(golem, chunks, cancel_event=None, progress=None):
+    # chunks: iterável de (chunk, fração), como iter_file_chunks
+    start_rows = golem.rows_seen
+    for chunk, fraction in chunks:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        golem.partial_fit(chunk)
+        if progress:
+            progress(golem.rows_seen - start_rows, fraction)
+    golem.checkpoint()
+    return golem.rows_seen - start_rows
+
+
+def kfold_indices(n_rows, n_splits=TOURNAMENT_FOLDS, random_state=42):
+    from sklearn.model_selection import KFold
+    return list(KFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(np.empty((n_rows, 0))))
+
+
+def _fit_fold(algorithm, params, X, y, train_index, test_index):
+    model = build_estimator(algorithm, params)
+    start_time = time.perf_counter()
+    model.fit(X[train_index], y[train_index])
+    fit_seconds = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    prediction = model.predict(X[test_index])
+    return prediction, fit_seconds, time.perf_counter() - start_time
+
+
+def summarize_folds(y, folds, fold_results):
+    # mean/std por métrica sobre os folds + latência de predição por 1k linhas
+    metrics = [regression_metrics(y[test], prediction) for (_, test), (prediction, _, _) in zip(folds, fold_results)]
+    summary = {'folds': len(folds)}
+    for key in ('r2', 'rmse', 'mae'):
+        values = np.array([m[key] for m in metrics])
+        summary[f"{key}_mean"], summary[f"{key}_std"] = float(values.mean()), float(values.std(ddof=1) if len(values) > 1 else 0.0)
+    summary['fit_seconds'] = float(np.mean([fit for _, fit, _ in fold_results]))
+    summary['predict_ms_per_1k'] = float(sum(seconds for _, _, seconds in fold_results) / max(sum(len(test) for _, test in folds), 1) * 1e6)
+    return summary
+
+
+def _train_golem_worker(conn, spec):
+    # Executa no processo filho: o ajuste não disputa o GIL com o Tk. Cada job tem seu próprio pipe,
+    # então terminar um filho no meio da escrita só corrompe o canal do job cancelado.
+    try:
+        conn.send(('done', fit_golem(spec)))
+    except Exception as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+class TrainingJob:
+    def __init__(self, job_id, model_name, spec, meta):
+        self.job_id = job_id
+        self.model_name = model_name
+        self.spec = spec
+        self.meta = meta
+        self.status = 'queued'
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.process = None
+        self.result = None
+        self.error = None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def is_active(self):
+        return self.status in ('queued', 'running')
+
+
+class TrainingJobQueue:
+    # Fila de forja com no máximo max_workers processos; poll() é chamado pelo timer da UI.
+    # Cada job tem um thread auxiliar que inicia o processo (o spawn serializa a matriz inteira) e
+    # recebe o Golem ajustado (desserializar uma floresta grande leva segundos): o Tk só lê o resultado pronto.
+    def __init__(self, max_workers=TRAIN_MAX_WORKERS):
+        self.max_workers = max_workers
+        self.context = multiprocessing.get_context('spawn')
+        self.jobs = {}
+        self.results = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def submit(self, model_name, spec, meta):
+        job = TrainingJob(next(self._ids), model_name, spec, meta)
+        self.jobs[job.job_id] = job
+        return job
+
+    def running_jobs(self):
+        return [job for job in self.jobs.values() if job.status == 'running']
+
+    def has_active(self):
+        return any(job.is_active for job in self.jobs.values())
+
+    def cancel(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None or not job.is_active:
+            return False
+        with self._lock:
+            job.status = 'cancelled'
+            process = job.process
+        # Sem join aqui: o thread auxiliar do job recebe o EOF e recolhe o processo
+        if process is not None and process.is_alive():
+            process.terminate()
+        job.finished = time.time()
+        job.spec = None
+        return True
+
+    def _run_job(self, job, spec):
+        conn, child_conn = self.context.Pipe(duplex=False)
+        process = self.context.Process(target=_train_golem_worker, args=(child_conn, spec), daemon=True)
+        del spec
+        try:
+            process.start()
+        except Exception as e:
+            conn.close()
+            self.results.put((job, 'error', f"falha ao iniciar a forja: {e}"))
+            return
+        finally:
+            child_conn.close()
+        with self._lock:
+            job.process = process
+            cancelled = job.status == 'cancelled'
+        if cancelled:
+            process.terminate()
+        try:
+            status, payload = conn.recv()
+        except (EOFError, OSError):
+            process.join()
+            status, payload = 'error', f"processo da forja terminou sem resultado (código {process.exitcode})"
+        finally:
+            conn.close()
+        process.join()
+        self.results.put((job, status, payload))
+
+    def poll(self):
+        finished = []
+        while True:
+            try:
+                job, status, payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if job.status != 'running':
+                continue
+            job.status = status
+            job.finished = time.time()
+            if status == 'done':
+                job.result = payload
+            else:
+                job.error = payload
+            finished.append(job)
+
+        for job in self.jobs.values():
+            if len(self.running_jobs()) >= self.max_workers:
+                break
+            if job.status == 'queued':
+                job.status = 'running'
+                job.started = time.time()
+                threading.Thread(target=self._run_job, args=(job, job.spec), name=f"forja-{job.job_id}", daemon=True).start()
+                job.spec = None
+        return finished
+
+    def shutdown(self):
+        for job in list(self.jobs.values()):
+            self.cancel(job.job_id)
+
+
+def sample_automl_candidates(n_candidates, random_state=42):
+    rng = np.random.default_rng(random_state)
+    algorithms = list(AUTOML_SEARCH_SPACE)
+    candidates, seen = [], set()
+    for attempt in range(n_candidates * 20):
+        if len(candidates) >= n_candidates:
+            break
+        # Garante ao menos um candidato por família antes de sortear livremente
+        algorithm = algorithms[attempt] if attempt < len(algorithms) else algorithms[rng.integers(len(algorithms))]
+        params = {name: values[rng.integers(len(values))] for name, values in AUTOML_SEARCH_SPACE[algorithm].items()}
+        if algorithm in ('RandomForest', 'ExtraTrees', 'HistGradientBoosting'):
+            params['random_state'] = random_state
+        key = (algorithm, json.dumps(params, sort_keys=True, default=str))
+        if key not in seen:
+            seen.add(key)
+            candidates.append((algorithm, params))
+    return candidates
+
+
+_AUTOML_DATA = {}
+
+
+def _automl_worker_init(X_train, y_train, X_val, y_val, inner_threads):
+    _AUTOML_DATA.update(X_train=X_train, y_train=y_train, X_val=X_val, y_val=y_val, inner_threads=inner_threads)
+
+
+def _automl_evaluate(candidate_id, algorithm, params, rows):
+    # Treina no prefixo embaralhado de `rows` linhas e avalia sempre no mesmo conjunto de validação.
+    # Cada processo fica com sua fatia dos núcleos: n_jobs das florestas e OpenMP/BLAS limitados a inner_threads.
+    from threadpoolctl import threadpool_limits
+    inner_threads = _AUTOML_DATA['inner_threads']
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    model = build_estimator(algorithm, params)
+    if 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=inner_threads)
+    with threadpool_limits(limits=inner_threads):
+        model.fit(_AUTOML_DATA['X_train'][:rows], _AUTOML_DATA['y_train'][:rows])
+        fit_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        metrics = regression_metrics(_AUTOML_DATA['y_val'], model.predict(_AUTOML_DATA['X_val']))
+    return {'candidate_id': candidate_id, 'rows': rows, 'metrics': metrics, 'fit_time': fit_time, 'cpu_time': cpu_time, 'model': model}
+
+
+class AutoMLSearch:
+    # Successive halving com orçamento de tempo: todos os candidatos em amostras pequenas,
+    # só o melhor 1/eta sobe para a rodada seguinte, até o conjunto de treino completo
+    def __init__(self, X, y, budget_seconds, n_candidates=AUTOML_N_CANDIDATES, eta=AUTOML_ETA,
+                 min_rows=AUTOML_MIN_ROWS, top_k=AUTOML_TOP_K, max_workers=None, random_state=42):
+        self.X = X
+        self.y = y
+        self.budget_seconds = budget_seconds
+        self.eta = eta
+        self.min_rows = min_rows
+        self.top_k = top_k
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.random_state = random_state
+        self.candidates = sample_automl_candidates(n_candidates, random_state)
+        self.leaderboard = {}
+        self.models = {}
+        self.failures = []
+        self.status = 'queued'
+        self.round = 0
+        self.evaluated = 0
+        self.error = None
+        self.started = None
+        self.finished = None
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def is_active(self):
+        return self.status in ('queued', 'running')
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def ranking(self):
+        with self._lock:
+            entries = [dict(entry) for entry in self.leaderboard.values()]
+        return sorted(entries, key=lambda entry: (entry['rows'], entry['metrics']['r2']), reverse=True)
+
+    def best(self):
+        ranking = self.ranking()[:self.top_k]
+        with self._lock:
+            return [(entry, self.models[entry['candidate_id']]) for entry in ranking if entry['candidate_id'] in self.models]
+
+    def _rows_schedule(self, n_train):
+        n_rounds = max(1, math.ceil(math.log(len(self.candidates), self.eta)))
+        return [min(n_train, max(self.min_rows, int(n_train / self.eta ** (n_rounds - r)))) for r in range(n_rounds + 1)]
+
+    def _run(self):
+        self.status = 'running'
+        self.started = time.time()
+        deadline = self.started + self.budget_seconds
+        executor = None
+        try:
+            rng = np.random.default_rng(self.random_state)
+            order = rng.permutation(len(self.y))
+            # Teste separado, nunca visto pela busca: a validação escolhe os candidatos, o teste dá a nota final
+            n_test = max(1, int(len(order) * AUTOML_TEST_FRACTION))
+            n_val = max(1, int((len(order) - n_test) * 0.2))
+            test_idx, val_idx, train_idx = order[:n_test], order[n_test:n_test + n_val], order[n_test + n_val:]
+            inner_threads = max(1, (os.cpu_count() or 1) // self.max_workers)
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn'), initializer=_automl_worker_init,
+                initargs=(self.X[train_idx], self.y[train_idx], self.X[val_idx], self.y[val_idx], inner_threads)
+            )
+            survivors = list(range(len(self.candidates)))
+            for round_index, rows in enumerate(self._rows_schedule(len(train_idx))):
+                self.round = round_index + 1
+                pending = {executor.submit(_automl_evaluate, cid, *self.candidates[cid], rows): cid for cid in survivors}
+                futures = set(pending)
+                round_results = []
+                while futures and not self.cancel_event.is_set() and time.time() < deadline:
+                    done, futures = wait(futures, timeout=min(1.0, max(0.0, deadline - time.time())), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future.exception() is not None:
+                            self._record_failure(pending[future], future.exception())
+                            continue
+                        result = future.result()
+                        round_results.append(result)
+                        self._record(result, round_index + 1)
+                if futures or not round_results or rows >= len(train_idx):
+                    break
+                round_results.sort(key=lambda result: result['metrics']['r2'], reverse=True)
+                keep = max(self.top_k, math.ceil(len(round_results) / self.eta))
+                survivors = [result['candidate_id'] for result in round_results[:keep]]
+            self._stop_executor(executor)
+            executor = None
+            self._score_test(self.X[test_idx], self.y[test_idx])
+            self.status = 'cancelled' if self.cancel_event.is_set() else 'done'
+        except Exception as e:
+            self.error = str(e)
+            self.status = 'error'
+        finally:
+            if executor is not None:
+                self._stop_executor(executor)
+            self.finished = time.time()
+
+    def _score_test(self, X_test, y_test):
+        # Só os top-K que viram Golems são reavaliados no teste intocado
+        for entry, model in self.best():
+            metrics = regression_metrics(y_test, model.predict(X_test))
+            with self._lock:
+                self.leaderboard[entry['candidate_id']]['test_metrics'] = metrics
+
+    @staticmethod
+    def _stop_executor(executor):
+        # cancel() não interrompe candidatos já em ajuste: os processos do pool são terminados
+        # para que o orçamento de tempo valha também para a CPU, não só para o status.
+        # ProcessPoolExecutor não expõe seus processos; _processes é privado (CPython 3.8+) e, se sumir,
+        # cai-se no shutdown sem terminar (os candidatos em ajuste terminam sozinhos)
+        processes = list((getattr(executor, '_processes', None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            try:
+                if process.is_alive():
+                    process.terminate()
+            except (OSError, ValueError):
+                pass
+
+    def _record_failure(self, candidate_id, error):
+        algorithm, params = self.candidates[candidate_id]
+        with self._lock:
+            self.failures.append({'candidate_id': candidate_id, 'algorithm': algorithm, 'params': params, 'error': f"{type(error).__name__}: {error}"})
+
+    def _record(self, result, round_number):
+        algorithm, params = self.candidates[result['candidate_id']]
+        with self._lock:
+            self.evaluated += 1
+            self.leaderboard[result['candidate_id']] = {
+                'candidate_id': result['candidate_id'],
+                'algorithm': algorithm,
+                'params': params,
+                'round': round_number,
+                'rows': result['rows'],
+                'metrics': result['metrics'],
+                'fit_time': result['fit_time'],
+                'cpu_time': result['cpu_time']
+            }
+            self.models[result['candidate_id']] = result['model']
+            # Só os melhores modelos ficam em memória
+            keep = {entry['candidate_id'] for entry in sorted(self.leaderboard.values(), key=lambda e: (e['rows'], e['metrics']['r2']), reverse=True)[:self.top_k * self.eta]}
+            for candidate_id in list(self.models):
+                if candidate_id not in keep:
+                    del self.models[candidate_id]
+
+
+class AutoSaveStore:
+    # Snapshots incrementais: só grava o que mudou desde o último ciclo, em Parquet comprimido,
+    # e aplica a política de retenção (últimos N por item + teto de tamanho total)
+    MANIFEST_NAME = "autosave_manifest.json"
+
+    def __init__(self, directory=AUTOSAVE_DIR, keep_snapshots=AUTOSAVE_KEEP_SNAPSHOTS, max_bytes=AUTOSAVE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.keep_snapshots = keep_snapshots
+        self.max_bytes = max_bytes
+        self.manifest_path = os.path.join(directory, self.MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+        self._fingerprints = {}
+        self.model_store = ModelStore()
+        self.golems_dir = os.path.join(directory, "golems")
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault('datasets', {})
+        manifest.setdefault('models', {})
+        return manifest
+
+    def _save_manifest(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def dataset_fingerprint(self, name, df, version):
+        # O hash do conteúdo só é recalculado quando a versão do dataset muda
+        key = (id(df), version)
+        cached = self._fingerprints.get(name)
+        if cached and cached[0] == key:
+            return cached[1]
+        fingerprint = fingerprint_dataframe(df)
+        self._fingerprints[name] = (key, fingerprint)
+        return fingerprint
+
+    def _write_dataset(self, df, base_path):
+        try:
+            path = base_path + ".parquet"
+            df.to_parquet(path, compression='zstd', index=False)
+        except Exception:
+            path = base_path + ".pkl.gz"
+            df.to_pickle(path, compression='gzip')
+        return path
+
+    def _record_snapshot(self, section, name, fingerprint, path):
+        entry = self.manifest[section].setdefault(name, {'snapshots': []})
+        entry['fingerprint'] = fingerprint
+        entry['snapshots'].append({
+            'file': os.path.basename(path),
+            'bytes': os.path.getsize(path),
+            'created': datetime.datetime.now().isoformat(),
+            'fingerprint': fingerprint
+        })
+        return entry['snapshots'][-1]['bytes']
+
+    def save_cycle(self, datasets, versions, models):
+        os.makedirs(self.directory, exist_ok=True)
+        start_time = time.time()
+        stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        report = {'written': [], 'skipped': [], 'errors': [], 'bytes': 0, 'deleted': 0, 'tracked': {}}
+        datasets = list(datasets)
+
+        for name, df in datasets:
+            try:
+                fingerprint = self.dataset_fingerprint(name, df, versions.get(name, 0))
+                if self.manifest['datasets'].get(name, {}).get('fingerprint') == fingerprint:
+                    report['skipped'].append(name)
+                    continue
+                path = self._write_dataset(df, os.path.join(self.directory, f"autosave_block_{clean_filename(name)}_{stamp}_{fingerprint[:8]}"))
+                report['bytes'] += self._record_snapshot('datasets', name, fingerprint, path)
+                report['written'].append(name)
+            except Exception as e:
+                report['errors'].append(f"{name}: {e}")
+
+        if models:
+            # O estábulo estável é reescrito só quando algum Golem mudou; estimadores já gravados não são regravados
+            fingerprint = fingerprint_json({name: self.model_store.metadata(name, info) for name, info in models.items()})
+            if self.manifest['models'].get('golems', {}).get('fingerprint') == fingerprint:
+                report['skipped'].append('golems')
+            else:
+                _, bytes_written = self.model_store.save(self.golems_dir, models, prune=True, track=report['tracked'])
+                self.manifest['models']['golems'] = {'fingerprint': fingerprint, 'saved': datetime.datetime.now().isoformat()}
+                report['bytes'] += bytes_written
+                report['written'].append('golems')
+
+        report['deleted'] = self._apply_retention({name for name, _ in datasets})
+        self._save_manifest()
+        report['elapsed'] = time.time() - start_time
+        return report
+
+    def _delete_snapshot(self, snapshot):
+        try:
+            os.remove(os.path.join(self.directory, snapshot['file']))
+        except OSError:
+            pass
+
+    def _apply_retention(self, live_datasets):
+        deleted = 0
+        # Blocos que saíram do mundo perdem a entrada no manifesto e todos os snapshots
+        for name in [name for name in self.manifest['datasets'] if name not in live_datasets]:
+            entry = self.manifest['datasets'].pop(name)
+            for snap in entry.get('snapshots', []):
+                self._delete_snapshot(snap)
+                deleted += 1
+            self._fingerprints.pop(name, None)
+        entries = [entry for section in ('datasets', 'models') for entry in self.manifest[section].values() if 'snapshots' in entry]
+        for entry in entries:
+            while len(entry['snapshots']) > self.keep_snapshots:
+                self._delete_snapshot(entry['snapshots'].pop(0))
+                deleted += 1
+
+        # Teto de tamanho: remove os snapshots mais antigos, preservando o mais recente de cada item
+        total_bytes = sum(snap['bytes'] for entry in entries for snap in entry['snapshots'])
+        candidates = sorted(
+            ((snap['created'], entry, snap) for entry in entries for snap in entry['snapshots'][:-1]),
+            key=lambda item: item[0]
+        )
+        for _, entry, snap in candidates:
+            if total_bytes <= self.max_bytes:
+                break
+            entry['snapshots'].remove(snap)
+            self._delete_snapshot(snap)
+            total_bytes -= snap['bytes']
+            deleted += 1
+        return deleted
+
+
+class IngestionJob:
+    # Estado de uma mineração em background; a UI só lê estes campos via polling
+    def __init__(self, job_id, path, compact=False, shards=None, columns=None, predicates=None, feeders=None):
+        self.job_id = job_id
+        self.path = path
+        self.feeders = dict(feeders or {})
+        self.fed = set()
+        self.feed_errors = {}
+        self.shards = shards
+        self.shard_report = []
+        self.columns = columns
+        self.predicates = list(predicates or ())
+        self.scan_report = {}
+        self.compact = compact
+        self.compact_report = None
+        self.status = 'queued'
+        self.fraction = 0.0
+        self.rows_read = 0
+        self.chunks_read = 0
+        self.started = None
+        self.finished = None
+        self.error = None
+        self.result = None
+        self.profile = None
+        self.sample = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def label(self):
+        return os.path.basename(self.path)
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def rows_per_sec(self):
+        elapsed = self.elapsed
+        return self.rows_read / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def is_active(self):
+        return self.status in ('queued', 'running')
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class DataIngestionEngine:
+    # Lê arquivos em chunks num pool de workers; o DataFrame só é montado quando o arquivo termina
+    def __init__(self, max_workers=2, chunk_rows=INGEST_CHUNK_ROWS):
+        self.chunk_rows = chunk_rows
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingest")
+        self.jobs = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, path, compact=False, shards=None, columns=None, predicates=None, feeders=None):
+        job = IngestionJob(next(self._ids), path, compact, shards, columns, predicates, feeders)
+        with self._lock:
+            self.jobs[job.job_id] = job
+        self.executor.submit(self._run, job)
+        return job
+
+    def _run(self, job):
+        if job.cancel_event.is_set():
+            job.status = 'cancelled'
+            job.finished = time.time()
+            return
+        job.status = 'running'
+        job.started = time.time()
+        if job.shards is not None:
+            self._run_shards(job)
+            return
+        chunks = []
+        sampler = ReservoirSample()
+        try:
+            for chunk, fraction in iter_file_chunks(job.path, self.chunk_rows, job.columns, job.predicates,
+                                                    job.scan_report):
+                if job.cancel_event.is_set():
+                    break
+                chunks.append(chunk)
+                sampler.add(chunk)
+                self._feed(job, chunk)
+                job.rows_read += len(chunk)
+                job.chunks_read += 1
+                job.fraction = fraction
+            if job.cancel_event.is_set():
+                chunks.clear()
+                job.status = 'cancelled'
+            else:
+                job.result = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else (chunks[0] if chunks else pd.DataFrame(columns=job.columns))
+                if job.predicates:
+                    job.result = job.result.reset_index(drop=True)
+                job.sample = sampler.result()
+                if job.compact:
+                    job.result, job.compact_report = compact_dataframe(job.result)
+                    if job.sample is not None:
+                        job.sample = align_dtypes(job.sample, job.result)
+                job.profile = profile_dataframe(job.result)
+                job.fraction = 1.0
+                job.status = 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'error'
+        finally:
+            job.finished = time.time()
+
+    def _feed(self, job, chunk):
+        # Golems incrementais aprendem com o chunk enquanto ele ainda está em memória;
+        # um Golem que falha é desligado desta mineração sem derrubá-la
+        for model_name, golem in job.feeders.items():
+            if model_name in job.feed_errors or not golem.accepts(chunk.columns):
+                continue
+            try:
+                golem.partial_fit(chunk)
+                job.fed.add(model_name)
+            except Exception as e:
+                job.feed_errors[model_name] = str(e)
+
+    def _run_shards(self, job):
+        def on_shard(path, table, seconds, n_read):
+            job.shard_report.append({'file': os.path.basename(path), 'rows': table.num_rows, 'seconds': seconds,
+                                     'bytes': os.path.getsize(path)})
+            job.rows_read += table.num_rows
+            job.chunks_read += 1
+            job.fraction = n_read / len(job.shards)
+        
+        try:
+            if not job.shards:
+                raise ValueError(f"Nenhum shard encontrado em {job.path}")
+            tables = read_shards(job.shards, on_shard, job.cancel_event)
+            if tables is None:
+                job.status = 'cancelled'
+            else:
+                job.result = concat_shard_tables(tables)
+                if job.feeders:
+                    for chunk in iter_frame_chunks(job.result, self.chunk_rows):
+                        self._feed(job, chunk)
+                if job.compact:
+                    job.result, job.compact_report = compact_dataframe(job.result)
+                job.sample = sample_dataframe(job.result)
+                job.profile = profile_dataframe(job.result)
+                job.fraction = 1.0
+                job.status = 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'error'
+        finally:
+            job.finished = time.time()
+
+    def active_jobs(self):
+        with self._lock:
+            return [job for job in self.jobs.values() if job.is_active]
+
+    def pop_finished(self):
+        with self._lock:
+            finished = [job for job in self.jobs.values() if not job.is_active]
+            for job in finished:
+                del self.jobs[job.job_id]
+        return finished
+
+    def cancel_all(self):
+        for job in self.active_jobs():
+            job.cancel()
+
+class PredictionJob:
+    # Previsão em lote de um arquivo; mesmos campos de progresso que IngestionJob
+    def __init__(self, job_id, model_name, source, output):
+        self.job_id = job_id
+        self.model_name = model_name
+        self.source = source
+        self.output = output
+        self.status = 'queued'
+        self.fraction = 0.0
+        self.rows_read = 0
+        self.chunks_read = 0
+        self.started = None
+        self.finished = None
+        self.error = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def label(self):
+        return f"{self.model_name} → {os.path.basename(self.output)}"
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def rows_per_sec(self):
+        elapsed = self.elapsed
+        return self.rows_read / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def is_active(self):
+        return self.status in ('queued', 'running')
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class PredictionWriter:
+    # Grava os chunks previstos assim que ficam prontos: um row group por chunk no Parquet, append no CSV
+    def __init__(self, path):
+        self.path = path
+        self.format = 'parquet' if os.path.splitext(path)[1].lower() == '.parquet' else 'csv'
+        self.writer = None
+        self.bytes_written = 0
+
+    def write(self, df):
+        if self.format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.path, table.schema, compression='zstd')
+            self.writer.write_table(table.cast(self.writer.schema))
+        else:
+            first = self.writer is None
+            if first:
+                self.writer = open(self.path, 'w', encoding='utf-8', newline='')
+            df.to_csv(self.writer, index=False, header=first)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.bytes_written = os.path.getsize(self.path)
+
+
+def predict_file(model, features, source, output, prediction_column='previsao', chunk_rows=PREDICT_CHUNK_ROWS,
+                 workers=PREDICT_WORKERS, job=None):
+    # Lê só as colunas de features, prevê os chunks em paralelo (threads: a predição do sklearn/NumPy
+    # solta o GIL) e grava na ordem de leitura. No máximo 2 x workers chunks ficam em memória.
+    start_time = time.perf_counter()
+    features = list(features)
+    missing = [col for col in features if col not in dict(read_file_schema(source)['columns'])]
+    if missing:
+        raise ValueError(f"Colunas do Golem ausentes em {os.path.basename(source)}: {', '.join(map(str, missing))}")
+    
+    def predict(chunk):
+        X = chunk[features].to_numpy(dtype=np.float64, na_value=np.nan)
+        return chunk.assign(**{prediction_column: model.predict(X)})
+    
+    writer = PredictionWriter(output)
+    rows = 0
+    pending = collections.deque()
+    
+    def drain(limit):
+        nonlocal rows
+        while len(pending) > limit:
+            future, fraction = pending.popleft()
+            result = future.result()
+            writer.write(result)
+            rows += len(result)
+            if job is not None:
+                job.rows_read = rows
+                job.chunks_read += 1
+                job.fraction = fraction
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="predict") as pool:
+            for chunk, fraction in iter_file_chunks(source, chunk_rows, columns=features):
+                if job is not None and job.cancel_event.is_set():
+                    break
+                pending.append((pool.submit(predict, chunk), fraction))
+                drain(2 * workers)
+            if job is not None and job.cancel_event.is_set():
+                for future, _ in pending:
+                    future.cancel()
+                pending.clear()
+            drain(0)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start_time
+    return {'rows': rows, 'output': output, 'bytes_written': writer.bytes_written, 'elapsed': elapsed,
+            'rows_per_sec': rows / elapsed if elapsed > 0 else 0.0}
+
+
+class BatchPredictor:
+    # Fila de previsões em lote; um arquivo por vez, cada um já usando todos os núcleos
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-predict")
+        self.jobs = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, model_name, model, features, source, output, prediction_column='previsao'):
+        job = PredictionJob(next(self._ids), model_name, source, output)
+        with self._lock:
+            self.jobs[job.job_id] = job
+        self.executor.submit(self._run, job, model, features, prediction_column)
+        return job
+
+    def _run(self, job, model, features, prediction_column):
+        if job.cancel_event.is_set():
+            job.status = 'cancelled'
+            job.finished = time.time()
+            return
+        job.status = 'running'
+        job.started = time.time()
+        try:
+            predict_file(model, features, job.source, job.output, prediction_column, job=job)
+            job.fraction = 1.0
+            job.status = 'cancelled' if job.cancel_event.is_set() else 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'error'
+        finally:
+            job.finished = time.time()
+
+    def active_jobs(self):
+        with self._lock:
+            return [job for job in self.jobs.values() if job.is_active]
+
+    def pop_finished(self):
+        with self._lock:
+            finished = [job for job in self.jobs.values() if not job.is_active]
+            for job in finished:
+                del self.jobs[job.job_id]
+        return finished
+
+    def cancel_all(self):
+        for job in self.active_jobs():
+            job.cancel()
+
+def load_dataframe(path, chunk_rows=INGEST_CHUNK_ROWS, columns=None, predicates=None):
+    chunks = [chunk for chunk, _ in iter_file_chunks(path, chunk_rows, columns, predicates)]
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+
+
+def to_jsonable(value):
+    # default= do json.dumps para os tipos de numpy/pandas que aparecem em perfis e métricas
+    if isinstance(value, (np.integer, np.floating, np.bool_)):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime.datetime, datetime.date, pd.Timestamp)):
+        return value.isoformat()
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient='index'))
+    return str(value)
+
+
+class MiningEngine:
+    # Núcleo sem Tk: blocos, perfis, análises, forja e exportação.
+    # O app gráfico e a linha de comando usam a mesma instância/API.
+    def __init__(self):
+        self.datasets = {}
+        self.dataset_versions = {}
+        self.profiles = DatasetProfileCache()
+        self.model_store = ModelStore()
+        self.models = {}
+        self.stats_cache = {}
+        self.correlation_cache = {}
+        self.danger_cache = {}
+        self.samples = {}
+        self.approximate_modes = {}
+        self.fold_cache = {}
+        self.fold_predictions = {}
+        self.feature_matrices = FeatureMatrixCache()
+    
+    def register_dataset(self, name, df, profile=None, sample=None):
+        self.datasets[name] = df
+        self.dataset_versions[name] = self.dataset_versions.get(name, 0) + 1
+        self.profiles.put(name, df, self.dataset_versions[name], profile)
+        if sample is not None:
+            self.samples[name] = (self.dataset_versions[name], sample)
+    
+    def unregister_dataset(self, name):
+        self.datasets.pop(name, None)
+        self.dataset_versions.pop(name, None)
+        self.profiles.invalidate(name)
+        self.feature_matrices.invalidate(name)
+        self.samples.pop(name, None)
+        self.approximate_modes.pop(name, None)
+    
+    def is_approximate(self, name):
+        # Modo aproximado: ligado por padrão a partir de APPROX_AUTO_ROWS linhas; sem efeito se o bloco cabe na amostra
+        rows = len(self.datasets[name])
+        return rows > APPROX_SAMPLE_ROWS and self.approximate_modes.get(name, rows >= APPROX_AUTO_ROWS)
+    
+    def set_approximate(self, name, enabled):
+        self.approximate_modes[name] = bool(enabled)
+    
+    def sample(self, name):
+        version = self.dataset_versions.get(name, 0)
+        cached = self.samples.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, sample_dataframe(self.datasets[name]))
+            self.samples[name] = cached
+        return cached[1]
+    
+    def has_exact(self, name):
+        return (name, self.dataset_versions.get(name, 0), False) in self.stats_cache
+    
+    def get_profile(self, name):
+        return self.profiles.get(name, self.datasets[name], self.dataset_versions.get(name, 0))
+    
+    def dataset_name_for(self, filename):
+        dataset_name = os.path.basename(filename).split('.')[0].replace('_', ' ').title()
+        if dataset_name in self.datasets:
+            dataset_name += f"_v{datetime.datetime.now().strftime('%H%M%S')}"
+        return dataset_name
+    
+    def load(self, path, name=None, columns=None, predicates=None):
+        if os.path.splitext(path)[1].lower() not in SUPPORTED_EXTENSIONS:
+            raise ValueError(f"Formato de bloco não suportado: {os.path.splitext(path)[1]}")
+        if columns or predicates:
+            check_pushdown_columns(path, read_file_schema(path), columns, predicates)
+        name = name or self.dataset_name_for(path)
+        self.register_dataset(name, load_dataframe(path, columns=columns, predicates=predicates))
+        return name
+    
+    def load_shards(self, source, name=None, pattern="*"):
+        paths = resolve_shards(source, pattern)
+        if not paths:
+            raise ValueError(f"Nenhum shard encontrado em {source}")
+        tables = read_shards(paths)
+        name = name or self.dataset_name_for(os.path.dirname(source) if any(c in source for c in "*?[") else os.path.normpath(source))
+        self.register_dataset(name, concat_shard_tables(tables))
+        return name
+    
+    def compact(self, name):
+        compacted, report = compact_dataframe(self.datasets[name])
+        self.register_dataset(name, compacted)
+        return report
+    
+    def _use_sample(self, cache, exact_key, exact):
+        # A estimativa só é usada enquanto o resultado exato da mesma versão não existe
+        return not exact and exact_key not in cache and self.is_approximate(exact_key[0])
+    
+    def column_stats(self, name, exact=False):
+        key = (name, self.dataset_versions.get(name, 0), False)
+        if self._use_sample(self.stats_cache, key, exact):
+            key = key[:2] + (True,)
+        stats = self.stats_cache.get(key)
+        if stats is None:
+            columns = self.get_profile(name)['numeric_cols']
+            if key[2]:
+                stats = approximate_column_stats(self.sample(name), len(self.datasets[name]), columns)
+            else:
+                stats = compute_column_stats(self.datasets[name], columns)
+            self.stats_cache = {k: v for k, v in self.stats_cache.items() if k[0] != name or k[1] == key[1]}
+            self.stats_cache[key] = stats
+        return stats
+    
+    def correlation(self, name, method='pearson', exact=False):
+        key = (name, self.dataset_versions.get(name, 0), method, False)
+        if self._use_sample(self.correlation_cache, key, exact):
+            key = key[:3] + (True,)
+        correlation = self.correlation_cache.get(key)
+        if correlation is None:
+            columns = self.get_profile(name)['numeric_cols']
+            if key[3]:
+                sample = self.sample(name)
+                correlation = compute_correlation(sample, columns, method)
+                correlation.update({'approximate': True, 'sample_rows': len(sample), 'confidence': APPROX_CONFIDENCE,
+                                    'intervals': [correlation_interval(r, len(sample)) for _, _, r in correlation['top_pairs']]})
+            else:
+                correlation = compute_correlation(self.datasets[name], columns, method)
+            self.correlation_cache = {k: v for k, v in self.correlation_cache.items() if k[0] != name or k[1] == key[1]}
+            self.correlation_cache[key] = correlation
+        return correlation
+    
+    def dangers(self, name, isolation_forest=False, exact=False):
+        key = (name, self.dataset_versions.get(name, 0), isolation_forest, False)
+        if self._use_sample(self.danger_cache, key, exact):
+            key = key[:3] + (True,)
+        dangers = self.danger_cache.get(key)
+        if dangers is None:
+            df = self.sample(name) if key[3] else self.datasets[name]
+            dangers = scan_dangers(lambda: iter_frame_chunks(df), self.get_profile(name)['numeric_cols'], isolation_forest=isolation_forest)
+            if key[3]:
+                # Posições da amostra -> linhas do bloco inteiro
+                positions = df.index.to_numpy()
+                for col in dangers['columns']:
+                    col['worst_rows'] = [int(positions[row]) for row in col['worst_rows']]
+                dangers['duplicate_examples'] = [int(positions[row]) for row in dangers['duplicate_examples']]
+                if dangers['isolation']:
+                    dangers['isolation']['worst_rows'] = [int(positions[row]) for row in dangers['isolation']['worst_rows']]
+                dangers.update({'approximate': True, 'sample_rows': len(df), 'population_rows': len(self.datasets[name])})
+            self.danger_cache = {k: v for k, v in self.danger_cache.items() if k[0] != name or k[1] == key[1]}
+            self.danger_cache[key] = dangers
+        return dangers
+    
+    def compute_exact(self, name, methods=('pearson',), isolation_forest=False):
+        # Passe completo que substitui as estimativas do modo aproximado no cache
+        start_time = time.perf_counter()
+        self.column_stats(name, exact=True)
+        if len(self.get_profile(name)['numeric_cols']) >= 2:
+            for method in methods:
+                self.correlation(name, method, exact=True)
+        self.dangers(name, isolation_forest, exact=True)
+        return time.perf_counter() - start_time
+    
+    def profile_report(self, name, stats=True, correlation=False, dangers=False, exact=True):
+        report = {'dataset': name, 'profile': self.get_profile(name)}
+        if stats:
+            column_stats = self.column_stats(name, exact)
+            report['stats'] = {'table': column_stats['table'], 'elapsed': column_stats['elapsed'],
+                               'approximate': column_stats.get('approximate', False)}
+        if correlation and len(report['profile']['numeric_cols']) >= 2:
+            result = self.correlation(name, exact=exact)
+            report['correlation'] = {'method': result['method'], 'top_pairs': result['top_pairs'], 'elapsed': result['elapsed']}
+        if dangers:
+            report['dangers'] = self.dangers(name, exact=exact)
+        return report
+    
+    def unique_model_name(self, base_name, taken=()):
+        taken = set(self.models) | set(taken)
+        index = len(self.models) + 1
+        while f"{base_name}_{index}" in taken:
+            index += 1
+        return f"{base_name}_{index}"
+    
+    def feature_matrix(self, name, features, target):
+        return self.feature_matrices.get(name, self.dataset_versions.get(name, 0), self.datasets[name], features, target)
+    
+    def training_spec(self, name, features, target, algorithm, params):
+        return training_spec_from_matrix(self.feature_matrix(name, features, target), algorithm, params)
+    
+    def train(self, name, target, features=None, algorithm='RandomForest', params=None, model_name=None):
+        # Forja síncrona (CLI/lote); o app usa a mesma spec via TrainingJobQueue
+        if features is None:
+            features = [col for col in self.get_profile(name)['numeric_cols'] if col != target]
+        if params is None and algorithm in GOLEM_TYPES:
+            params = dict(GOLEM_TYPES[algorithm][1])
+        elif params is None:
+            params = {'n_estimators': 100, 'random_state': 42} if algorithm == 'ExtraTrees' else {}
+        result = fit_golem(self.training_spec(name, features, target, algorithm, params))
+        model_name = model_name or self.unique_model_name(f"Golem_{name}")
+        self.models[model_name] = {
+            'dataset': name, 'target': target, 'features': list(features), 'algorithm': algorithm, 'params': params,
+            'model': result['model'], 'metrics': result['metrics'], 'created': datetime.datetime.now(),
+            'training_time': result['training_time'], 'cpu_time': result['cpu_time'], 'model_bytes': result['model_bytes']
+        }
+        self.models[model_name].update({key: result[key] for key in TRAINING_RESULT_KEYS + ('params',) if key in result})
+        return model_name, self.models[model_name]
+    
+    def get_model_estimator(self, model_name):
+        model_info = self.models[model_name]
+        if model_info.get('model') is None and model_info.get('model_path'):
+            model_info['model'] = self.model_store.load_estimator(model_info)
+        return model_info.get('model')
+    
+    def create_incremental(self, name, target, features=None, params=None, model_name=None):
+        # Registra o Golem vazio; quem chama decide quando alimentá-lo (seed_incremental ou ingestão)
+        if features is None:
+            features = [col for col in self.get_profile(name)['numeric_cols'] if col != target]
+        model_name = model_name or self.unique_model_name(f"Golem_Incremental_{name}")
+        golem = IncrementalGolem(features, target, params,
+                                 checkpoint_path=os.path.join(INCREMENTAL_DIR, golem_filename(model_name)))
+        self.models[model_name] = {
+            'dataset': name, 'target': target, 'features': list(features), 'algorithm': 'Incremental', 'params': golem.params,
+            'model': golem, 'metrics': golem.metrics(), 'created': datetime.datetime.now(), 'training_time': 0.0,
+            'feed_on_ingest': True
+        }
+        return model_name, golem
+    
+    def seed_incremental(self, model_name, cancel_event=None, progress=None):
+        golem = self.get_model_estimator(model_name)
+        df = self.datasets[self.models[model_name]['dataset']]
+        chunks = ((chunk, min((start + len(chunk)) / max(len(df), 1), 1.0))
+                  for start, chunk in zip(range(0, len(df), INCREMENTAL_CHUNK_ROWS), iter_frame_chunks(df, INCREMENTAL_CHUNK_ROWS)))
+        return feed_incremental_golem(golem, chunks, cancel_event, progress)
+    
+    def feed_incremental(self, model_name, path, cancel_event=None, progress=None):
+        # Só features + alvo são lidos; nenhum chunk sobrevive à própria iteração
+        golem = self.get_model_estimator(model_name)
+        chunks = iter_file_chunks(path, INCREMENTAL_CHUNK_ROWS, columns=golem.features + [golem.target])
+        return feed_incremental_golem(golem, chunks, cancel_event, progress)
+    
+    def refresh_incremental(self, model_name):
+        info = self.models[model_name]
+        golem = info['model']
+        info.update({'metrics': golem.metrics(), 'training_time': golem.fit_seconds, 'model_bytes': estimator_nbytes(golem),
+                     'rows_seen': golem.rows_seen})
+        # O estimador mudou no lugar (mesmo id): sem isto o autosave acharia o arquivo em disco atual
+        info.pop('_model_file_id', None)
+        return info
+    
+    def incremental_feeders(self):
+        feeders = {}
+        for name, info in list(self.models.items()):
+            if info.get('algorithm') != 'Incremental' or not info.get('feed_on_ingest', True):
+                continue
+            try:
+                golem = self.get_model_estimator(name)
+            except Exception:
+                continue
+            if golem is not None:
+                feeders[name] = golem
+        return feeders
+    
+    def folds_for(self, name, target, n_splits=TOURNAMENT_FOLDS):
+        # Mesmos índices de fold para todos os Golems do bloco/alvo; posições relativas às linhas com alvo
+        key = (name, self.dataset_versions.get(name, 0), target, n_splits)
+        folds = self.fold_cache.get(key)
+        if folds is None:
+            valid = np.flatnonzero(self.datasets[name][target].notna().to_numpy())
+            folds = (valid, kfold_indices(len(valid), n_splits))
+            self.fold_cache = {k: v for k, v in self.fold_cache.items() if k[0] != name or k[1] == key[1]}
+            self.fold_cache[key] = folds
+        return key, folds
+    
+    def tournament(self, model_names, n_splits=TOURNAMENT_FOLDS, workers=TOURNAMENT_WORKERS, progress=None):
+        # Reavalia os Golems com K-fold nos mesmos folds; (Golem x fold) roda em paralelo e as
+        # previsões de cada fold ficam em cache por versão do bloco, então repetir o torneio é imediato.
+        start_time = time.perf_counter()
+        results = {}
+        groups = {}
+        for model_name in model_names:
+            info = self.models[model_name]
+            if info['dataset'] not in self.datasets:
+                results[model_name] = {'error': f"bloco '{info['dataset']}' não carregado"}
+            elif info['target'] not in self.datasets[info['dataset']].columns:
+                results[model_name] = {'error': f"alvo '{info['target']}' ausente no bloco"}
+            else:
+                groups.setdefault((info['dataset'], info['target']), []).append(model_name)
+        
+        tasks = []
+        pending = {}
+        scheduled = set(self.fold_predictions)
+        for (name, target), names in groups.items():
+            fold_key, (valid, folds) = self.folds_for(name, target, n_splits)
+            y = self.datasets[name][target].to_numpy(dtype=np.float64, na_value=np.nan)[valid]
+            for model_name in names:
+                info = self.models[model_name]
+                params = info.get('params') or {}
+                prediction_key = fold_key + (info['algorithm'], json.dumps(params, sort_keys=True, default=str), tuple(info['features']))
+                pending[model_name] = (prediction_key, y, folds)
+                if prediction_key in scheduled:
+                    continue
+                scheduled.add(prediction_key)
+                # Mesma matriz da forja: as linhas dos folds são traduzidas para a ordem treino|teste dela
+                matrix = self.feature_matrix(name, info['features'], target)
+                rows = matrix['positions'][valid]
+                for fold, (train_index, test_index) in enumerate(folds):
+                    tasks.append((model_name, prediction_key, fold, info['algorithm'], params, matrix['X'], matrix['y'],
+                                  rows[train_index], rows[test_index]))
+        
+        fold_results = {}
+        cached = {model_name: key in self.fold_predictions for model_name, (key, _, _) in pending.items()}
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="torneio") as pool:
+            futures = {pool.submit(_fit_fold, *task[3:]): task for task in tasks}
+            for done, future in enumerate(futures, 1):
+                model_name, prediction_key, fold = futures[future][:3]
+                try:
+                    fold_results.setdefault(prediction_key, {})[fold] = future.result()
+                except Exception as e:
+                    results[model_name] = {'error': str(e)}
+                if progress:
+                    progress(done, len(tasks))
+        for key, by_fold in fold_results.items():
+            if len(by_fold) == len(self.fold_cache[key[:4]][1]):
+                self.fold_predictions[key] = [by_fold[fold] for fold in sorted(by_fold)]
+        self.fold_predictions = {k: v for k, v in self.fold_predictions.items() if k[:4] in self.fold_cache}
+        
+        for model_name, (prediction_key, y, folds) in pending.items():
+            if model_name in results or prediction_key not in self.fold_predictions:
+                results.setdefault(model_name, {'error': "folds com erro"})
+                continue
+            summary = summarize_folds(y, folds, self.fold_predictions[prediction_key])
+            summary.update({'dataset': prediction_key[0], 'target': prediction_key[2], 'cached': cached[model_name], 'rows': len(y)})
+            results[model_name] = summary
+        return {'results': results, 'folds': n_splits, 'tasks': len(tasks), 'elapsed': time.perf_counter() - start_time}
+    
+    def export_dataset(self, name, directory, file_format='csv'):
+        filename = os.path.join(directory, f"block_{clean_filename(name)}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.{file_format}")
+        if file_format == 'parquet':
+            self.datasets[name].to_parquet(filename, index=False, compression='zstd')
+        else:
+            self.datasets[name].to_csv(filename, index=False, encoding='utf-8')
+        return filename
+    
+    def export_models(self, directory):
+        return self.model_store.save(directory, self.models)
+    
+    def load_models(self, directory):
+        loaded = self.model_store.load_index(directory)
+        self.models.update({name: info for name, info in loaded.items() if name not in self.models})
+        return list(loaded)
+    
+    def predict_file(self, model_name, source, output, chunk_rows=PREDICT_CHUNK_ROWS, workers=PREDICT_WORKERS):
+        model_info = self.models[model_name]
+        return predict_file(self.get_model_estimator(model_name), model_info['features'], source, output,
+                            f"{model_info['target']}_previsto", chunk_rows, workers)
+
+
+class UIDispatcher:
+    # Única porta de entrada dos workers para o Tk: eventos vão para uma fila thread-safe e o
+    # thread do Tk drena tudo a cada UI_DISPATCH_MS, juntando logs num lote e status no mais recente
+    def __init__(self, root, on_logs, on_status, interval_ms=UI_DISPATCH_MS):
+        self.root = root
+        self.on_logs = on_logs
+        self.on_status = on_status
+        self.interval_ms = interval_ms
+        self.events = queue.SimpleQueue()
+        self._running = False
+    
+    def post_log(self, entry):
+        self.events.put(('log', entry))
+    
+    def post_status(self, text):
+        self.events.put(('status', text))
+    
+    def call(self, func, *args):
+        self.events.put(('call', (func, args)))
+    
+    def start(self):
+        if not self._running:
+            self._running = True
+            self.root.after(self.interval_ms, self._drain)
+    
+    def _drain(self):
+        logs = []
+        status = None
+        calls = []
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'log':
+                logs.append(payload)
+            elif kind == 'status':
+                status = payload
+            else:
+                calls.append(payload)
+        # Um callback com erro (ex.: widget já destruído) não pode parar o despacho: cada um roda isolado
+        # e o próximo dreno é sempre reagendado
+        try:
+            if logs:
+                self._invoke(self.on_logs, logs)
+            if status is not None:
+                self._invoke(self.on_status, status)
+            for func, args in calls:
+                self._invoke(func, *args)
+        finally:
+            self.root.after(self.interval_ms, self._drain)
+    
+    @staticmethod
+    def _invoke(func, *args):
+        try:
+            func(*args)
+        except Exception:
+            logging.getLogger("bigminingcraft.activity").exception("❌ Erro num callback da UI (%s)", getattr(func, '__name__', func))
+
+
+def activity_file_logger(path=LOG_FILE):
+    # Registro completo em disco, com rotação; o widget só guarda as últimas LOG_MAX_LINES linhas
+    logger = logging.getLogger("bigminingcraft.activity")
+    if not logger.handlers:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(path, maxBytes=LOG_FILE_MAX_MB * 1024 * 1024,
+                                                           backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        except OSError:
+            logger.addHandler(logging.NullHandler())
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def log_tag_for(message):
+    if "✅" in message:
+        return "success"
+    if "❌" in message:
+        return "error"
+    if "⛏️" in message or "🧱" in message:
+        return "mine"
+    return "plain"
+
+
+class FigureManager:
+    # Um Figure (sem pyplot) por slot de view: reaproveitado entre visitas, redesenhado só quando a
+    # chave de dados muda e desanexado do Tk quando a view é destruída
+    def __init__(self, on_change=None):
+        self.slots = {}
+        self.on_change = on_change
+    
+    def show(self, slot, master, key, draw, figsize=(10, 6), **pack_options):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        entry = self.slots.get(slot)
+        if entry is not None and entry['figsize'] != figsize:
+            self.release(slot)
+            entry = None
+        if entry is None:
+            entry = {'figure': Figure(figsize=figsize, facecolor='#3A3A3A'), 'canvas': None, 'key': None, 'figsize': figsize}
+            self.slots[slot] = entry
+        figure = entry['figure']
+        stale = entry['key'] != key
+        if stale:
+            figure.clear()
+            draw(figure)
+            entry['key'] = key
+        
+        canvas = entry['canvas']
+        if canvas is None or not canvas.get_tk_widget().winfo_exists() or canvas.get_tk_widget().master is not master:
+            self._detach(entry)
+            canvas = FigureCanvasTkAgg(figure, master=master)
+            canvas.get_tk_widget().pack(**(pack_options or {'fill': tk.BOTH, 'expand': True, 'padx': 10, 'pady': 10}))
+            canvas.draw()
+            entry['canvas'] = canvas
+        elif stale:
+            canvas.draw_idle()
+        self._changed()
+        return canvas
+    
+    def _detach(self, entry):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        canvas = entry['canvas']
+        if canvas is None:
+            return
+        widget = canvas.get_tk_widget()
+        if widget.winfo_exists():
+            widget.destroy()
+        # Troca o canvas Tk por um Agg para soltar a PhotoImage junto com o widget
+        FigureCanvasAgg(entry['figure'])
+        entry['canvas'] = None
+    
+    def collect(self):
+        # Chamado no teardown das views: desanexa os slots cujo widget já foi destruído
+        for entry in self.slots.values():
+            if entry['canvas'] is not None and not entry['canvas'].get_tk_widget().winfo_exists():
+                self._detach(entry)
+        self._changed()
+    
+    def release(self, slot, master=None):
+        # Com master, só libera se o slot ainda estiver anexado a ele (outra janela pode ter assumido o slot)
+        entry = self.slots.get(slot)
+        if entry is not None and master is not None and (entry['canvas'] is None or entry['canvas'].get_tk_widget().master is not master):
+            return
+        entry = self.slots.pop(slot, None)
+        if entry is not None:
+            self._detach(entry)
+            entry['figure'].clear()
+        self._changed()
+    
+    def release_all(self):
+        for slot in list(self.slots):
+            self.release(slot)
+    
+    def nbytes(self):
+        # Buffer RGBA do Agg + a PhotoImage do Tk quando o slot está anexado
+        total = 0
+        for entry in self.slots.values():
+            width, height = entry['figure'].get_size_inches() * entry['figure'].dpi
+            total += int(width * height * 4) * (2 if entry['canvas'] is not None else 1)
+        return total
+    
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change(len(self.slots), sum(entry['canvas'] is not None for entry in self.slots.values()), self.nbytes())
+
+
+class VirtualDataGrid:
+    # Grade virtualizada: a Treeview tem só GRID_VISIBLE_ROWS itens fixos e cada rolagem reescreve os
+    # valores com df.iloc da janela visível; a ordenação é um argsort cacheado por coluna
+    def __init__(self, parent, df, run_async=None, visible_rows=GRID_VISIBLE_ROWS, max_columns=GRID_MAX_COLUMNS):
+        self.df = df
+        self.run_async = run_async
+        self.visible_rows = visible_rows
+        self.max_columns = max_columns
+        self.offset = 0
+        self.order = None
+        self.sort_column = None
+        self.ascending = True
+        self._orders = {}
+        self.all_columns = list(df.columns)
+        self.filtered_columns = self.all_columns
+        # Posições inteiras das colunas filtradas (paralelas a filtered_columns): refresh projeta por posição
+        self.filtered_positions = list(range(len(self.all_columns)))
+        self._column_positions = []
+        self.column_page = 0
+        
+        self.frame = ttk.Frame(parent, style="Card.TFrame")
+        self.frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        control_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        control_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(control_frame, text="🧭 Colunas:", background="#3A3A3A", foreground="#E6D3A7", font=("Courier", 10)).pack(side=tk.LEFT, padx=5)
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(control_frame, textvariable=self.filter_var, width=20)
+        filter_entry.pack(side=tk.LEFT, padx=5)
+        filter_entry.bind("<Return>", lambda event: self.apply_column_filter())
+        ttk.Button(control_frame, text="🔎", command=self.apply_column_filter, style="Accent.TButton", width=3).pack(side=tk.LEFT, padx=2)
+        ttk.Button(control_frame, text="◀", command=lambda: self.shift_columns(-1), style="Accent.TButton", width=3).pack(side=tk.LEFT, padx=2)
+        ttk.Button(control_frame, text="▶", command=lambda: self.shift_columns(1), style="Accent.TButton", width=3).pack(side=tk.LEFT, padx=2)
+        self.info_var = tk.StringVar()
+        ttk.Label(control_frame, textvariable=self.info_var, background="#3A3A3A", foreground="#B8860B", font=("Courier", 10)).pack(side=tk.RIGHT, padx=5)
+        
+        grid_frame = ttk.Frame(self.frame, style="Card.TFrame")
+        grid_frame.pack(fill=tk.BOTH, expand=True)
+        self.scrollbar = ttk.Scrollbar(grid_frame, command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree = ttk.Treeview(grid_frame, show="headings", height=visible_rows)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree.tag_configure('even', background='#3A3A3A')
+        self.tree.tag_configure('odd', background='#424242')
+        self.items = [self.tree.insert("", tk.END, values=(), tags=('even' if i % 2 == 0 else 'odd',)) for i in range(visible_rows)]
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_wheel)
+        for sequence, step in (("<Next>", visible_rows), ("<Prior>", -visible_rows), ("<Down>", 1), ("<Up>", -1)):
+            self.tree.bind(sequence, lambda event, step=step: self.scroll_to(self.offset + step) or "break")
+        self.tree.bind("<Home>", lambda event: self.scroll_to(0) or "break")
+        self.tree.bind("<End>", lambda event: self.scroll_to(len(self.df)) or "break")
+        
+        self.set_columns()
+    
+    @property
+    def columns(self):
+        start = self.column_page * self.max_columns
+        return self.filtered_columns[start:start + self.max_columns]
+    
+    def apply_column_filter(self):
+        text = self.filter_var.get().strip().lower()
+        self.filtered_positions = [i for i, col in enumerate(self.all_columns) if text in str(col).lower()] if text else list(range(len(self.all_columns)))
+        self.filtered_columns = [self.all_columns[i] for i in self.filtered_positions]
+        self.column_page = 0
+        self.set_columns()
+    
+    def shift_columns(self, step):
+        pages = max(1, math.ceil(len(self.filtered_columns) / self.max_columns))
+        self.column_page = min(max(0, self.column_page + step), pages - 1)
+        self.set_columns()
+    
+    def set_columns(self):
+        start = self.column_page * self.max_columns
+        self._column_positions = self.filtered_positions[start:start + self.max_columns]
+        columns = ["#"] + [str(col) for col in self.columns]
+        self.tree["columns"] = columns
+        self.tree.heading("#", text="#")
+        self.tree.column("#", width=90, anchor=tk.E, stretch=False)
+        for col, label in zip(self.columns, columns[1:]):
+            arrow = (" ▲" if self.ascending else " ▼") if col == self.sort_column else ""
+            self.tree.heading(label, text=label[:15] + arrow, command=lambda col=col: self.sort_by(col))
+            self.tree.column(label, width=110, anchor=tk.CENTER)
+        self.refresh()
+    
+    def sort_by(self, column):
+        ascending = not self.ascending if column == self.sort_column else True
+        key = (column, ascending)
+        
+        def apply(order):
+            self._orders[key] = order
+            if not self.tree.winfo_exists():
+                return
+            self.order, self.sort_column, self.ascending = order, column, ascending
+            self.set_columns()
+        
+        if key in self._orders:
+            apply(self._orders[key])
+        elif self.run_async is not None:
+            self.info_var.set(f"⏳ Ordenando por {column}...")
+            self.run_async(lambda: self._argsort(column, ascending), apply)
+        else:
+            apply(self._argsort(column, ascending))
+    
+    def _argsort(self, column, ascending):
+        series = self.df[column].reset_index(drop=True)
+        return series.sort_values(ascending=ascending, na_position='last', kind='stable').index.to_numpy()
+    
+    def on_scroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * len(self.df)))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll_to(self.offset + int(amount) * step)
+    
+    def on_wheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.offset - 3)
+        else:
+            self.scroll_to(self.offset + 3)
+        return "break"
+    
+    def scroll_to(self, offset):
+        self.offset = min(max(0, offset), max(0, len(self.df) - self.visible_rows))
+        self.refresh()
+    
+    def refresh(self):
+        n_rows = len(self.df)
+        stop = min(self.offset + self.visible_rows, n_rows)
+        positions = np.arange(self.offset, stop) if self.order is None else self.order[self.offset:stop]
+        # Linhas e colunas numa única seleção posicional: só a janela visível é materializada
+        window = self.df.iloc[positions, self._column_positions]
+        labels = window.index.tolist()
+        cells = window.to_numpy(dtype=object)
+        for i, iid in enumerate(self.items):
+            if i < len(cells):
+                values = [labels[i]] + [str(value)[:GRID_CELL_CHARS] for value in cells[i]]
+            else:
+                values = []
+            self.tree.item(iid, values=values)
+        if n_rows:
+            self.scrollbar.set(self.offset / n_rows, stop / n_rows)
+        sort_info = f" | ordenado por {self.sort_column}" if self.sort_column is not None else ""
+        col_start = self.column_page * self.max_columns
+        self.info_var.set(f"linhas {self.offset + 1 if n_rows else 0:,}-{stop:,} de {n_rows:,} | colunas {col_start + 1 if self.columns else 0}-{col_start + len(self.columns)} de {len(self.filtered_columns)}{sort_info}")
+
 
 class MinecraftBigDataApp:
-    def __init__(self, root):
+    def __init__(self, root, startup_timing=False):
+        self.startup_timing = startup_timing
+        self.startup_phases = [("importações", IMPORTS_DONE - STARTUP_T0)]
+        self._phase_start = time.perf_counter()
         self.root = root
         self.root.title("⛏️ Minecraft Data Miner & AutoML - 2026")
         self.root.geometry("1400x900")
         self.root.state('zoomed')
-        self.datasets = {}
-        self.models = {}
+        # O app é um cliente fino do MiningEngine: os dicionários abaixo são os do motor
+        self.engine = MiningEngine()
+        self.datasets = self.engine.datasets
+        self.dataset_versions = self.engine.dataset_versions
+        self.profiles = self.engine.profiles
+        self.model_store = self.engine.model_store
+        self.models = self.engine.models
         self.current_dataset = None
         self.current_model = None
+        self.ingestion = DataIngestionEngine()
+        self.ingest_rows = {}
+        self._ingest_polling = False
+        self.predictor = BatchPredictor()
+        self._predict_polling = False
+        self.training = TrainingJobQueue()
+        self._training_polling = False
+        self.background = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mine")
+        self.scatter_cache = {}
         
         # Inicializar status_var PRIMEIRO
         self.status_var = tk.StringVar(value="⛏️ Sistema iniciado - Pronto para minerar dados!")
+        self.log_lines = collections.deque(maxlen=LOG_MAX_LINES)
+        self.activity_log = activity_file_logger()
+        self.dispatcher = UIDispatcher(root, self._flush_log, self.status_var.set)
+        self.dispatcher.start()
+        self.compact_on_load = tk.BooleanVar(value=COMPACT_ON_LOAD)
+        self.figures_var = tk.StringVar(value="🖼️ 0 figuras")
+        self.figures = FigureManager(on_change=lambda count, attached, nbytes: self.figures_var.set(
+            f"🖼️ {count} figuras ({attached} na tela) | {nbytes / (1024 * 1024):.1f} MB"))
+        self._mark_startup("motor e filas")
         self.setup_minecraft_styles()
+        self._mark_startup("estilos e fundo")
         self.build_interface()
         self.create_status_bar()
+        self._mark_startup("interface")
         # MOVER load_example_data() PARA DEPOIS DE CRIAR A INTERFACE
         # pois self.log_text é criado em show_dashboard()
         self.setup_auto_save()
+        self.load_stable_models()
+        self._mark_startup("auto-save e estábulo")
         self.load_example_data()
+        self._mark_startup("blocos de exemplo")
+        self.root.after_idle(self._report_startup)
+
+    def _mark_startup(self, phase):
+        now = time.perf_counter()
+        self.startup_phases.append((phase, now - self._phase_start))
+        self._phase_start = now
+
+    def _report_startup(self):
+        self._mark_startup("primeiro desenho")
+        total = time.perf_counter() - STARTUP_T0
+        self.log_activity(f"⏱️ Mundo aberto em {total:.2f}s")
+        if self.startup_timing:
+            for phase, seconds in self.startup_phases:
+                print(f"{phase:<24}{seconds * 1000:>10.1f} ms")
+            print(f"{'total':<24}{total * 1000:>10.1f} ms")
 
     def setup_minecraft_styles(self):
         style = ttk.Style()
@@ -145,16 +3209,10 @@ class MinecraftBigDataApp:
     def draw_minecraft_background(self):
         canvas = self.bg_canvas
         canvas.delete("all")
-        pixel_size = 16
-        block_colors = ["#3A3A3A", "#4A4A4A", "#2F2F2F", "#363636"]
         width = self.root.winfo_screenwidth()
         height = self.root.winfo_screenheight()
-        
-        for y in range(0, height, pixel_size):
-            for x in range(0, width, pixel_size):
-                if np.random.random() < 0.15:
-                    color = np.random.choice(block_colors)
-                    canvas.create_rectangle(x, y, x + pixel_size, y + pixel_size, fill=color, outline="")
+        self.bg_image = tk.PhotoImage(data=minecraft_background_ppm(width, height), format='PPM')
+        canvas.create_image(0, 0, image=self.bg_image, anchor="nw")
 
     def build_interface(self):
         main_frame = ttk.Frame(self.root, style="Main.TFrame")
@@ -215,6 +3273,14 @@ class MinecraftBigDataApp:
         ttk.Label(food_frame, text=" Dados carregados:", style="Subheader.TLabel").pack(side=tk.LEFT)
         ttk.Label(food_frame, textvariable=self.status_var, style="Subheader.TLabel", foreground="#4CAF50").pack(side=tk.LEFT, padx=5)
         
+        ingest_frame = ttk.Frame(status_frame, style="Main.TFrame")
+        ingest_frame.pack(side=tk.LEFT, padx=10)
+        self.ingest_progress = ttk.Progressbar(ingest_frame, length=140, mode='determinate', style="Success.Horizontal.TProgressbar")
+        self.ingest_progress.pack(side=tk.LEFT, padx=5)
+        self.ingest_rate_var = tk.StringVar(value="")
+        ttk.Label(ingest_frame, textvariable=self.ingest_rate_var, style="Subheader.TLabel").pack(side=tk.LEFT)
+        ttk.Label(status_frame, textvariable=self.figures_var, style="Subheader.TLabel").pack(side=tk.LEFT, padx=10)
+        
         xp_frame = ttk.Frame(status_frame, style="Main.TFrame")
         xp_frame.pack(side=tk.RIGHT, padx=15)
         ttk.Label(xp_frame, text="XP:", style="Subheader.TLabel").pack(side=tk.LEFT)
@@ -264,35 +3330,36 @@ class MinecraftBigDataApp:
             map_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             ttk.Label(map_frame, text="🗺️ Mapa das Minas de Dados", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
             
-            fig, ax = plt.subplots(figsize=(12, 6), facecolor='#3A3A3A')
-            fig.patch.set_facecolor('#3A3A3A')
-            ax.set_facecolor('#2F2F2F')
-            
             datasets = list(self.datasets.keys())
             sizes = [len(df) for df in self.datasets.values()]
-            minecraft_colors = ['#8B4513', '#556B2F', '#A0522D', '#D2691E', '#CD853F', '#F4A460']
-            
-            bars = ax.bar(datasets, sizes, color=minecraft_colors[:len(datasets)])
-            for i, bar in enumerate(bars):
-                height = bar.get_height()
-                ax.annotate(f'{height:,}', xy=(bar.get_x() + bar.get_width() / 2, height), xytext=(0, 3),
-                           textcoords="offset points", ha='center', va='bottom', fontsize=10, color='#FFD700')
-                bar.set_hatch(['/', '\\', '|', '-', '+', 'x'][i % 6] * 2)
             
-            ax.set_title('Distribuição de Blocos de Dados', color='#FFD700', fontsize=14, pad=20)
-            ax.set_xlabel('Minas (Datasets)', color='#E6D3A7', fontsize=12)
-            ax.set_ylabel('Quantidade de Blocos', color='#E6D3A7', fontsize=12)
-            ax.tick_params(axis='x', colors='#E6D3A7')
-            ax.tick_params(axis='y', colors='#E6D3A7')
-            ax.grid(True, alpha=0.3, color='#555555', linestyle='--')
-            plt.xticks(rotation=45, ha='right')
-            
-            ax.legend(['Blocos de Dados'], loc='upper right', facecolor='#3A3A3A', edgecolor='#808080', labelcolor='#FFD700')
-            plt.tight_layout()
+            def draw(fig):
+                ax = fig.add_subplot(111)
+                ax.set_facecolor('#2F2F2F')
+                minecraft_colors = ['#8B4513', '#556B2F', '#A0522D', '#D2691E', '#CD853F', '#F4A460']
+                
+                bars = ax.bar(datasets, sizes, color=minecraft_colors[:len(datasets)])
+                for i, bar in enumerate(bars):
+                    height = bar.get_height()
+                    ax.annotate(f'{height:,}', xy=(bar.get_x() + bar.get_width() / 2, height), xytext=(0, 3),
+                               textcoords="offset points", ha='center', va='bottom', fontsize=10, color='#FFD700')
+                    bar.set_hatch(['/', '\\', '|', '-', '+', 'x'][i % 6] * 2)
+                
+                ax.set_title('Distribuição de Blocos de Dados', color='#FFD700', fontsize=14, pad=20)
+                ax.set_xlabel('Minas (Datasets)', color='#E6D3A7', fontsize=12)
+                ax.set_ylabel('Quantidade de Blocos', color='#E6D3A7', fontsize=12)
+                ax.tick_params(axis='x', colors='#E6D3A7')
+                ax.tick_params(axis='y', colors='#E6D3A7')
+                ax.grid(True, alpha=0.3, color='#555555', linestyle='--')
+                for label in ax.get_xticklabels():
+                    label.set_rotation(45)
+                    label.set_ha('right')
+                
+                ax.legend(['Blocos de Dados'], loc='upper right', facecolor='#3A3A3A', edgecolor='#808080', labelcolor='#FFD700')
+                fig.tight_layout()
             
-            canvas = FigureCanvasTkAgg(fig, master=map_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            key = tuple((name, self.dataset_versions.get(name, 0)) for name in datasets)
+            self.figures.show('dashboard', map_frame, key, draw, figsize=(12, 6))
         
         log_frame = ttk.Frame(dashboard_frame, style="Card.TFrame", borderwidth=2, relief="solid")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -306,9 +3373,13 @@ class MinecraftBigDataApp:
         self.log_text.insert(tk.END, "⛏️ Bem-vindo ao Minecraft Data Miner!\n")
         self.log_text.insert(tk.END, "📝 Sistema iniciado com sucesso...\n")
         self.log_text.insert(tk.END, "📊 Pronto para minerar e analisar dados!\n")
-        self.log_text.config(state=tk.DISABLED)
         self.log_text.tag_configure("page", background="#3A312A")
         self.log_text.tag_add("page", "1.0", "end")
+        self.log_text.tag_configure("success", foreground="#4CAF50")
+        self.log_text.tag_configure("error", foreground="#F44336")
+        self.log_text.tag_configure("mine", foreground="#8B4513")
+        self._insert_log_entries(list(self.log_lines))
+        self.log_text.config(state=tk.DISABLED)
         
         self.status_var.set(f"🏠 Casa da Mineração | Blocos: {len(self.datasets)} | Golems: {len(self.models)}")
         self.log_activity("🏠 Entrou na Casa da Mineração de Dados")
@@ -326,12 +3397,25 @@ class MinecraftBigDataApp:
         btn_frame = ttk.Frame(control_frame, style="Main.TFrame")
         btn_frame.pack(side=tk.LEFT)
         ttk.Button(btn_frame, text="➕ Adicionar Blocos", command=self.load_data, style="Accent.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="📁 Minerar Shards", command=self.load_shards, style="Accent.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="🔎 Minerar com Filtro", command=self.load_data_filtered, style="Accent.TButton", width=18).pack(side=tk.LEFT, padx=3, pady=2)
         ttk.Button(btn_frame, text="🗑️ Remover Blocos", command=self.remove_selected_dataset, style="Danger.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
         ttk.Button(btn_frame, text="🔄 Recarregar Baú", command=lambda: self.show_datasets(), style="Accent.TButton", width=13).pack(side=tk.LEFT, padx=3, pady=2)
         ttk.Button(btn_frame, text="🔍 Analisar Blocos", command=self.quick_analysis_selected, style="Success.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="📜 Navegar Blocos", command=self.browse_selected_dataset, style="Accent.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="🗜️ Compactar Blocos", command=self.compact_selected_dataset, style="Accent.TButton", width=18).pack(side=tk.LEFT, padx=3, pady=2)
         
         ttk.Button(control_frame, text="💎 Salvar Baú Completo", command=self.save_all_datasets, style="Success.TButton", width=22).pack(side=tk.RIGHT, padx=5, pady=2)
         
+        self.ingest_rows = {}
+        active_jobs = self.ingestion.active_jobs()
+        if active_jobs:
+            ingest_frame = ttk.Frame(datasets_frame, style="Card.TFrame", borderwidth=2, relief="solid")
+            ingest_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+            ttk.Label(ingest_frame, text="⏳ Minerações em Andamento", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
+            for job in active_jobs:
+                self._add_ingest_row(ingest_frame, job)
+        
         columns = ("ID", "Nome", "Blocos", "Dimensões", "Tipo", "Vazios", "Última Mineração", "Peso (MB)", "Status", "Origem")
         tree_frame = ttk.Frame(datasets_frame, style="Card.TFrame", borderwidth=2, relief="solid")
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -363,12 +3447,13 @@ class MinecraftBigDataApp:
         scrollbar.config(command=self.datasets_tree.yview)
         
         for i, (name, df) in enumerate(self.datasets.items(), 1):
-            rows, cols = df.shape
-            null_count = df.isnull().sum().sum()
-            null_percentage = (null_count / (rows * cols)) * 100 if (rows * cols) > 0 else 0
-            main_dtype = df.dtypes.mode().iloc[0] if not df.dtypes.empty else "N/A"
-            mod_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-            size_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+            profile = self.get_profile(name)
+            rows, cols = profile['rows'], profile['cols']
+            null_count = profile['null_count']
+            null_percentage = profile['null_pct']
+            main_dtype = profile['main_dtype']
+            mod_time = profile['profiled_at'].strftime("%Y-%m-%d %H:%M")
+            size_mb = profile['memory_bytes'] / (1024 * 1024)
             status = "✅ Pronto" if not df.empty else "⚠️ Vazio"
             
             if rows > 10000:
@@ -422,9 +3507,15 @@ class MinecraftBigDataApp:
         ttk.Button(btn_frame, text="⚔️ Destruir Golem", command=self.delete_selected_model, style="Danger.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
         ttk.Button(btn_frame, text="🔄 Recarregar", command=lambda: self.show_models(), style="Accent.TButton", width=13).pack(side=tk.LEFT, padx=3, pady=2)
         ttk.Button(btn_frame, text="🏆 Torneio Golems", command=self.compare_selected_models, style="Success.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="🔮 Prever", command=self.predict_with_selected_model, style="Accent.TButton", width=12).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="🌱 Golem Incremental", command=self.create_incremental_golem, style="Accent.TButton", width=19).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="🍖 Alimentar Golem", command=self.feed_selected_golem, style="Accent.TButton", width=17).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="📂 Abrir Estábulo", command=self.open_models_store, style="Accent.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
         
         ttk.Button(control_frame, text="💎 Salvar Estábulo Completo", command=self.save_all_models, style="Success.TButton", width=22).pack(side=tk.RIGHT, padx=5, pady=2)
         
+        self._build_jobs_panel(models_frame)
+        
         if not self.models:
             empty_frame = ttk.Frame(models_frame, style="Card.TFrame", borderwidth=2, relief="solid")
             empty_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=50)
@@ -442,7 +3533,7 @@ Nenhum Golem de Ferro treinado ainda!
             ttk.Button(empty_frame, text="⚡ Forjar Golem Agora", command=self.train_new_model, style="Accent.TButton").pack(pady=20)
             return
         
-        columns = ("ID", "Nome", "Origem", "Alvo", "Tipo", "Precisão", "Erro", "Energia", "Blocos", "Criado", "Tempo", "Status", "Ações")
+        columns = ("ID", "Nome", "Origem", "Alvo", "Tipo", "Precisão", "Erro", "Energia", "Blocos", "Criado", "Tempo", "Peso", "Status", "Ações")
         tree_frame = ttk.Frame(models_frame, style="Card.TFrame", borderwidth=2, relief="solid")
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         ttk.Label(tree_frame, text="🏃‍♂️ Golems de Ferro Treinados", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
@@ -457,13 +3548,14 @@ Nenhum Golem de Ferro treinado ainda!
             ("Nome", 110, "w"),
             ("Origem", 85, "center"),
             ("Alvo", 85, "center"),
-            ("Tipo", 100, "center"),
+            ("Tipo", 150, "center"),
             ("Precisão", 70, "center"),
             ("Erro", 70, "center"),
             ("Energia", 70, "center"),
             ("Blocos", 65, "center"),
             ("Criado", 130, "center"),
             ("Tempo", 70, "center"),
+            ("Peso", 75, "center"),
             ("Status", 75, "center"),
             ("Ações", 70, "center")
         ]
@@ -475,55 +3567,55 @@ Nenhum Golem de Ferro treinado ainda!
         self.models_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         scrollbar.config(command=self.models_tree.yview)
         
-        for i, (model_name, model_info) in enumerate(self.models.items(), 1):
-            metrics = model_info['metrics']
-            created = model_info['created'].strftime("%Y-%m-%d %H:%M")
-            training_time = model_info.get('training_time', 'N/A')
-            feature_count = len(model_info['features'])
-            algorithm = model_info.get('algorithm', 'N/A')
-            accuracy = metrics['r2']
-            error = metrics['rmse']
-            energy = metrics['mae']
-            status = "✅ Ativo" if model_info.get('active', True) else "💤 Dormindo"
-            
-            if accuracy > 0.8:
-                status = "💎 Elite"
-            elif accuracy > 0.6:
-                status = "⚡ Forte"
-            else:
-                status = "🪨 Fraco"
-            
-            golem_type = "🛡️ Defensor" if 'regress' in algorithm.lower() else "⚔️ Atacante"
-            
-            self.models_tree.insert("", tk.END, values=(
-                i,
-                model_name[:18] + "..." if len(model_name) > 18 else model_name,
-                model_info['dataset'],
-                model_info['target'],
-                golem_type,
-                f"{accuracy:.3f}",
-                f"{error:.2f}",
-                f"{energy:.2f}",
-                feature_count,
-                created,
-                f"{training_time:.1f}" if isinstance(training_time, (int, float)) else training_time,
-                status,
-                "👁️ Ver"
-            ))
-        
         self.models_tree.tag_configure('even', background='#3A3A3A')
         self.models_tree.tag_configure('odd', background='#424242')
-        for i, item in enumerate(self.models_tree.get_children()):
-            if i % 2 == 0:
-                self.models_tree.item(item, tags=('even',))
-            else:
-                self.models_tree.item(item, tags=('odd',))
+        for model_name, model_info in self.models.items():
+            self._insert_model_row(model_name, model_info)
         
         self.models_tree.bind('<Double-1>', self.show_model_details)
         
         self.status_var.set(f"🏃‍♂️ Estábulo | Total: {len(self.models)} Golems de Ferro treinados")
         self.log_activity("🏃‍♂️ Visitou o estábulo dos Golems de Ferro")
 
+    def _insert_model_row(self, model_name, model_info):
+        i = len(self.models_tree.get_children()) + 1
+        metrics = model_info['metrics']
+        created = model_info['created'].strftime("%Y-%m-%d %H:%M")
+        training_time = model_info.get('training_time', 'N/A')
+        feature_count = len(model_info['features'])
+        algorithm = model_info.get('algorithm', 'N/A')
+        accuracy = metrics['r2']
+        error = metrics['rmse']
+        energy = metrics['mae']
+        status = "✅ Ativo" if model_info.get('active', True) else "💤 Dormindo"
+        
+        if accuracy > 0.8:
+            status = "💎 Elite"
+        elif accuracy > 0.6:
+            status = "⚡ Forte"
+        else:
+            status = "🪨 Fraco"
+        
+        golem_type = GOLEM_TYPES[algorithm][0] if algorithm in GOLEM_TYPES else INCREMENTAL_LABEL if algorithm == 'Incremental' else ("🛡️ Defensor" if 'regress' in algorithm.lower() else "⚔️ Atacante")
+        model_bytes = model_info.get('model_bytes')
+        
+        self.models_tree.insert("", tk.END, values=(
+            i,
+            model_name[:18] + "..." if len(model_name) > 18 else model_name,
+            model_info['dataset'],
+            model_info['target'],
+            golem_type,
+            f"{accuracy:.3f}",
+            f"{error:.2f}",
+            f"{energy:.2f}",
+            feature_count,
+            created,
+            f"{training_time:.1f}" if isinstance(training_time, (int, float)) else training_time,
+            f"{model_bytes/(1024*1024):.2f} MB" if model_bytes else "—",
+            status,
+            "👁️ Ver"
+        ), tags=('even' if i % 2 else 'odd',))
+
     def show_statistical_analysis(self):
         self.clear_content()
         stats_frame = ttk.Frame(self.content_frame, style="Main.TFrame")
@@ -584,6 +3676,16 @@ Nenhum bloco para analisar!
             notebook.add(tab_frame, text=f"{icon} {tab_name}")
         
         ttk.Button(btn_frame, text="🔍 Analisar Completo", command=lambda: self.run_full_statistical_analysis(dataset_var.get(), notebook), style="Success.TButton", width=18).pack(side=tk.LEFT, padx=3, pady=2)
+        approximate_var = tk.BooleanVar(value=self.engine.is_approximate(dataset_var.get()))
+        
+        def toggle_approximate():
+            self.engine.set_approximate(dataset_var.get(), approximate_var.get())
+            self.run_full_statistical_analysis(dataset_var.get(), notebook)
+        
+        ttk.Checkbutton(btn_frame, text="🎲 Modo aproximado", variable=approximate_var, command=toggle_approximate).pack(side=tk.LEFT, padx=3, pady=2)
+        ttk.Button(btn_frame, text="🎯 Calcular Exato", command=lambda: self.compute_exact_analysis(dataset_var.get(), lambda: self.run_full_statistical_analysis(dataset_var.get(), notebook)),
+                   style="Accent.TButton", width=16).pack(side=tk.LEFT, padx=3, pady=2)
+        dataset_combo.bind("<<ComboboxSelected>>", lambda event: approximate_var.set(self.engine.is_approximate(dataset_var.get())))
         ttk.Button(btn_frame, text="📥 Exportar Relatório", command=lambda: self.export_statistical_report(dataset_var.get()), style="Accent.TButton", width=18).pack(side=tk.LEFT, padx=3, pady=2)
         ttk.Button(btn_frame, text="💎 Salvar Análise", command=lambda: self.save_statistical_analysis(dataset_var.get()), style="Success.TButton", width=18).pack(side=tk.LEFT, padx=3, pady=2)
         
@@ -597,51 +3699,297 @@ Nenhum bloco para analisar!
             messagebox.showerror("Erro", f"Bloco '{dataset_name}' não encontrado!")
             return
         
-        df = self.datasets[dataset_name].copy()
+        df = self.datasets[dataset_name]
+        profile = self.get_profile(dataset_name)
         self.status_var.set(f"🔬 Analisando bloco '{dataset_name}'... Isso pode levar alguns minutos.")
+        start_time = time.time()
         
-        def analyze_in_thread():
-            try:
-                start_time = time.time()
-                for tab in notebook.winfo_children():
-                    for widget in tab.winfo_children():
-                        widget.destroy()
-                
-                self._run_descriptive_analysis_minecraft(df, notebook.winfo_children()[0])
-                
-                elapsed_time = time.time() - start_time
-                self.status_var.set(f"✅ Análise do bloco '{dataset_name}' concluída em {elapsed_time:.2f} segundos!")
-                self.log_activity(f"✅ Análise do bloco '{dataset_name}' concluída em {elapsed_time:.2f}s")
-            except Exception as e:
-                self.status_var.set(f"❌ Erro na análise do bloco: {str(e)}")
-                messagebox.showerror("Erro de Análise", f"Ocorreu um erro durante a análise:\n{str(e)}")
+        def render(stats):
+            if not notebook.winfo_exists():
+                return
+            tabs = notebook.winfo_children()
+            for tab in tabs:
+                for widget in tab.winfo_children():
+                    widget.destroy()
+            self._run_descriptive_analysis_minecraft(df, tabs[STATS_TAB_BLOCOS], profile, stats)
+            self._fill_connections_tab(tabs[STATS_TAB_CONEXOES], dataset_name)
+            self._fill_patterns_tab(tabs[STATS_TAB_PADROES], stats)
+            self._fill_dangers_tab(tabs[STATS_TAB_PERIGOS], dataset_name)
+            self._fill_crystals_tab(tabs[STATS_TAB_CRISTAIS], stats)
+            elapsed_time = time.time() - start_time
+            self.status_var.set(f"✅ Análise do bloco '{dataset_name}' concluída em {elapsed_time:.2f} segundos!")
+            self.log_activity(f"✅ Análise do bloco '{dataset_name}' concluída em {elapsed_time:.2f}s (motor: {stats['elapsed']:.2f}s)")
+        
+        def failed(e):
+            self.status_var.set(f"❌ Erro na análise do bloco: {str(e)}")
+            messagebox.showerror("Erro de Análise", f"Ocorreu um erro durante a análise:\n{str(e)}")
+        
+        self.run_in_background(lambda: self.get_column_stats(dataset_name), render, failed)
+
+    def get_column_stats(self, dataset_name, exact=False):
+        return self.engine.column_stats(dataset_name, exact)
+
+    def compute_exact_analysis(self, dataset_name, on_done=None):
+        # Passe completo em background; quando termina, as estimativas da amostra saem do caminho
+        if dataset_name not in self.datasets:
+            return
+        if not self.engine.is_approximate(dataset_name) or self.engine.has_exact(dataset_name):
+            if on_done:
+                on_done()
+            return
+        rows = len(self.datasets[dataset_name])
+        self.status_var.set(f"🎯 Calculando valores exatos de '{dataset_name}' ({rows:,} linhas) em background...")
+        self.log_activity(f"🎯 Passe exato iniciado: {dataset_name} | {rows:,} linhas")
+        
+        def done(elapsed):
+            self.status_var.set(f"🎯 Valores exatos de '{dataset_name}' prontos em {elapsed:.2f}s")
+            self.log_activity(f"🎯 Passe exato concluído: {dataset_name} em {elapsed:.2f}s (estimativas substituídas)")
+            if on_done:
+                on_done()
+        
+        self.run_in_background(lambda: self.engine.compute_exact(dataset_name), done,
+                               lambda e: self.status_var.set(f"❌ Erro no passe exato: {str(e)}"))
+
+    def run_in_background(self, func, on_done, on_error=None):
+        # Executa func num worker e entrega o resultado no thread do Tk via polling
+        future = self.background.submit(func)
+        
+        def check():
+            if not future.done():
+                self.root.after(100, check)
+                return
+            error = future.exception()
+            if error is None:
+                on_done(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                self.log_activity(f"❌ Erro em tarefa de fundo: {str(error)}")
+        
+        self.root.after(100, check)
+        return future
+
+    def _make_table(self, parent, columns, rows, widths=None, height=12):
+        frame = ttk.Frame(parent, style="Card.TFrame", borderwidth=2, relief="solid")
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        scrollbar = ttk.Scrollbar(frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree = ttk.Treeview(frame, columns=columns, show="headings", height=height, yscrollcommand=scrollbar.set)
+        for i, col in enumerate(columns):
+            tree.heading(col, text=col)
+            tree.column(col, width=(widths[i] if widths else 90), anchor="w" if i == 0 else "center")
+        tree.tag_configure('even', background='#3A3A3A')
+        tree.tag_configure('odd', background='#424242')
+        for i, values in enumerate(rows):
+            tree.insert("", tk.END, values=values, tags=('even' if i % 2 == 0 else 'odd',))
+        tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        scrollbar.config(command=tree.yview)
+        return tree
+
+    def _format_stat(self, value, digits=4):
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return "—"
+        return f"{value:,.{digits}f}"
+
+    def _format_estimate(self, row, metric, digits=4):
+        # Valor exato, ou "estimativa ±meia-largura do IC" quando a tabela veio da amostra
+        text = self._format_stat(row[metric], digits)
+        half = row.get(f"{metric}_ci", np.nan)
+        if text == "—" or half is None or not np.isfinite(half):
+            return text
+        return f"{text} ±{half:,.{digits}f}"
+
+    def _approximate_banner(self, parent, result):
+        if not result.get('approximate'):
+            return
+        ttk.Label(parent, text=f"🎲 Estimativa: amostra de {result['sample_rows']:,} linhas | IC {result['confidence']:.0%} | use 🎯 Calcular Exato para o passe completo",
+                  font=("Courier", 10, "bold"), foreground="#FFA500", background="#2F2F2F").pack(pady=(5, 0))
+
+    def _run_descriptive_analysis_minecraft(self, df, frame, profile, stats):
+        metrics_frame = ttk.Frame(frame, style="Card.TFrame", borderwidth=2, relief="solid")
+        metrics_frame.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Label(metrics_frame, text="🧱 Propriedades do Bloco", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
+        grid_frame = ttk.Frame(metrics_frame, style="Card.TFrame")
+        grid_frame.pack(fill=tk.X)
+        
+        metrics = [
+            ("Tamanho", f"{profile['rows']}x{profile['cols']}", "📏 Dimensões do bloco"),
+            ("Peso", f"{profile['memory_bytes']/(1024*1024):.1f} MB", "⚖️ Peso em memória"),
+            ("Vazios", f"{profile['null_count']}", "🕳️ Buracos no bloco"),
+            ("Numéricos", f"{len(profile['numeric_cols'])}", "🔢 Blocos numéricos"),
+            ("Categóricos", f"{len(profile['categorical_cols'])}", "🔤 Blocos de texto")
+        ]
+        
+        for i, (label, value, tooltip) in enumerate(metrics):
+            metric_frame = ttk.Frame(grid_frame, style="Card.TFrame", borderwidth=1, relief="solid")
+            metric_frame.grid(row=0, column=i, padx=4, pady=4, sticky="nsew")
+            grid_frame.grid_columnconfigure(i, weight=1)
+            
+            icons = {"Tamanho": "📏", "Peso": "⚖️", "Vazios": "🕳️", "Numéricos": "🔢", "Categóricos": "🔤"}
+            ttk.Label(metric_frame, text=icons.get(label, "📊"), font=("Courier", 16, "bold"), foreground="#FFD700", background="#3A3A3A").pack(pady=(5, 2))
+            ttk.Label(metric_frame, text=label, font=("Courier", 10, "bold"), background="#3A3A3A", foreground="#B8860B").pack(pady=(2, 0))
+            ttk.Label(metric_frame, text=value, font=("Courier", 14, "bold"), background="#3A3A3A", foreground="#FFFFFF").pack(pady=(0, 5))
+        
+        self._approximate_banner(frame, stats)
+        table = stats['table']
+        if not table.empty:
+            approx = "~" if stats.get('approximate') else ""
+            rows = [(col, f"{approx}{row['count']:,}", f"{approx}{row['nulls']:,} ({row['null_pct']:.1f}%)", self._format_estimate(row, 'mean'), self._format_estimate(row, 'std'),
+                     self._format_stat(row['min']), self._format_stat(row['max'])) for col, row in table.iterrows()]
+            self._make_table(frame, ("Minério", "Contagem", "Vazios", "Média", "Desvio", "Mínimo", "Máximo"), rows, (160, 100, 130, 110, 110, 110, 110))
+        
+        self.status_var.set("🧱 Análise de propriedades do bloco concluída")
+
+    def get_correlation(self, dataset_name, method='pearson'):
+        return self.engine.correlation(dataset_name, method)
+
+    def _fill_connections_tab(self, frame, dataset_name, method='pearson'):
+        for widget in frame.winfo_children():
+            widget.destroy()
+        
+        control_frame = ttk.Frame(frame, style="Main.TFrame")
+        control_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Label(control_frame, text="⛓️ Conexões entre Minérios", style="Subheader.TLabel").pack(side=tk.LEFT, padx=5)
+        method_var = tk.StringVar(value=method)
+        for value, text in (("pearson", "Pearson"), ("spearman", "Spearman")):
+            ttk.Radiobutton(control_frame, text=text, value=value, variable=method_var,
+                            command=lambda: self._fill_connections_tab(frame, dataset_name, method_var.get())).pack(side=tk.LEFT, padx=5)
+        
+        if len(self.get_profile(dataset_name)['numeric_cols']) < 2:
+            ttk.Label(frame, text="⚠️ São necessários pelo menos 2 minérios numéricos para medir conexões", style="Subheader.TLabel").pack(pady=30)
+            return
+        
+        loading = ttk.Label(frame, text="⏳ Calculando conexões...", style="Subheader.TLabel")
+        loading.pack(pady=30)
+        
+        def render(correlation):
+            if not frame.winfo_exists():
+                return
+            loading.destroy()
+            body = ttk.Frame(frame, style="Main.TFrame")
+            body.pack(fill=tk.BOTH, expand=True)
+            
+            pairs_frame = ttk.Frame(body, style="Main.TFrame")
+            pairs_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            ttk.Label(pairs_frame, text=f"🔗 {len(correlation['top_pairs'])} conexões mais fortes ({correlation['elapsed']:.2f}s)", style="Subheader.TLabel").pack(pady=5)
+            self._approximate_banner(pairs_frame, correlation)
+            if correlation.get('approximate'):
+                rows = [(a, b, f"{r:+.4f}", f"[{low:+.3f}, {high:+.3f}]") for (a, b, r), (low, high) in zip(correlation['top_pairs'], correlation['intervals'])]
+                self._make_table(pairs_frame, ("Minério A", "Minério B", "r", f"IC {correlation['confidence']:.0%}"), rows, (130, 130, 70, 130))
+            else:
+                rows = [(a, b, f"{r:+.4f}") for a, b, r in correlation['top_pairs']]
+                self._make_table(pairs_frame, ("Minério A", "Minério B", "r"), rows, (150, 150, 80))
+            
+            
+            def draw(fig):
+                heat_columns, heat_matrix = clustered_heatmap_columns(correlation)
+                ax = fig.add_subplot(111)
+                ax.set_facecolor('#2F2F2F')
+                image = ax.imshow(heat_matrix, cmap='RdBu_r', vmin=-1, vmax=1, interpolation='nearest')
+                labels = [str(col)[:12] for col in heat_columns]
+                ax.set_xticks(range(len(labels)))
+                ax.set_xticklabels(labels, rotation=90, fontsize=7, color='#E6D3A7')
+                ax.set_yticks(range(len(labels)))
+                ax.set_yticklabels(labels, fontsize=7, color='#E6D3A7')
+                ax.set_title(f"Mapa de Conexões ({correlation['method'].title()}, agrupado)", color='#FFD700', fontsize=11)
+                fig.colorbar(image, ax=ax, fraction=0.046, pad=0.04)
+                fig.tight_layout()
+            
+            key = (dataset_name, self.dataset_versions.get(dataset_name, 0), correlation['method'], correlation.get('approximate', False))
+            self.figures.show('conexoes', body, key, draw, figsize=(7, 6), side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        def failed(e):
+            if frame.winfo_exists():
+                loading.config(text=f"❌ Erro ao calcular conexões: {str(e)}")
+        
+        self.run_in_background(lambda: self.get_correlation(dataset_name, method), render, failed)
+
+    def _fill_patterns_tab(self, frame, stats):
+        table = stats['table']
+        ttk.Label(frame, text="🎯 Formato das Distribuições", style="Subheader.TLabel").pack(pady=5)
+        self._approximate_banner(frame, stats)
+        rows = []
+        for col, row in table.iterrows():
+            skew = row['skew']
+            if np.isnan(skew):
+                shape = "—"
+            elif abs(skew) < 0.5:
+                shape = "⚖️ Simétrica"
+            elif skew > 0:
+                shape = "➡️ Cauda à direita"
+            else:
+                shape = "⬅️ Cauda à esquerda"
+            cv = row['std'] / abs(row['mean']) if row['mean'] else np.nan
+            rows.append((col, self._format_stat(row['skew'], 3), self._format_stat(row['kurt'], 3), self._format_stat(row['q75'] - row['q25']),
+                         self._format_stat(cv, 3), f"{row['zeros']:,}", shape))
+        self._make_table(frame, ("Minério", "Assimetria", "Curtose", "IQR", "CV", "Zeros", "Formato"), rows, (160, 100, 100, 110, 80, 90, 150))
+
+    def get_dangers(self, dataset_name, isolation_forest=False):
+        return self.engine.dangers(dataset_name, isolation_forest)
+
+    def _fill_dangers_tab(self, frame, dataset_name, isolation_forest=False):
+        for widget in frame.winfo_children():
+            widget.destroy()
         
-        threading.Thread(target=analyze_in_thread, daemon=True).start()
-
-    def _run_descriptive_analysis_minecraft(self, df, frame):
-        metrics_frame = ttk.Frame(frame, style="Card.TFrame", borderwidth=2, relief="solid")
-        metrics_frame.pack(fill=tk.X, padx=10, pady=10)
-        ttk.Label(metrics_frame, text="🧱 Propriedades do Bloco", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
+        control_frame = ttk.Frame(frame, style="Main.TFrame")
+        control_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Label(control_frame, text="⚠️ Perigos do Bloco", style="Subheader.TLabel").pack(side=tk.LEFT, padx=5)
+        isolation_var = tk.BooleanVar(value=isolation_forest)
+        ttk.Checkbutton(control_frame, text="🌲 Floresta de Isolamento (amostra, todos os núcleos)", variable=isolation_var,
+                        command=lambda: self._fill_dangers_tab(frame, dataset_name, isolation_var.get())).pack(side=tk.LEFT, padx=10)
         
-        metrics = [
-            ("Tamanho", f"{len(df)}x{len(df.columns)}", "📏 Dimensões do bloco"),
-            ("Peso", f"{df.memory_usage(deep=True).sum()/(1024*1024):.1f} MB", "⚖️ Peso em memória"),
-            ("Vazios", f"{df.isnull().sum().sum()}", "🕳️ Buracos no bloco"),
-            ("Numéricos", f"{len(df.select_dtypes(include=[np.number]).columns)}", "🔢 Blocos numéricos"),
-            ("Categóricos", f"{len(df.select_dtypes(include=['object', 'category']).columns)}", "🔤 Blocos de texto")
-        ]
+        loading = ttk.Label(frame, text="⏳ Varrendo o bloco em busca de perigos...", style="Subheader.TLabel")
+        loading.pack(pady=30)
         
-        for i, (label, value, tooltip) in enumerate(metrics):
-            metric_frame = ttk.Frame(metrics_frame, style="Card.TFrame", borderwidth=1, relief="solid")
-            metric_frame.grid(row=0, column=i, padx=4, pady=4, sticky="nsew")
-            metrics_frame.grid_columnconfigure(i, weight=1)
+        def render(dangers):
+            if not frame.winfo_exists():
+                return
+            loading.destroy()
+            summary = f"🔎 {dangers['rows']:,} linhas varridas em {dangers['elapsed']:.2f}s | 👥 {dangers['duplicates']:,} linhas duplicadas (por hash de linha)"
+            if dangers.get('approximate'):
+                summary = f"🎲 Amostra de {dangers['sample_rows']:,}/{dangers['population_rows']:,} linhas (contagens da amostra) | " + summary[2:]
+            if dangers['duplicate_examples']:
+                summary += f" (ex.: {', '.join(map(str, dangers['duplicate_examples'][:5]))})"
+            ttk.Label(frame, text=summary, style="Subheader.TLabel").pack(pady=5)
+            isolation = dangers['isolation']
+            if isolation:
+                ttk.Label(frame, text=f"🌲 Floresta de Isolamento: {isolation['anomalies']:,} anomalias em {isolation['sample_rows']:,} linhas da amostra | piores: {', '.join(map(str, isolation['worst_rows']))}",
+                          style="Subheader.TLabel").pack(pady=5)
             
-            icons = {"Tamanho": "📏", "Peso": "⚖️", "Vazios": "🕳️", "Numéricos": "🔢", "Categóricos": "🔤"}
-            ttk.Label(metric_frame, text=icons.get(label, "📊"), font=("Courier", 16, "bold"), foreground="#FFD700", background="#3A3A3A").pack(pady=(5, 2))
-            ttk.Label(metric_frame, text=label, font=("Courier", 10, "bold"), background="#3A3A3A", foreground="#B8860B").pack(pady=(2, 0))
-            ttk.Label(metric_frame, text=value, font=("Courier", 14, "bold"), background="#3A3A3A", foreground="#FFFFFF").pack(pady=(0, 5))
+            rows = []
+            for col in dangers['columns']:
+                flags = []
+                if col['constant']:
+                    flags.append("🪨 Constante")
+                elif col['near_constant']:
+                    flags.append(f"🪨 Quase constante ({col['top_share']:.1%})")
+                if col['zero_spike']:
+                    flags.append(f"0️⃣ Pico de zeros ({col['zero_share']:.1%})")
+                if col['sentinels']:
+                    flags.append("🚩 Sentinelas")
+                if dangers['rows'] and col['nulls'] / dangers['rows'] > 0.05:
+                    flags.append("🕳️ Muitos vazios")
+                rows.append((col['column'], f"{col['iqr_outliers']:,}", f"{col['robust_outliers']:,}", f"{col['sentinels']:,}", f"{col['nulls']:,}",
+                             " ".join(flags) or "✅", ", ".join(map(str, col['worst_rows'][:5])) or "—"))
+            if rows:
+                self._make_table(frame, ("Minério", "Outliers IQR", f"|z robusto| > {DANGER_ROBUST_Z}", "Sentinelas", "Vazios", "Perigos", "Piores linhas"),
+                                 rows, (150, 100, 130, 90, 90, 260, 200))
+            else:
+                ttk.Label(frame, text="✅ Nenhum minério numérico para varrer", style="Subheader.TLabel").pack(pady=30)
         
-        self.status_var.set("🧱 Análise de propriedades do bloco concluída")
+        def failed(e):
+            if frame.winfo_exists():
+                loading.config(text=f"❌ Erro ao varrer perigos: {str(e)}")
+        
+        self.run_in_background(lambda: self.get_dangers(dataset_name, isolation_forest), render, failed)
+
+    def _fill_crystals_tab(self, frame, stats):
+        table = stats['table']
+        ttk.Label(frame, text="🔮 Cristais de Quantis", style="Subheader.TLabel").pack(pady=5)
+        quantile_cols = [f"q{int(round(q * 100)):02d}" for q in stats['quantiles']]
+        self._approximate_banner(frame, stats)
+        rows = [(col,) + tuple(self._format_estimate(row, q) for q in quantile_cols) for col, row in table.iterrows()]
+        self._make_table(frame, ("Minério",) + tuple(f"P{q[1:]}" for q in quantile_cols), rows, (160,) + (100,) * len(quantile_cols))
 
     def quick_analysis_selected(self):
         selected = self.datasets_tree.selection()
@@ -656,10 +4004,11 @@ Nenhum bloco para analisar!
             return
         
         df = self.datasets[dataset_name]
+        profile = self.get_profile(dataset_name)
         
         quick_win = tk.Toplevel(self.root)
         quick_win.title(f"🔍 Análise Rápida: {dataset_name}")
-        quick_win.geometry("800x600")
+        quick_win.geometry("1000x750")
         quick_win.configure(background="#2F2F2F")
         
         main_frame = ttk.Frame(quick_win, style="Main.TFrame", borderwidth=3, relief="solid")
@@ -670,11 +4019,12 @@ Nenhum bloco para analisar!
         info_frame = ttk.Frame(main_frame, style="Card.TFrame", borderwidth=2, relief="solid")
         info_frame.pack(fill=tk.X, pady=10)
         info_text = f"""
-🧱 Dimensões do Bloco: {df.shape[0]}x{df.shape[1]}
-🏷️ Tipos de Material: {df.dtypes.value_counts().to_dict()}
-🕳️ Buracos (valores nulos): {df.isnull().sum().sum()} ({(df.isnull().sum().sum()/(df.shape[0]*df.shape[1])*100):.1f}%)
-⚖️ Peso: {df.memory_usage(deep=True).sum()/(1024*1024):.2f} MB
-🔍 Densidade: {(1 - df.isnull().mean().mean()) * 100:.1f}% completo
+🧱 Dimensões do Bloco: {profile['rows']}x{profile['cols']}
+🏷️ Tipos de Material: {profile['dtype_counts']}
+🕳️ Buracos (valores nulos): {profile['null_count']} ({profile['null_pct']:.1f}%)
+⚖️ Peso: {profile['memory_bytes']/(1024*1024):.2f} MB
+🔍 Densidade: {100 - profile['null_pct']:.1f}% completo
+🎲 Modo: {f"aproximado (amostra de {len(self.engine.sample(dataset_name)):,} linhas)" if self.engine.is_approximate(dataset_name) else "exato"}
 """
         ttk.Label(info_frame, text=info_text, justify=tk.LEFT, background="#3A3A3A", foreground="#E6D3A7", font=("Courier", 10)).pack(padx=10, pady=10)
         
@@ -693,31 +4043,35 @@ Nenhum bloco para analisar!
         
         sample_frame = ttk.Frame(main_frame, style="Card.TFrame", borderwidth=2, relief="solid")
         sample_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        ttk.Label(sample_frame, text="📦 Conteúdo do Bloco (primeiras 10 linhas)", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
-        
-        columns = list(df.columns)[:10]
-        tree = ttk.Treeview(sample_frame, columns=columns, show="headings", height=8)
+        ttk.Label(sample_frame, text="📦 Conteúdo do Bloco", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
+        VirtualDataGrid(sample_frame, df, self.run_in_background, visible_rows=12)
         
-        for col in columns:
-            tree.heading(col, text=col[:15] + "..." if len(col) > 15 else col)
-            tree.column(col, width=80, anchor=tk.CENTER)
-        
-        for i, row in df.head(10).iterrows():
-            values = [str(row[col])[:15] + "..." if len(str(row[col])) > 15 else str(row[col]) for col in columns]
-            tree.insert("", tk.END, values=values)
+        self.status_var.set(f"🔍 Análise rápida iniciada para bloco '{dataset_name}'")
+        self.log_activity(f"🔍 Análise rápida do bloco '{dataset_name}'")
+
+    def browse_selected_dataset(self):
+        selected = self.datasets_tree.selection()
+        if not selected:
+            messagebox.showwarning("Aviso", "⛏️ Selecione um bloco para navegar!")
+            return
         
-        tree.tag_configure('even', background='#3A3A3A')
-        tree.tag_configure('odd', background='#424242')
-        for i in range(min(10, len(tree.get_children()))):
-            if i % 2 == 0:
-                tree.item(tree.get_children()[i], tags=('even',))
-            else:
-                tree.item(tree.get_children()[i], tags=('odd',))
+        item = self.datasets_tree.item(selected[0])
+        dataset_name = item['values'][1]
+        if dataset_name not in self.datasets:
+            messagebox.showerror("Erro", "⛏️ Bloco não encontrado!")
+            return
         
-        tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        df = self.datasets[dataset_name]
+        browse_win = tk.Toplevel(self.root)
+        browse_win.title(f"📜 Navegador de Blocos: {dataset_name}")
+        browse_win.geometry("1200x700")
+        browse_win.configure(background="#2F2F2F")
         
-        self.status_var.set(f"🔍 Análise rápida iniciada para bloco '{dataset_name}'")
-        self.log_activity(f"🔍 Análise rápida do bloco '{dataset_name}'")
+        main_frame = ttk.Frame(browse_win, style="Card.TFrame", borderwidth=3, relief="solid")
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        ttk.Label(main_frame, text=f"📜 {dataset_name} | {len(df):,} linhas x {df.shape[1]} colunas", style="Subheader.TLabel", background="#3A3A3A").pack(pady=5)
+        VirtualDataGrid(main_frame, df, self.run_in_background, visible_rows=25)
+        self.log_activity(f"📜 Navegando no bloco '{dataset_name}'")
 
     def save_all_datasets(self):
         if not self.datasets:
@@ -732,11 +4086,9 @@ Nenhum bloco para analisar!
             start_time = time.time()
             saved_count = 0
             
-            for name, df in self.datasets.items():
+            for name in self.datasets:
                 try:
-                    clean_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-                    filename = os.path.join(directory, f"block_{clean_name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-                    df.to_csv(filename, index=False, encoding='utf-8')
+                    filename = self.engine.export_dataset(name, directory)
                     saved_count += 1
                     self.log_activity(f"🧱 Bloco '{name}' guardado no baú: {filename}")
                 except Exception as e:
@@ -761,33 +4113,8 @@ Nenhum bloco para analisar!
         
         try:
             start_time = time.time()
-            saved_count = 0
-            
-            for model_name, model_info in self.models.items():
-                try:
-                    clean_name = "".join(c for c in model_name if c.isalnum() or c in (' ', '-', '_')).strip()
-                    filename = os.path.join(directory, f"golem_{clean_name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-                    
-                    model_data = {
-                        'name': model_name,
-                        'dataset': model_info['dataset'],
-                        'target': model_info['target'],
-                        'features': model_info['features'],
-                        'metrics': model_info['metrics'],
-                        'created': model_info['created'].isoformat(),
-                        'algorithm': model_info.get('algorithm', 'unknown'),
-                        'training_time': model_info.get('training_time', 0),
-                        'params': model_info.get('params', {}),
-                        'model_summary': str(model_info.get('model', 'Golem não serializável'))
-                    }
-                    
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(model_data, f, indent=2, ensure_ascii=False)
-                    
-                    saved_count += 1
-                    self.log_activity(f"🏃‍♂️ Golem '{model_name}' guardado no estábulo: {filename}")
-                except Exception as e:
-                    self.log_activity(f"❌ Erro ao guardar Golem '{model_name}': {str(e)}")
+            saved_count, bytes_written = self.engine.export_models(directory)
+            self.log_activity(f"🏃‍♂️ {saved_count} Golems serializados em {directory} ({bytes_written/(1024*1024):.1f} MB) + índice {ModelStore.INDEX_NAME}")
             
             elapsed_time = time.time() - start_time
             messagebox.showinfo("✅ Sucesso", f"{saved_count} Golems guardados no estábulo!\n📍 Local: {directory}\n⏱️ Tempo: {elapsed_time:.2f} segundos")
@@ -871,7 +4198,7 @@ Nenhum bloco para analisar!
                 np.where(df_mining['block_type'] == 'IRON', 25, 1))
             )
             
-            self.datasets["Mineração_2026"] = df_mining
+            self._register_example_dataset("Mineração_2026", df_mining)
             
             golem_data = {
                 'timestamp': pd.date_range(start='2026-01-01', periods=5000, freq='min'),
@@ -884,144 +4211,533 @@ Nenhum bloco para analisar!
             }
             
             df_golems = pd.DataFrame(golem_data)
-            self.datasets["Golems_Ferro"] = df_golems
+            self._register_example_dataset("Golems_Ferro", df_golems)
             
             self.status_var.set("✅ Blocos de exemplo carregados com sucesso!")
-            
-            # Verificar se a interface já foi construída antes de logar
-            if hasattr(self, 'log_text') and self.log_text:
-                self.log_activity("✅ Blocos de exemplo carregados: Mineração_2026 e Golems_Ferro")
-            else:
-                # Fallback simples se o log_text ainda não existir
-                print("✅ Blocos de exemplo carregados: Mineração_2026 e Golems_Ferro")
+            # O dispatcher guarda a linha até o livro de registro existir
+            self.log_activity("✅ Blocos de exemplo carregados: Mineração_2026 e Golems_Ferro")
         except Exception as e:
             self.status_var.set(f"⚠️ Erro ao carregar blocos de exemplo: {str(e)}")
-            # Verificar se a interface já foi construída antes de logar
-            if hasattr(self, 'log_text') and self.log_text:
-                self.log_activity(f"❌ Erro ao carregar blocos de exemplo: {str(e)}")
-            else:
-                print(f"❌ Erro ao carregar blocos de exemplo: {str(e)}")
+            self.log_activity(f"❌ Erro ao carregar blocos de exemplo: {str(e)}")
+
+    def _register_example_dataset(self, name, df):
+        if self.compact_on_load.get():
+            df, report = compact_dataframe(df)
+            self.register_dataset(name, df)
+            self._log_compaction(name, report)
+        else:
+            self.register_dataset(name, df)
+
+    def _log_compaction(self, dataset_name, report):
+        before, after = report['bytes_before'].sum(), report['bytes_after'].sum()
+        self.log_activity(f"🗜️ Bloco '{dataset_name}' compactado: {before/(1024*1024):.2f} MB → {after/(1024*1024):.2f} MB ({before/max(after, 1):.1f}x)")
+        for col, row in report[report['dtype_before'] != report['dtype_after']].iterrows():
+            self.log_activity(f"   🗜️ {col}: {row['dtype_before']} → {row['dtype_after']} | {row['bytes_before']/1024:,.0f} KB → {row['bytes_after']/1024:,.0f} KB")
+
+    def compact_selected_dataset(self):
+        selected = self.datasets_tree.selection()
+        if not selected:
+            messagebox.showwarning("Aviso", "⛏️ Selecione um bloco para compactar!")
+            return
+        
+        item = self.datasets_tree.item(selected[0])
+        dataset_name = item['values'][1]
+        if dataset_name not in self.datasets:
+            messagebox.showerror("Erro", "⛏️ Bloco não encontrado!")
+            return
+        
+        df = self.datasets[dataset_name]
+        self.status_var.set(f"🗜️ Compactando bloco '{dataset_name}'...")
+        
+        def done(result):
+            compacted, report = result
+            if self.datasets.get(dataset_name) is not df:
+                return
+            self.register_dataset(dataset_name, compacted)
+            self._log_compaction(dataset_name, report)
+            before, after = report['bytes_before'].sum(), report['bytes_after'].sum()
+            self.status_var.set(f"✅ Bloco '{dataset_name}' compactado: {before/(1024*1024):.1f} MB → {after/(1024*1024):.1f} MB")
+            self.show_compaction_report(dataset_name, report)
+            if hasattr(self, 'datasets_tree') and self.datasets_tree.winfo_exists():
+                self.show_datasets()
+        
+        self.run_in_background(lambda: compact_dataframe(df), done)
+
+    def show_compaction_report(self, dataset_name, report):
+        report_win = tk.Toplevel(self.root)
+        report_win.title(f"🗜️ Compactação: {dataset_name}")
+        report_win.geometry("800x500")
+        report_win.configure(background="#2F2F2F")
+        before, after = report['bytes_before'].sum(), report['bytes_after'].sum()
+        ttk.Label(report_win, text=f"🗜️ {before/(1024*1024):.2f} MB → {after/(1024*1024):.2f} MB ({before/max(after, 1):.1f}x)", style="Header.TLabel").pack(pady=10)
+        rows = [(col, row['dtype_before'], row['dtype_after'], f"{row['bytes_before']/1024:,.1f}", f"{row['bytes_after']/1024:,.1f}", f"{row['ratio']:.1f}x")
+                for col, row in report.iterrows()]
+        self._make_table(report_win, ("Minério", "Tipo antes", "Tipo depois", "KB antes", "KB depois", "Ganho"), rows, (160, 120, 120, 100, 100, 80))
 
     def load_data(self):
         filetypes = [
             ("CSV files", "*.csv"),
             ("Excel files", "*.xlsx *.xls"),
-            ("JSON files", "*.json"),
+            ("JSON files", "*.json *.jsonl *.ndjson"),
             ("Parquet files", "*.parquet"),
             ("All files", "*.*")
         ]
         
-        filename = filedialog.askopenfilename(title="⛏️ Selecione o bloco de dados para minerar", filetypes=filetypes)
-        if not filename:
+        filenames = filedialog.askopenfilenames(title="⛏️ Selecione os blocos de dados para minerar", filetypes=filetypes)
+        if not filenames:
             return
         
-        try:
-            start_time = time.time()
+        for filename in filenames:
             file_ext = os.path.splitext(filename)[1].lower()
-            self.status_var.set(f"⛏️ Minerando blocos de {filename}...")
-            
-            if file_ext == '.csv':
-                df = pd.read_csv(filename)
-            elif file_ext in ['.xlsx', '.xls']:
-                df = pd.read_excel(filename)
-            elif file_ext == '.json':
-                df = pd.read_json(filename)
-            elif file_ext == '.parquet':
-                df = pd.read_parquet(filename)
-            else:
+            if file_ext not in SUPPORTED_EXTENSIONS:
                 messagebox.showerror("❌ Erro", f"⛏️ Formato de bloco não suportado: {file_ext}")
+                continue
+            job = self.ingestion.submit(filename, compact=self.compact_on_load.get(), feeders=self.engine.incremental_feeders())
+            self.log_activity(f"⛏️ Mineração iniciada em background: {job.label}")
+        
+        self.status_var.set(f"⛏️ Minerando {len(self.ingestion.active_jobs())} bloco(s) em background...")
+        self.show_datasets()
+        self._start_ingestion_polling()
+
+    def _dataset_name_for(self, filename):
+        return self.engine.dataset_name_for(filename)
+
+    def load_data_filtered(self):
+        filename = filedialog.askopenfilename(title="🔎 Selecione o bloco para minerar com filtro",
+                                              filetypes=[("Parquet / CSV", "*.parquet *.csv"), ("All files", "*.*")])
+        if not filename:
+            return
+        if os.path.splitext(filename)[1].lower() not in SUPPORTED_EXTENSIONS:
+            messagebox.showerror("❌ Erro", f"⛏️ Formato de bloco não suportado: {os.path.splitext(filename)[1]}")
+            return
+        self.status_var.set(f"🔎 Lendo o esquema de {os.path.basename(filename)}...")
+        self.run_in_background(lambda: read_file_schema(filename),
+                               lambda schema: self._show_pushdown_dialog(filename, schema),
+                               lambda error: messagebox.showerror("❌ Erro", f"🔎 Não foi possível ler o esquema: {error}"))
+
+    def _show_pushdown_dialog(self, filename, schema):
+        # Escolha de colunas e filtros antes de ler: só o que passar chega à memória
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"🔎 Minerar com Filtro: {os.path.basename(filename)}")
+        dialog.geometry("720x620")
+        dialog.configure(background="#2F2F2F")
+        columns = [column for column, _ in schema['columns']]
+        if schema['rows'] is not None:
+            summary = f"🧱 {len(columns)} minérios | {schema['rows']:,} linhas | {schema['row_groups']} row groups"
+        else:
+            summary = f"🧱 {len(columns)} minérios | tipos inferidos de uma amostra"
+        self.status_var.set(summary)
+        ttk.Label(dialog, text=summary, font=("Courier", 12, "bold"), foreground="#FFD700", background="#2F2F2F").pack(pady=10)
+        
+        ttk.Label(dialog, text="💎 Minérios a ler (Ctrl/Shift para vários):", background="#2F2F2F", foreground="#E6D3A7").pack(anchor="w", padx=10)
+        tree = self._make_table(dialog, ("Minério", "Tipo"), schema['columns'], (360, 240), height=10)
+        tree.configure(selectmode="extended")
+        tree.selection_set(tree.get_children())
+        column_for_item = dict(zip(tree.get_children(), columns))
+        
+        filter_frame = ttk.Frame(dialog, style="Card.TFrame", borderwidth=2, relief="solid")
+        filter_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Label(filter_frame, text="🧪 Filtros (todos precisam valer):", background="#3A3A3A", foreground="#E6D3A7").grid(row=0, column=0, columnspan=3, sticky="w", padx=5, pady=5)
+        predicate_vars = []
+        for i in range(PUSHDOWN_PREDICATE_ROWS):
+            column_var, op_var, value_var = tk.StringVar(), tk.StringVar(value=">="), tk.StringVar()
+            ttk.Combobox(filter_frame, textvariable=column_var, values=[""] + columns, width=28, state="readonly").grid(row=i + 1, column=0, padx=5, pady=3)
+            ttk.Combobox(filter_frame, textvariable=op_var, values=list(PREDICATE_OPS), width=4, state="readonly").grid(row=i + 1, column=1, padx=5, pady=3)
+            ttk.Entry(filter_frame, textvariable=value_var, width=24).grid(row=i + 1, column=2, padx=5, pady=3)
+            predicate_vars.append((column_var, op_var, value_var))
+        
+        def start():
+            selected = {column_for_item[item] for item in tree.selection()}
+            if not selected:
+                messagebox.showwarning("Aviso", "💎 Selecione pelo menos um minério!", parent=dialog)
                 return
-            
-            dataset_name = os.path.basename(filename).split('.')[0].replace('_', ' ').title()
-            if dataset_name in self.datasets:
-                dataset_name += f"_v{datetime.datetime.now().strftime('%H%M%S')}"
-            
-            self.datasets[dataset_name] = df
-            
-            elapsed_time = time.time() - start_time
-            self.status_var.set(f"✅ Bloco '{dataset_name}' minerado com sucesso! ({len(df)} unidades, {elapsed_time:.2f}s)")
-            self.log_activity(f"✅ Bloco minerado: {dataset_name} | {len(df)} unidades | {df.shape[1]} dimensões")
+            predicates = [(column_var.get(), op_var.get(), value_var.get().strip())
+                          for column_var, op_var, value_var in predicate_vars if column_var.get() and value_var.get().strip()]
+            chosen = [column for column in columns if column in selected]
+            job = self.ingestion.submit(filename, compact=self.compact_on_load.get(),
+                                        columns=None if len(chosen) == len(columns) else chosen, predicates=predicates,
+                                        feeders=self.engine.incremental_feeders())
+            filters = " E ".join(f"{column} {op} {value}" for column, op, value in predicates) or "nenhum"
+            self.log_activity(f"🔎 Mineração com filtro iniciada: {job.label} | {len(chosen)}/{len(columns)} minérios | filtros: {filters}")
+            dialog.destroy()
+            self.status_var.set(f"⛏️ Minerando {job.label} com filtro em background...")
             self.show_datasets()
-        except Exception as e:
-            error_msg = f"❌ Erro ao minerar blocos: {str(e)}"
-            messagebox.showerror("Erro de Mineração", error_msg)
-            self.status_var.set(f"❌ {error_msg}")
+            self._start_ingestion_polling()
+        
+        ttk.Button(dialog, text="⛏️ Minerar", command=start, style="Success.TButton", width=16).pack(pady=10)
+
+    def load_shards(self):
+        directory = filedialog.askdirectory(title="📁 Selecione a pasta com os shards do bloco")
+        if not directory:
+            return
+        pattern = simpledialog.askstring("📁 Padrão dos Shards", "Padrão glob dos arquivos (ex.: *.parquet, 2026-*.csv, **/*.csv):",
+                                         initialvalue="*", parent=self.root)
+        if not pattern:
+            return
+        shards = resolve_shards(directory, pattern)
+        if not shards:
+            messagebox.showerror("❌ Erro", f"⛏️ Nenhum shard suportado encontrado em {os.path.join(directory, pattern)}")
+            return
+        job = self.ingestion.submit(directory, compact=self.compact_on_load.get(), shards=shards,
+                                    feeders=self.engine.incremental_feeders())
+        self.log_activity(f"⛏️ Mineração de {len(shards)} shards iniciada: {os.path.join(directory, pattern)}")
+        self.status_var.set(f"⛏️ Minerando {len(shards)} shards de {job.label} em paralelo...")
+        self.show_datasets()
+        self._start_ingestion_polling()
+
+    def _add_ingest_row(self, parent, job):
+        row = ttk.Frame(parent, style="Card.TFrame")
+        row.pack(fill=tk.X, padx=10, pady=2)
+        ttk.Label(row, text=f"🧱 {job.label[:30]}", width=34, background="#3A3A3A", foreground="#E6D3A7", font=("Courier", 10)).pack(side=tk.LEFT, padx=5)
+        progress = ttk.Progressbar(row, length=220, mode='determinate', style="Success.Horizontal.TProgressbar")
+        progress.pack(side=tk.LEFT, padx=5)
+        info_var = tk.StringVar(value=INGEST_STATUS_LABELS[job.status])
+        ttk.Label(row, textvariable=info_var, background="#3A3A3A", foreground="#B8860B", font=("Courier", 10)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(row, text="✖ Cancelar", command=job.cancel, style="Danger.TButton", width=11).pack(side=tk.RIGHT, padx=5)
+        self.ingest_rows[job.job_id] = (progress, info_var)
+
+    def _start_ingestion_polling(self):
+        if not self._ingest_polling:
+            self._ingest_polling = True
+            self.root.after(INGEST_POLL_MS, self._poll_ingestion)
+
+    def _poll_ingestion(self):
+        active_jobs = self.ingestion.active_jobs()
+        for job in active_jobs:
+            widgets = self.ingest_rows.get(job.job_id)
+            if widgets and widgets[0].winfo_exists():
+                progress, info_var = widgets
+                progress['value'] = job.fraction * 100
+                info_var.set(f"{INGEST_STATUS_LABELS[job.status]} | {job.rows_read:,} linhas | {job.rows_per_sec:,.0f} linhas/s")
+        
+        if active_jobs:
+            total_rows = sum(job.rows_read for job in active_jobs)
+            total_rate = sum(job.rows_per_sec for job in active_jobs)
+            self.ingest_progress['value'] = sum(job.fraction for job in active_jobs) / len(active_jobs) * 100
+            self.ingest_rate_var.set(f"⛏️ {len(active_jobs)} em curso | {total_rows:,} linhas | {total_rate:,.0f} linhas/s")
+        
+        finished = self.ingestion.pop_finished()
+        for job in finished:
+            self._finish_ingestion_job(job)
+        if finished and hasattr(self, 'datasets_tree') and self.datasets_tree.winfo_exists():
+            self.show_datasets()
+        
+        if self.ingestion.active_jobs():
+            self.root.after(INGEST_POLL_MS, self._poll_ingestion)
+            return
+        
+        self._ingest_polling = False
+        self.ingest_progress['value'] = 0
+        self.ingest_rate_var.set("")
+
+    def _finish_ingestion_job(self, job):
+        if job.status == 'done':
+            df = job.result
+            job.result = None
+            dataset_name = self._dataset_name_for(job.path)
+            self.register_dataset(dataset_name, df, job.profile, job.sample)
+            if self.engine.is_approximate(dataset_name):
+                self.log_activity(f"🎲 '{dataset_name}' em modo aproximado: amostra de {len(self.engine.sample(dataset_name)):,} linhas para análises interativas")
+            for shard in job.shard_report:
+                self.log_activity(f"   🧩 {shard['file']}: {shard['rows']:,} linhas | {shard['bytes']/(1024*1024):.1f} MB | {shard['seconds']:.2f}s")
+            if job.shard_report:
+                slowest = max(job.shard_report, key=lambda shard: shard['seconds'])
+                self.log_activity(f"🧩 {len(job.shard_report)} shards juntados em '{dataset_name}' | mais lento: {slowest['file']} ({slowest['seconds']:.2f}s)")
+            if job.predicates or job.columns is not None:
+                scanned = job.scan_report.get('rows_scanned', job.rows_read)
+                pruned = (f" | {job.scan_report['row_groups_skipped']}/{job.scan_report['row_groups']} row groups pulados"
+                          if 'row_groups' in job.scan_report else "")
+                self.log_activity(f"🔎 Filtro na leitura: {len(df):,} de {scanned:,} linhas lidas mantidas | {df.shape[1]} minérios{pruned}")
+            if job.compact_report is not None:
+                self._log_compaction(dataset_name, job.compact_report)
+            self._finish_incremental_feed(job)
+            self.status_var.set(f"✅ Bloco '{dataset_name}' minerado com sucesso! ({len(df)} unidades, {job.elapsed:.2f}s)")
+            self.log_activity(f"✅ Bloco minerado: {dataset_name} | {len(df)} unidades | {df.shape[1]} dimensões | {job.rows_per_sec:,.0f} linhas/s")
+        elif job.status == 'cancelled':
+            self.status_var.set(f"🛑 Mineração de '{job.label}' cancelada")
+            self.log_activity(f"🛑 Mineração cancelada: {job.label} ({job.rows_read:,} linhas descartadas)")
+        else:
+            error_msg = f"❌ Erro ao minerar blocos de {job.label}: {job.error}"
+            self.status_var.set(error_msg)
             self.log_activity(error_msg)
+            messagebox.showerror("Erro de Mineração", error_msg)
+
+    def _finish_incremental_feed(self, job):
+        for model_name, error in job.feed_errors.items():
+            self.log_activity(f"❌ Golem incremental '{model_name}' não conseguiu comer {job.label}: {error}")
+        for model_name in sorted(job.fed - set(job.feed_errors)):
+            if model_name not in self.models:
+                continue
+            try:
+                self.models[model_name]['model'].checkpoint()
+            except Exception as e:
+                self.log_activity(f"⚠️ Checkpoint do Golem '{model_name}' falhou: {e}")
+            self._log_incremental(model_name, f"comeu {job.label}")
+        if job.fed and hasattr(self, 'models_tree') and self.models_tree.winfo_exists():
+            self.show_models()
+
+    def register_dataset(self, name, df, profile=None, sample=None):
+        self.engine.register_dataset(name, df, profile, sample)
+
+    def unregister_dataset(self, name):
+        self.engine.unregister_dataset(name)
+
+    def get_profile(self, name):
+        return self.engine.get_profile(name)
 
     def clear_content(self):
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+        self.figures.collect()
 
     def log_activity(self, message):
+        # Seguro a partir de qualquer thread: grava no arquivo já e entra na fila do dispatcher
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
-        
-        # Verificar se o widget de log existe e está pronto
+        self.activity_log.info(log_entry.rstrip("\n"))
+        self.dispatcher.post_log(log_entry)
+
+    def set_status(self, text):
+        # Versão de status_var.set para workers; várias atualizações num ciclo viram só a última
+        self.dispatcher.post_status(text)
+
+    def _flush_log(self, entries):
+        self.log_lines.extend(entries)
         if hasattr(self, 'log_text') and self.log_text and self.log_text.winfo_exists():
             self.log_text.config(state=tk.NORMAL)
-            
-            # Salvar o índice atual antes de inserir o novo texto
-            start_index = self.log_text.index(tk.END)
-            
-            # Inserir o novo texto
-            self.log_text.insert(tk.END, log_entry)
-            
-            # O índice final é o novo final do texto
-            end_index = self.log_text.index(tk.END)
-            
-            # Aplicar tags de formatação com base no conteúdo da mensagem
-            if "✅" in message:
-                self.log_text.tag_add("success", start_index, end_index)
-                self.log_text.tag_configure("success", foreground="#4CAF50")
-            elif "❌" in message:
-                self.log_text.tag_add("error", start_index, end_index)
-                self.log_text.tag_configure("error", foreground="#F44336")
-            elif "⛏️" in message or "🧱" in message:
-                self.log_text.tag_add("mine", start_index, end_index)
-                self.log_text.tag_configure("mine", foreground="#8B4513")
-            
-            # Garantir que o texto rola para mostrar a última entrada
-            self.log_text.see(tk.END)
+            self._insert_log_entries(entries)
             self.log_text.config(state=tk.DISABLED)
 
+    def _insert_log_entries(self, entries):
+        if not entries:
+            return
+        # Um único insert com pares (texto, tag) e um único see(END) por lote
+        chunks = []
+        for entry in entries[-LOG_MAX_LINES:]:
+            chunks.extend((entry, log_tag_for(entry)))
+        self.log_text.insert(tk.END, *chunks)
+        lines = int(self.log_text.index("end-1c").split(".")[0])
+        if lines > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
+        self.log_text.see(tk.END)
+
     def setup_auto_save(self):
+        self.autosave_store = AutoSaveStore()
+        
+        def take_snapshot(snapshot, ready):
+            # Roda no thread do Tk: os dicionários só são lidos enquanto ninguém os altera; cada Golem vai
+            # como cópia rasa, então o thread do auto-save nunca toca os dicionários vivos
+            try:
+                snapshot.update(datasets=list(self.datasets.items()), versions=dict(self.dataset_versions),
+                                models={name: dict(info) for name, info in self.models.items()})
+            finally:
+                ready.set()
+        
+        def apply_tracked(tracked):
+            # Caminhos dos arquivos gravados voltam para o Golem vivo, se ele ainda tem o mesmo estimador
+            for model_name, (model, fields) in tracked.items():
+                model_info = self.models.get(model_name)
+                if model_info is not None and model_info.get('model') is model:
+                    model_info.update(fields)
+        
         def auto_save_routine():
             while True:
-                time.sleep(300)  # 5 minutos
-                if self.datasets or self.models:
-                    auto_save_dir = os.path.join(os.path.expanduser("~"), ".minecraft_databackup")
-                    os.makedirs(auto_save_dir, exist_ok=True)
+                time.sleep(AUTOSAVE_INTERVAL_SEC)
+                snapshot, ready = {}, threading.Event()
+                self.dispatcher.call(take_snapshot, snapshot, ready)
+                ready.wait()
+                if snapshot.get('datasets') or snapshot.get('models'):
                     try:
-                        for name, df in self.datasets.items():
-                            clean_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-                            filename = os.path.join(auto_save_dir, f"autosave_block_{clean_name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.csv")
-                            df.to_csv(filename, index=False)
-                        
-                        if self.models:
-                            models_file = os.path.join(auto_save_dir, f"autosave_golems_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.json")
-                            model_metadata = {}
-                            for model_name, model_info in self.models.items():
-                                model_metadata[model_name] = {
-                                    'dataset': model_info['dataset'],
-                                    'target': model_info['target'],
-                                    'metrics': model_info['metrics'],
-                                    'created': model_info['created'].isoformat(),
-                                    'features': model_info['features']
-                                }
-                            
-                            with open(models_file, 'w', encoding='utf-8') as f:
-                                json.dump(model_metadata, f, indent=2, ensure_ascii=False)
-                        
-                        self.log_activity(f"💾 Auto-save realizado: {len(self.datasets)} blocos + {len(self.models)} Golems")
+                        report = self.autosave_store.save_cycle(snapshot['datasets'], snapshot['versions'], snapshot['models'])
+                        if report['tracked']:
+                            self.dispatcher.call(apply_tracked, report['tracked'])
+                        for error in report['errors']:
+                            self.log_activity(f"❌ Erro no auto-save do bloco {error}")
+                        if report['written']:
+                            self.log_activity(f"💾 Auto-save realizado: {len(report['written'])} item(ns) gravado(s), {len(report['skipped'])} sem mudanças | {report['bytes']/(1024*1024):.1f} MB em {report['elapsed']:.2f}s | {report['deleted']} snapshot(s) antigo(s) removido(s)")
+                        else:
+                            self.log_activity(f"💾 Auto-save: nada mudou desde o último snapshot ({report['elapsed']:.2f}s)")
                     except Exception as e:
                         self.log_activity(f"❌ Erro no auto-save: {str(e)}")
         
         auto_save_thread = threading.Thread(target=auto_save_routine, daemon=True)
         auto_save_thread.start()
-        self.log_activity("✅ Sistema de auto-save ativado (a cada 5 minutos)")
+        self.log_activity(f"✅ Sistema de auto-save ativado (a cada {AUTOSAVE_INTERVAL_SEC // 60} minutos, só o que mudou)")
+
+    def load_stable_models(self, directory=GOLEM_STORE_DIR):
+        if not os.path.exists(os.path.join(directory, ModelStore.INDEX_NAME)):
+            return 0
+        try:
+            loaded = self.model_store.load_index(directory)
+        except Exception as e:
+            self.log_activity(f"❌ Erro ao ler o índice do estábulo: {str(e)}")
+            return 0
+        new_models = {name: info for name, info in loaded.items() if name not in self.models}
+        self.models.update(new_models)
+        self.log_activity(f"🏃‍♂️ {len(new_models)} Golems indexados de {directory} (acordam sob demanda)")
+        return len(new_models)
+
+    def open_models_store(self):
+        directory = filedialog.askdirectory(title="📂 Selecione o estábulo com golems_index.json")
+        if not directory:
+            return
+        if not os.path.exists(os.path.join(directory, ModelStore.INDEX_NAME)):
+            messagebox.showerror("❌ Erro", f"🏃‍♂️ Nenhum {ModelStore.INDEX_NAME} encontrado em {directory}")
+            return
+        count = self.load_stable_models(directory)
+        self.status_var.set(f"✅ {count} Golems indexados do estábulo {directory}")
+        self.show_models()
+
+    def get_model_estimator(self, model_name):
+        model_info = self.models[model_name]
+        if model_info.get('model') is None and model_info.get('model_path'):
+            start_time = time.time()
+            self.engine.get_model_estimator(model_name)
+            self.log_activity(f"🏃‍♂️ Golem '{model_name}' acordado do disco em {time.time() - start_time:.2f}s")
+        return model_info.get('model')
 
     def run_advanced_automl(self):
-        messagebox.showinfo("⚡ AutoML Redstone", "Funcionalidade de AutoML em desenvolvimento. Disponível em breve!")
+        if not self.datasets:
+            messagebox.showwarning("Aviso", "⚡ Carregue blocos de dados antes de ativar a Redstone!")
+            return
+        
+        automl_win = tk.Toplevel(self.root)
+        automl_win.title("⚡ AutoML Redstone")
+        automl_win.geometry("1000x650")
+        automl_win.configure(background="#2F2F2F")
+        
+        ttk.Label(automl_win, text="⚡ Circuito de Redstone: Busca Automática de Golems", font=("Courier", 16, "bold"), foreground="#FFD700", background="#2F2F2F").pack(pady=10)
+        
+        control_frame = ttk.Frame(automl_win, style="Card.TFrame", borderwidth=2, relief="solid")
+        control_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        dataset_var = tk.StringVar(value=list(self.datasets.keys())[0])
+        target_var = tk.StringVar()
+        budget_var = tk.StringVar(value="120")
+        
+        ttk.Label(control_frame, text="🧱 Bloco:", background="#3A3A3A", foreground="#E6D3A7").pack(side=tk.LEFT, padx=5, pady=8)
+        dataset_combo = ttk.Combobox(control_frame, textvariable=dataset_var, values=list(self.datasets.keys()), width=24, state="readonly")
+        dataset_combo.pack(side=tk.LEFT, padx=5)
+        ttk.Label(control_frame, text="🎯 Alvo:", background="#3A3A3A", foreground="#E6D3A7").pack(side=tk.LEFT, padx=5)
+        target_combo = ttk.Combobox(control_frame, textvariable=target_var, width=18, state="readonly")
+        target_combo.pack(side=tk.LEFT, padx=5)
+        ttk.Label(control_frame, text="⏱️ Orçamento (s):", background="#3A3A3A", foreground="#E6D3A7").pack(side=tk.LEFT, padx=5)
+        ttk.Spinbox(control_frame, from_=10, to=3600, increment=10, textvariable=budget_var, width=6).pack(side=tk.LEFT, padx=5)
+        
+        def refresh_targets(event=None):
+            numeric_cols = self.get_profile(dataset_var.get())['numeric_cols']
+            target_combo['values'] = numeric_cols
+            target_var.set(numeric_cols[-1] if numeric_cols else "")
+        
+        dataset_combo.bind("<<ComboboxSelected>>", refresh_targets)
+        refresh_targets()
+        
+        progress_var = tk.StringVar(value="💤 Redstone desligada")
+        ttk.Label(automl_win, textvariable=progress_var, font=("Courier", 10), foreground="#4CAF50", background="#2F2F2F").pack(pady=5)
+        
+        columns = ("Rank", "Tipo", "Rodada", "Blocos", "Precisão", "Erro", "Energia", "Tempo", "Parâmetros")
+        board = ttk.Treeview(automl_win, columns=columns, show="headings", height=14)
+        for col, width in zip(columns, (50, 150, 70, 80, 80, 80, 80, 70, 330)):
+            board.heading(col, text=col)
+            board.column(col, width=width, anchor="w" if col == "Parâmetros" else "center")
+        board.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        state = {'search': None, 'building': False}
+        
+        def start_search():
+            if state['building'] or (state['search'] is not None and state['search'].is_active):
+                return
+            dataset_name, target = dataset_var.get(), target_var.get()
+            features = [col for col in self.get_profile(dataset_name)['numeric_cols'] if col != target]
+            if not target or not features:
+                messagebox.showwarning("Aviso", "⚡ O bloco precisa de um alvo numérico e pelo menos uma feature numérica!", parent=automl_win)
+                return
+            try:
+                budget = float(budget_var.get())
+            except ValueError:
+                budget = 120.0
+            
+            def build():
+                # Mesma matriz float32 (cache por versão do bloco) que a forja usa; linhas sem alvo ficam de fora.
+                # Num cache miss a cópia do bloco é pesada, então roda fora do thread do Tk
+                matrix = self.engine.feature_matrix(dataset_name, features, target)
+                labeled = ~np.isnan(matrix['y'])
+                return (matrix['X'], matrix['y']) if labeled.all() else (matrix['X'][labeled], matrix['y'][labeled])
+            
+            def launch(data):
+                state['building'] = False
+                if not automl_win.winfo_exists():
+                    return
+                search = AutoMLSearch(*data, budget)
+                search.dataset_name, search.target, search.features = dataset_name, target, features
+                state['search'] = search
+                search.start()
+                self.log_activity(f"⚡ AutoML Redstone ativado: {dataset_name} → {target} | {len(search.candidates)} candidatos | {budget:.0f}s")
+                automl_win.after(AUTOML_POLL_MS, poll)
+            
+            def failed(error):
+                state['building'] = False
+                self.log_activity(f"❌ Erro ao montar a matriz de features do AutoML: {error}")
+                if automl_win.winfo_exists():
+                    progress_var.set("❌ Erro ao montar a matriz de features")
+            
+            state['building'] = True
+            progress_var.set(f"🧮 Montando a matriz de features de {dataset_name}...")
+            self.run_in_background(build, launch, failed)
+        
+        def poll():
+            search = state['search']
+            if not automl_win.winfo_exists():
+                search.cancel()
+                return
+            board.delete(*board.get_children())
+            for rank, entry in enumerate(search.ranking(), 1):
+                metrics = entry['metrics']
+                board.insert("", tk.END, values=(rank, entry['algorithm'], entry['round'], f"{entry['rows']:,}", f"{metrics['r2']:.4f}",
+                                                 f"{metrics['rmse']:.3f}", f"{metrics['mae']:.3f}", f"{entry['fit_time']:.1f}s",
+                                                 json.dumps(entry['params'], default=str)))
+            progress_var.set(f"{TRAIN_STATUS_LABELS.get(search.status, search.status)} | Rodada {search.round} | {search.evaluated} avaliações | {search.elapsed:.0f}s de {search.budget_seconds:.0f}s")
+            if search.is_active:
+                automl_win.after(AUTOML_POLL_MS, poll)
+            else:
+                finish(search)
+        
+        def finish(search):
+            for failure in search.failures:
+                self.log_activity(f"⚠️ Candidato AutoML #{failure['candidate_id']} ({failure['algorithm']}) falhou: {failure['error']} | {json.dumps(failure['params'], default=str)}")
+            if search.status == 'error':
+                self.log_activity(f"❌ Erro no AutoML Redstone: {search.error}")
+                messagebox.showerror("❌ Erro", f"Erro no AutoML Redstone:\n{search.error}", parent=automl_win)
+                return
+            registered = []
+            for rank, (entry, model) in enumerate(search.best(), 1):
+                model_name = self._unique_model_name(f"Golem_AutoML_{search.dataset_name}")
+                self.models[model_name] = {
+                    'model': model,
+                    'dataset': search.dataset_name,
+                    'target': search.target,
+                    'features': search.features,
+                    # Nota no teste intocado, comparável à dos Golems da forja; a de validação guiou a seleção
+                    'metrics': entry.get('test_metrics', entry['metrics']),
+                    'created': datetime.datetime.now(),
+                    'algorithm': entry['algorithm'],
+                    'params': entry['params'],
+                    'training_time': entry['fit_time'],
+                    'cpu_time': entry['cpu_time'],
+                    'model_bytes': estimator_nbytes(model),
+                    'automl': {'rank': rank, 'round': entry['round'], 'rows': entry['rows'], 'budget': search.budget_seconds,
+                               'validation_metrics': entry['metrics']}
+                }
+                registered.append(model_name)
+                if hasattr(self, 'models_tree') and self.models_tree.winfo_exists():
+                    self._insert_model_row(model_name, self.models[model_name])
+            self.status_var.set(f"⚡ AutoML concluído em {search.elapsed:.0f}s | {search.evaluated} avaliações | {len(registered)} Golems no estábulo")
+            self.log_activity(f"✅ AutoML Redstone concluído: {', '.join(registered) or 'nenhum Golem'} | {search.evaluated} avaliações em {search.elapsed:.0f}s")
+        
+        btn_frame = ttk.Frame(automl_win, style="Main.TFrame")
+        btn_frame.pack(pady=10)
+        ttk.Button(btn_frame, text="⚡ Ativar Redstone", command=start_search, style="Warning.TButton").pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="🛑 Desligar", command=lambda: state['search'] and state['search'].cancel(), style="Danger.TButton").pack(side=tk.LEFT, padx=5)
 
     def show_scatter_analysis(self):
         self.clear_content()
@@ -1037,31 +4753,76 @@ Nenhum bloco para analisar!
         notebook = ttk.Notebook(scatter_frame, style="TNotebook")
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        for dataset_name, df in self.datasets.items():
+        # As abas só são desenhadas quando selecionadas
+        pending = {}
+        for dataset_name in self.datasets:
             tab = ttk.Frame(notebook, style="Main.TFrame")
             notebook.add(tab, text=f"🧱 {dataset_name[:15]}")
-            
-            if df.select_dtypes(include=[np.number]).shape[1] >= 2:
-                fig, ax = plt.subplots(figsize=(10, 6), facecolor='#3A3A3A')
-                fig.patch.set_facecolor('#3A3A3A')
-                ax.set_facecolor('#2F2F2F')
-                
-                numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:2]
-                x_col, y_col = numeric_cols[0] if numeric_cols else "", numeric_cols[1] if len(numeric_cols) > 1 else ""
-                
-                if x_col and y_col:
-                    ax.scatter(df[x_col], df[y_col], alpha=0.6, color='#0078d7', edgecolors='white')
-                    ax.set_title(f'Análise de Dispersão: {x_col} vs {y_col}', color='#FFD700', fontsize=12)
-                    ax.set_xlabel(x_col, color='#E6D3A7', fontsize=10)
-                    ax.set_ylabel(y_col, color='#E6D3A7', fontsize=10)
-                    ax.tick_params(axis='both', colors='#E6D3A7')
-                    ax.grid(True, alpha=0.3, color='#555555')
-                    
-                    canvas = FigureCanvasTkAgg(fig, master=tab)
-                    canvas.draw()
-                    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            else:
-                ttk.Label(tab, text="⚠️ Dataset não possui variáveis numéricas suficientes para análise de dispersão", style="Subheader.TLabel", background="#3A3A3A").pack(pady=50)
+            pending[str(tab)] = (tab, dataset_name)
+        
+        def on_tab_changed(event):
+            selected = notebook.select()
+            if selected in pending:
+                tab, dataset_name = pending.pop(selected)
+                self._build_scatter_tab(tab, dataset_name)
+        
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        on_tab_changed(None)
+
+    def _build_scatter_tab(self, tab, dataset_name):
+        numeric_cols = self.get_profile(dataset_name)['numeric_cols']
+        if len(numeric_cols) < 2:
+            ttk.Label(tab, text="⚠️ Dataset não possui variáveis numéricas suficientes para análise de dispersão", style="Subheader.TLabel", background="#3A3A3A").pack(pady=50)
+            return
+        
+        control_frame = ttk.Frame(tab, style="Main.TFrame")
+        control_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Label(control_frame, text="X:", style="Subheader.TLabel").pack(side=tk.LEFT, padx=5)
+        x_var = tk.StringVar(value=numeric_cols[0])
+        ttk.Combobox(control_frame, textvariable=x_var, values=numeric_cols, state="readonly", width=20).pack(side=tk.LEFT, padx=5)
+        ttk.Label(control_frame, text="Y:", style="Subheader.TLabel").pack(side=tk.LEFT, padx=5)
+        y_var = tk.StringVar(value=numeric_cols[1])
+        ttk.Combobox(control_frame, textvariable=y_var, values=numeric_cols, state="readonly", width=20).pack(side=tk.LEFT, padx=5)
+        mode_var = tk.StringVar(value='auto')
+        for value, text in SCATTER_MODES.items():
+            ttk.Radiobutton(control_frame, text=text, value=value, variable=mode_var).pack(side=tk.LEFT, padx=5)
+        detail_var = tk.StringVar(value="")
+        image_label = ttk.Label(tab, style="Subheader.TLabel")
+        
+        def draw(*_):
+            self._draw_scatter(image_label, detail_var, dataset_name, x_var.get(), y_var.get(), mode_var.get())
+        
+        ttk.Button(control_frame, text="🎯 Plotar", command=draw, style="Accent.TButton").pack(side=tk.LEFT, padx=10)
+        ttk.Label(tab, textvariable=detail_var, style="Subheader.TLabel").pack(pady=2)
+        image_label.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        draw()
+
+    def _draw_scatter(self, image_label, detail_var, dataset_name, x_col, y_col, mode):
+        if dataset_name not in self.datasets:
+            return
+        approximate = self.engine.is_approximate(dataset_name)
+        key = (dataset_name, self.dataset_versions.get(dataset_name, 0), x_col, y_col, mode, approximate)
+        
+        def show(result):
+            png, detail = result
+            if key not in self.scatter_cache:
+                if len(self.scatter_cache) >= SCATTER_CACHE_ENTRIES:
+                    self.scatter_cache.pop(next(iter(self.scatter_cache)))
+                self.scatter_cache[key] = result
+            if not image_label.winfo_exists():
+                return
+            image = tk.PhotoImage(data=base64.b64encode(png).decode('ascii'))
+            image_label.configure(image=image)
+            image_label.image = image
+            detail_var.set(f"🎲 {detail} | amostra do modo aproximado" if approximate else f"🎯 {detail}")
+        
+        if key in self.scatter_cache:
+            show(self.scatter_cache[key])
+            return
+        detail_var.set(f"⏳ Desenhando {x_col} vs {y_col}...")
+        df = self.engine.sample(dataset_name) if approximate else self.datasets[dataset_name]
+        self.run_in_background(lambda: render_scatter_png(df, x_col, y_col, mode), show,
+                               lambda e: detail_var.set(f"❌ Erro ao desenhar dispersão: {str(e)}") if image_label.winfo_exists() else None)
 
     def remove_selected_dataset(self):
         selected = self.datasets_tree.selection()
@@ -1073,7 +4834,7 @@ Nenhum bloco para analisar!
             item = self.datasets_tree.item(selected[0])
             dataset_name = item['values'][1]
             if dataset_name in self.datasets:
-                del self.datasets[dataset_name]
+                self.unregister_dataset(dataset_name)
                 self.show_datasets()
                 self.log_activity(f"🗑️ Bloco removido: {dataset_name}")
                 self.status_var.set(f"✅ Bloco '{dataset_name}' removido com sucesso!")
@@ -1097,112 +4858,412 @@ Nenhum bloco para analisar!
             messagebox.showwarning("Aviso", "Nenhum dataset carregado para treinar modelos!")
             return
         
-        dataset_name = list(self.datasets.keys())[0]
-        df = self.datasets[dataset_name]
+        forge_win = tk.Toplevel(self.root)
+        forge_win.title("🧱 Forjar Golem")
+        forge_win.geometry("560x360")
+        forge_win.configure(background="#2F2F2F")
+        ttk.Label(forge_win, text="🧱 Forja de Golems", font=("Courier", 16, "bold"), foreground="#FFD700", background="#2F2F2F").pack(pady=10)
+        
+        form = ttk.Frame(forge_win, style="Card.TFrame", borderwidth=2, relief="solid")
+        form.pack(fill=tk.X, padx=10, pady=5)
+        dataset_var = tk.StringVar(value=list(self.datasets.keys())[0])
+        target_var = tk.StringVar()
+        algorithm_var = tk.StringVar(value='RandomForest')
+        ttk.Label(form, text="🧱 Bloco:", background="#3A3A3A", foreground="#E6D3A7").grid(row=0, column=0, sticky="w", padx=5, pady=6)
+        dataset_combo = ttk.Combobox(form, textvariable=dataset_var, values=list(self.datasets.keys()), width=32, state="readonly")
+        dataset_combo.grid(row=0, column=1, sticky="w", padx=5)
+        ttk.Label(form, text="🎯 Alvo:", background="#3A3A3A", foreground="#E6D3A7").grid(row=1, column=0, sticky="w", padx=5, pady=6)
+        target_combo = ttk.Combobox(form, textvariable=target_var, width=32, state="readonly")
+        target_combo.grid(row=1, column=1, sticky="w", padx=5)
+        ttk.Label(form, text="⚙️ Tipo:", background="#3A3A3A", foreground="#E6D3A7").grid(row=2, column=0, sticky="nw", padx=5, pady=6)
+        for i, (algorithm, (label, _)) in enumerate(GOLEM_TYPES.items()):
+            ttk.Radiobutton(form, text=label, value=algorithm, variable=algorithm_var).grid(row=2 + i, column=1, sticky="w", padx=5, pady=2)
+        info_var = tk.StringVar()
+        ttk.Label(forge_win, textvariable=info_var, font=("Courier", 9), foreground="#B8860B", background="#2F2F2F").pack(pady=5)
+        
+        def refresh_targets(event=None):
+            numeric_cols = self.get_profile(dataset_var.get())['numeric_cols']
+            target_combo['values'] = numeric_cols
+            target_var.set(numeric_cols[-1] if numeric_cols else "")
+            profile = self.get_profile(dataset_var.get())
+            with_nulls = sum(1 for col in numeric_cols if profile['null_by_column'].get(col, 0))
+            info_var.set(f"📏 {profile['rows']:,} linhas | {len(numeric_cols)} minérios numéricos | {with_nulls} com vazios")
+        
+        dataset_combo.bind("<<ComboboxSelected>>", refresh_targets)
+        refresh_targets()
+        
+        def forge():
+            dataset_name, target, algorithm = dataset_var.get(), target_var.get(), algorithm_var.get()
+            features = [col for col in self.get_profile(dataset_name)['numeric_cols'] if col != target]
+            if not target or not features:
+                messagebox.showwarning("Aviso", "Dataset precisa de pelo menos 2 colunas numéricas para treinar um modelo!", parent=forge_win)
+                return
+            forge_win.destroy()
+            self.submit_training_job(dataset_name, features, target, algorithm, dict(GOLEM_TYPES[algorithm][1]))
+            if not (hasattr(self, 'jobs_tree') and self.jobs_tree.winfo_exists()):
+                self.show_models()
         
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        if len(numeric_cols) < 2:
-            messagebox.showwarning("Aviso", "Dataset precisa de pelo menos 2 colunas numéricas para treinar um modelo!")
+        ttk.Button(forge_win, text="🔥 Forjar", command=forge, style="Success.TButton", width=16).pack(pady=10)
+
+    def create_incremental_golem(self):
+        if not self.datasets:
+            messagebox.showwarning("Aviso", "Nenhum dataset carregado para treinar modelos!")
             return
         
-        X = df[numeric_cols[:-1]]
-        y = df[numeric_cols[-1]]
+        seed_win = tk.Toplevel(self.root)
+        seed_win.title("🌱 Golem Incremental")
+        seed_win.geometry("560x260")
+        seed_win.configure(background="#2F2F2F")
+        ttk.Label(seed_win, text="🌱 Golem Incremental", font=("Courier", 16, "bold"), foreground="#FFD700", background="#2F2F2F").pack(pady=10)
+        
+        form = ttk.Frame(seed_win, style="Card.TFrame", borderwidth=2, relief="solid")
+        form.pack(fill=tk.X, padx=10, pady=5)
+        dataset_var = tk.StringVar(value=list(self.datasets.keys())[0])
+        target_var = tk.StringVar()
+        ttk.Label(form, text="🧱 Bloco:", background="#3A3A3A", foreground="#E6D3A7").grid(row=0, column=0, sticky="w", padx=5, pady=6)
+        dataset_combo = ttk.Combobox(form, textvariable=dataset_var, values=list(self.datasets.keys()), width=32, state="readonly")
+        dataset_combo.grid(row=0, column=1, sticky="w", padx=5)
+        ttk.Label(form, text="🎯 Alvo:", background="#3A3A3A", foreground="#E6D3A7").grid(row=1, column=0, sticky="w", padx=5, pady=6)
+        target_combo = ttk.Combobox(form, textvariable=target_var, width=32, state="readonly")
+        target_combo.grid(row=1, column=1, sticky="w", padx=5)
+        ttk.Label(seed_win, text=f"🍖 Aprende em pedaços de {INCREMENTAL_CHUNK_ROWS:,} linhas e continua comendo cada bloco minerado depois",
+                  font=("Courier", 9), foreground="#B8860B", background="#2F2F2F", wraplength=520).pack(pady=5)
+        
+        def refresh_targets(event=None):
+            numeric_cols = self.get_profile(dataset_var.get())['numeric_cols']
+            target_combo['values'] = numeric_cols
+            target_var.set(numeric_cols[-1] if numeric_cols else "")
+        
+        dataset_combo.bind("<<ComboboxSelected>>", refresh_targets)
+        refresh_targets()
+        
+        def seed():
+            dataset_name, target = dataset_var.get(), target_var.get()
+            features = [col for col in self.get_profile(dataset_name)['numeric_cols'] if col != target]
+            if not target or not features:
+                messagebox.showwarning("Aviso", "Dataset precisa de pelo menos 2 colunas numéricas para treinar um modelo!", parent=seed_win)
+                return
+            seed_win.destroy()
+            model_name, _ = self.engine.create_incremental(dataset_name, target, features,
+                                                           model_name=self._unique_model_name(f"Golem_Incremental_{dataset_name}"))
+            self.log_activity(f"🌱 Golem incremental '{model_name}' nasceu | {len(features)} features → {target}")
+            self._run_incremental_feed(model_name, dataset_name, lambda progress: self.engine.seed_incremental(model_name, progress=progress))
+            self.show_models()
+        
+        ttk.Button(seed_win, text="🌱 Plantar", command=seed, style="Success.TButton", width=16).pack(pady=10)
+
+    def feed_selected_golem(self):
+        model_name = self._selected_model_name()
+        if model_name is None or self.models[model_name].get('algorithm') != 'Incremental':
+            messagebox.showwarning("Aviso", "🍖 Selecione um Golem incremental para alimentar!")
+            return
+        source = filedialog.askopenfilename(title=f"🍖 Bloco para alimentar o Golem '{model_name}'",
+                                            filetypes=[("Blocos", " ".join(f"*{ext}" for ext in SUPPORTED_EXTENSIONS)), ("All files", "*.*")])
+        if not source:
+            return
+        self._run_incremental_feed(model_name, os.path.basename(source),
+                                   lambda progress: self.engine.feed_incremental(model_name, source, progress=progress))
+
+    def _run_incremental_feed(self, model_name, label, feed):
+        def progress(rows, fraction):
+            self.set_status(f"🍖 Golem '{model_name}' comendo {label} | {fraction:.0%} | {rows:,} linhas")
         
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        def done(rows):
+            if model_name not in self.models:
+                return
+            self._log_incremental(model_name, f"comeu {rows:,} linhas de {label}")
+            if hasattr(self, 'models_tree') and self.models_tree.winfo_exists():
+                self.show_models()
         
-        model = RandomForestRegressor(n_estimators=100, random_state=42)
-        model.fit(X_train, y_train)
+        def failed(e):
+            message = f"❌ Golem incremental '{model_name}' não conseguiu comer {label}: {e}"
+            self.status_var.set(message)
+            self.log_activity(message)
         
-        y_pred = model.predict(X_test)
-        r2 = r2_score(y_test, y_pred)
-        rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-        mae = mean_absolute_error(y_test, y_pred)
+        self.run_in_background(lambda: feed(progress), done, failed)
+
+    def _log_incremental(self, model_name, what):
+        model_info = self.engine.refresh_incremental(model_name)
+        metrics = model_info['metrics']
+        message = (f"🌱 Golem '{model_name}' {what} | {model_info['rows_seen']:,} linhas no total | "
+                   f"R² {metrics['r2']:.3f} / RMSE {metrics['rmse']:.3f} nas últimas {metrics['window_rows']:,} linhas de teste")
+        self.status_var.set(message)
+        self.log_activity(message)
+
+    def _unique_model_name(self, base_name):
+        return self.engine.unique_model_name(base_name, {job.model_name for job in self.training.jobs.values() if job.is_active})
+
+    def submit_training_job(self, dataset_name, features, target, algorithm, params, base_name=None, quick=False):
+        # A matriz de features (float32, já dividida) vem do cache por versão do bloco; um cache miss
+        # copia o bloco inteiro, então a montagem roda num worker e o job entra na forja no callback
+        matrices = self.engine.feature_matrices
+        
+        def build():
+            misses = matrices.misses
+            return self.engine.training_spec(dataset_name, features, target, algorithm, params), matrices.misses == misses
+        
+        def submit(built):
+            spec, cached = built
+            self.log_activity(f"🧮 Matriz de features {'reaproveitada do cache' if cached else 'montada'}: "
+                              f"{spec['X_train'].shape[0] + spec['X_test'].shape[0]:,}x{len(features)} float32 | cache {matrices.nbytes/(1024*1024):.1f} MB")
+            model_name = self._unique_model_name(base_name or f"Golem_{dataset_name}")
+            meta = {'dataset': dataset_name, 'target': target, 'features': list(features), 'algorithm': algorithm, 'params': params, 'quick': quick}
+            self.training.submit(model_name, spec, meta)
+            self.status_var.set(f"🔥 Golem '{model_name}' enviado para a forja ({len(spec['X_train']):,} blocos de treino)")
+            self.log_activity(f"🧱 Golem '{model_name}' na fila da forja | {algorithm} | alvo: {target}")
+            self._start_training_polling()
+            self._refresh_jobs_tree()
+        
+        def failed(error):
+            self.status_var.set(f"❌ Erro ao montar a matriz de features de {dataset_name}")
+            self.log_activity(f"❌ Erro ao montar a matriz de features de {dataset_name}: {error}")
+        
+        self.status_var.set(f"🧮 Montando a matriz de features de {dataset_name}...")
+        self.run_in_background(build, submit, failed)
+
+    def _start_training_polling(self):
+        if not self._training_polling:
+            self._training_polling = True
+            self.root.after(TRAIN_POLL_MS, self._poll_training)
+
+    def _poll_training(self):
+        for job in self.training.poll():
+            self._finish_training_job(job)
+        self._refresh_jobs_tree()
+        if self.training.has_active():
+            self.root.after(TRAIN_POLL_MS, self._poll_training)
+        else:
+            self._training_polling = False
+
+    def _finish_training_job(self, job):
+        if job.status != 'done':
+            if job.status == 'error':
+                self.status_var.set(f"❌ Erro na forja do Golem '{job.model_name}': {job.error}")
+                self.log_activity(f"❌ Erro na forja do Golem '{job.model_name}': {job.error}")
+            return
         
-        model_name = f"Golem_{dataset_name}_{len(self.models)+1}"
-        self.models[model_name] = {
-            'model': model,
-            'dataset': dataset_name,
-            'target': numeric_cols[-1],
-            'features': numeric_cols[:-1],
-            'metrics': {'r2': r2, 'rmse': rmse, 'mae': mae},
+        result = job.result
+        job.result = None
+        model_info = dict(job.meta)
+        quick = model_info.pop('quick', False)
+        model_info.update({
+            'model': result['model'],
+            'metrics': result['metrics'],
             'created': datetime.datetime.now(),
-            'algorithm': 'RandomForest',
-            'training_time': 2.5
-        }
-        
-        messagebox.showinfo("✅ Sucesso", f"Golem de Ferro treinado com sucesso!\nPrecisão (R²): {r2:.4f}")
-        self.show_models()
-        self.log_activity(f"⚡ Golem treinado: {model_name} | R²: {r2:.4f}")
+            'training_time': result['training_time'],
+            'cpu_time': result['cpu_time'],
+            'model_bytes': result['model_bytes']
+        })
+        model_info.update({key: result[key] for key in TRAINING_RESULT_KEYS + ('params',) if key in result})
+        self.models[job.model_name] = model_info
+        
+        r2 = result['metrics']['r2']
+        self.status_var.set(f"✅ Golem '{job.model_name}' forjado em {result['training_time']:.1f}s (CPU {result['cpu_time']:.1f}s) | R²: {r2:.4f}")
+        iterations = f" | {result['iterations']} iterações (parada antecipada)" if 'iterations' in result else ""
+        if 'oob_curve' in result:
+            iterations = f" | {result['n_estimators']} árvores escolhidas pelo OOB"
+            self.log_activity("   🌳 Curva OOB: " + " → ".join(f"{point['trees']}:{point['oob_r2']:.4f}" for point in result['oob_curve']))
+        self.log_activity(f"⚡ Golem treinado: {job.model_name} | {model_info['algorithm']} | R²: {r2:.4f} | {result['training_time']:.1f}s parede, "
+                          f"{result['cpu_time']:.1f}s CPU | {result['model_bytes']/(1024*1024):.2f} MB{iterations}")
+        
+        if hasattr(self, 'models_tree') and self.models_tree.winfo_exists():
+            self._insert_model_row(job.model_name, model_info)
+        elif hasattr(self, 'jobs_tree') and self.jobs_tree.winfo_exists():
+            self.show_models()
+        if quick:
+            messagebox.showinfo("✅ Golem Criado", f"Golem de Ferro treinado com sucesso para {model_info['dataset']}!\nPrecisão (R²): {r2:.4f}")
 
-    def delete_selected_model(self):
-        selected = self.models_tree.selection()
+    def _build_jobs_panel(self, parent):
+        jobs_frame = ttk.Frame(parent, style="Card.TFrame", borderwidth=2, relief="solid")
+        jobs_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        header = ttk.Frame(jobs_frame, style="Card.TFrame")
+        header.pack(fill=tk.X)
+        ttk.Label(header, text="⚒️ Forja de Golems (fila de treino)", style="Subheader.TLabel", background="#3A3A3A").pack(side=tk.LEFT, padx=10, pady=5)
+        ttk.Button(header, text="✖ Cancelar Forja", command=self.cancel_selected_training_job, style="Danger.TButton", width=16).pack(side=tk.RIGHT, padx=5, pady=2)
+        
+        columns = ("ID", "Golem", "Bloco", "Tipo", "Status", "Tempo")
+        self.jobs_tree = ttk.Treeview(jobs_frame, columns=columns, show="headings", height=4)
+        for col, width in zip(columns, (40, 200, 160, 110, 110, 80)):
+            self.jobs_tree.heading(col, text=col)
+            self.jobs_tree.column(col, width=width, anchor="center")
+        self.jobs_tree.pack(fill=tk.X, padx=5, pady=5)
+        self._refresh_jobs_tree()
+
+    def _refresh_jobs_tree(self):
+        if not (hasattr(self, 'jobs_tree') and self.jobs_tree.winfo_exists()):
+            return
+        for job in self.training.jobs.values():
+            iid = str(job.job_id)
+            values = (job.job_id, job.model_name, job.meta['dataset'], job.meta['algorithm'], TRAIN_STATUS_LABELS[job.status], f"{job.elapsed:.1f}s")
+            if self.jobs_tree.exists(iid):
+                self.jobs_tree.item(iid, values=values)
+            else:
+                self.jobs_tree.insert("", 0, iid=iid, values=values)
+
+    def cancel_selected_training_job(self):
+        selected = self.jobs_tree.selection()
         if not selected:
+            messagebox.showwarning("Aviso", "⚒️ Selecione um trabalho da forja para cancelar!")
+            return
+        for iid in selected:
+            job = self.training.jobs.get(int(iid))
+            if job and self.training.cancel(job.job_id):
+                self.log_activity(f"🛑 Forja do Golem '{job.model_name}' cancelada")
+        self._refresh_jobs_tree()
+
+    def delete_selected_model(self):
+        model_name = self._selected_model_name()
+        if model_name is None:
             messagebox.showwarning("Aviso", "🏃‍♂️ Selecione um Golem para remover!")
             return
         
         if messagebox.askyesno("Confirmar Remoção", "Tem certeza que deseja destruir este Golem de Ferro?"):
-            item = self.models_tree.item(selected[0])
-            model_name = item['values'][1]
             if model_name in self.models:
                 del self.models[model_name]
                 self.show_models()
                 self.log_activity(f"⚔️ Golem destruído: {model_name}")
                 self.status_var.set(f"✅ Golem '{model_name}' destruído com sucesso!")
 
+    def _selected_model_names(self):
+        # A coluna Nome é truncada; o ID é a posição do Golem em self.models
+        selected = self.models_tree.selection() if hasattr(self, 'models_tree') and self.models_tree.winfo_exists() else ()
+        names = list(self.models)
+        positions = [int(self.models_tree.item(item)['values'][0]) - 1 for item in selected]
+        return [names[position] for position in positions if 0 <= position < len(names)]
+
+    def _selected_model_name(self):
+        selected = self._selected_model_names()
+        return selected[0] if selected else None
+
+    def predict_with_selected_model(self):
+        model_name = self._selected_model_name()
+        if model_name is None:
+            messagebox.showwarning("Aviso", "🔮 Selecione um Golem para prever!")
+            return
+        model_info = self.models[model_name]
+        source = filedialog.askopenfilename(title=f"🔮 Bloco para o Golem '{model_name}' prever",
+                                            filetypes=[("Blocos", " ".join(f"*{ext}" for ext in SUPPORTED_EXTENSIONS)), ("All files", "*.*")])
+        if not source:
+            return
+        output = filedialog.asksaveasfilename(title="🔮 Salvar previsões", defaultextension=".parquet",
+                                              initialfile=f"{os.path.splitext(os.path.basename(source))[0]}_previsoes.parquet",
+                                              filetypes=[("Parquet", "*.parquet"), ("CSV", "*.csv")])
+        if not output:
+            return
+        try:
+            model = self.get_model_estimator(model_name)
+        except Exception as e:
+            messagebox.showerror("❌ Erro", f"🔮 Não foi possível acordar o Golem '{model_name}': {e}")
+            return
+        if model is None:
+            messagebox.showerror("❌ Erro", f"🔮 O Golem '{model_name}' não tem estimador salvo")
+            return
+        job = self.predictor.submit(model_name, model, model_info['features'], source, output, f"{model_info['target']}_previsto")
+        self.log_activity(f"🔮 Previsão em lote iniciada: {os.path.basename(source)} → {job.label} | {len(model_info['features'])} features | {PREDICT_WORKERS} threads")
+        if not self._predict_polling:
+            self._predict_polling = True
+            self.root.after(PREDICT_POLL_MS, self._poll_predictions)
+
+    def _poll_predictions(self):
+        active_jobs = self.predictor.active_jobs()
+        if active_jobs:
+            job = active_jobs[0]
+            self.status_var.set(f"🔮 Prevendo {job.label} | {job.fraction:.0%} | {job.rows_read:,} linhas | {job.rows_per_sec:,.0f} linhas/s")
+        for job in self.predictor.pop_finished():
+            if job.status == 'done':
+                message = (f"🔮 Previsão concluída: {job.label} | {job.rows_read:,} linhas em {job.elapsed:.2f}s | "
+                           f"{job.rows_per_sec:,.0f} linhas/s | {os.path.getsize(job.output)/(1024*1024):.1f} MB")
+            elif job.status == 'cancelled':
+                message = f"🛑 Previsão cancelada: {job.label} ({job.rows_read:,} linhas já gravadas)"
+            else:
+                message = f"❌ Erro na previsão {job.label}: {job.error}"
+                messagebox.showerror("Erro de Previsão", message)
+            self.status_var.set(message)
+            self.log_activity(message)
+        if self.predictor.active_jobs():
+            self.root.after(PREDICT_POLL_MS, self._poll_predictions)
+        else:
+            self._predict_polling = False
+
     def compare_selected_models(self):
-        if len(self.models) < 2:
+        # Golems selecionados (ou todos) reavaliados em K-fold nos mesmos folds por bloco/alvo
+        model_names = self._selected_model_names()
+        if len(model_names) < 2:
+            model_names = list(self.models)
+        if len(model_names) < 2:
             messagebox.showwarning("Aviso", "🏃‍♂️ Precisa de pelo menos 2 Golems para realizar o torneio!")
             return
         
         comparison_win = tk.Toplevel(self.root)
         comparison_win.title("🏆 Torneio de Golems")
-        comparison_win.geometry("800x600")
+        comparison_win.geometry("1100x750")
         comparison_win.configure(background="#2F2F2F")
         
-        ttk.Label(comparison_win, text="🏆 Comparação de Golems de Ferro", font=("Courier", 16, "bold"), foreground="#FFD700", background="#2F2F2F").pack(pady=20)
-        
-        fig, ax = plt.subplots(figsize=(10, 6), facecolor='#3A3A3A')
-        fig.patch.set_facecolor('#3A3A3A')
-        ax.set_facecolor('#2F2F2F')
-        
-        model_names = []
-        r2_values = []
-        colors = ['#8B4513', '#556B2F', '#A0522D', '#D2691E', '#CD853F', '#F4A460']
-        
-        for i, (name, info) in enumerate(self.models.items()):
-            if i < 6:
-                model_names.append(name[:15])
-                r2_values.append(info['metrics']['r2'])
-        
-        bars = ax.bar(model_names, r2_values, color=colors[:len(model_names)])
-        for bar in bars:
-            height = bar.get_height()
-            ax.annotate(f'{height:.3f}',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom',
-                       color='#FFD700', fontsize=10)
-        
-        ax.set_title('Precisão dos Golems (R²)', color='#FFD700', fontsize=14)
-        ax.set_ylabel('Precisão (R²)', color='#E6D3A7', fontsize=12)
-        ax.set_ylim(0, max(r2_values) * 1.1 if r2_values else 1)
-        ax.tick_params(axis='x', colors='#E6D3A7')
-        ax.tick_params(axis='y', colors='#E6D3A7')
-        ax.grid(True, alpha=0.3, color='#555555')
-        
-        canvas = FigureCanvasTkAgg(fig, master=comparison_win)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        ttk.Label(comparison_win, text=f"🏆 Torneio de Golems: {TOURNAMENT_FOLDS}-fold nos mesmos folds", font=("Courier", 16, "bold"), foreground="#FFD700", background="#2F2F2F").pack(pady=10)
+        progress_var = tk.StringVar(value=f"⏳ Preparando {len(model_names)} Golems...")
+        ttk.Label(comparison_win, textvariable=progress_var, font=("Courier", 10), foreground="#4CAF50", background="#2F2F2F").pack(pady=5)
+        comparison_win.bind("<Destroy>", lambda event: self.figures.release('torneio', comparison_win) if event.widget is comparison_win else None)
+        
+        def progress(done, total):
+            self.dispatcher.call(lambda: progress_var.set(f"⚔️ {done}/{total} rodadas (Golem x fold)") if comparison_win.winfo_exists() else None)
+        
+        def render(tournament):
+            if not comparison_win.winfo_exists():
+                return
+            results = tournament['results']
+            ranked = sorted((name for name in model_names if 'error' not in results[name]),
+                            key=lambda name: (results[name]['dataset'], results[name]['target'], -results[name]['r2_mean']))
+            cached = sum(1 for name in ranked if results[name]['cached'])
+            progress_var.set(f"✅ {len(ranked)} Golems | {tournament['tasks']} rodadas novas | {cached} do cache | {tournament['elapsed']:.2f}s")
+            
+            rows = []
+            for name in ranked:
+                result = results[name]
+                rows.append((name, result['dataset'], result['target'], f"{result['r2_mean']:.4f} ± {result['r2_std']:.4f}",
+                             f"{result['rmse_mean']:.4f} ± {result['rmse_std']:.4f}", f"{result['mae_mean']:.4f} ± {result['mae_std']:.4f}",
+                             f"{result['fit_seconds']:.2f}", f"{result['predict_ms_per_1k']:.2f}", "⚡" if result['cached'] else "⚔️"))
+            rows += [(name, self.models[name]['dataset'], self.models[name]['target'], f"❌ {results[name]['error']}", "", "", "", "", "")
+                     for name in model_names if 'error' in results[name]]
+            self._make_table(comparison_win, ("Golem", "Bloco", "Alvo", "R² (média ± dp)", "RMSE", "MAE", "Ajuste (s)", "ms / 1k", "Cache"),
+                             rows, (150, 110, 90, 150, 150, 150, 80, 70, 50), height=min(10, max(len(rows), 3)))
+            if not ranked:
+                return
+            
+            def draw(fig):
+                ax = fig.add_subplot(111)
+                ax.set_facecolor('#2F2F2F')
+                labels = [f"{name[:15]}\n{results[name]['dataset'][:12]}" for name in ranked]
+                means = [results[name]['r2_mean'] for name in ranked]
+                bars = ax.bar(labels, means, yerr=[results[name]['r2_std'] for name in ranked], capsize=6, ecolor='#FFD700',
+                              color=['#8B4513', '#556B2F', '#A0522D', '#D2691E', '#CD853F', '#F4A460'][:len(ranked)] * (len(ranked) // 6 + 1))
+                for bar, value in zip(bars, means):
+                    ax.annotate(f'{value:.3f}', xy=(bar.get_x() + bar.get_width() / 2, value), xytext=(0, 3),
+                                textcoords="offset points", ha='center', va='bottom', color='#FFD700', fontsize=10)
+                ax.set_title(f'Precisão dos Golems (R² médio ± dp, {tournament["folds"]} folds)', color='#FFD700', fontsize=14)
+                ax.set_ylabel('Precisão (R²)', color='#E6D3A7', fontsize=12)
+                ax.tick_params(axis='x', colors='#E6D3A7', labelsize=8)
+                ax.tick_params(axis='y', colors='#E6D3A7')
+                ax.grid(True, alpha=0.3, color='#555555')
+                fig.tight_layout()
+            
+            key = tuple((name, results[name]['r2_mean'], results[name]['r2_std']) for name in ranked)
+            self.figures.show('torneio', comparison_win, key, draw, figsize=(10, 4.5), fill=tk.BOTH, expand=True, padx=20, pady=10)
+            champions = {}
+            for name in ranked:
+                champions.setdefault((results[name]['dataset'], results[name]['target']), name)
+            self.log_activity(f"🏆 Torneio: {len(ranked)} Golems em {tournament['folds']} folds | {tournament['elapsed']:.2f}s | campeões: "
+                              + ", ".join(f"{name} ({dataset}→{target}, R² {results[name]['r2_mean']:.4f})" for (dataset, target), name in champions.items()))
+        
+        def failed(e):
+            if comparison_win.winfo_exists():
+                progress_var.set(f"❌ Erro no torneio: {str(e)}")
+        
+        self.run_in_background(lambda: self.engine.tournament(model_names, progress=progress), render, failed)
 
     def show_model_details(self, event):
-        selected = self.models_tree.selection()
-        if not selected:
-            return
-        
-        item = self.models_tree.item(selected[0])
-        model_name = item['values'][1]
-        if model_name in self.models:
+        model_name = self._selected_model_name()
+        if model_name is not None:
             details_win = tk.Toplevel(self.root)
             details_win.title(f"👁️ Detalhes do Golem: {model_name}")
             details_win.geometry("700x500")
@@ -1212,6 +5273,11 @@ Nenhum bloco para analisar!
             info_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
             
             model_info = self.models[model_name]
+            try:
+                estimator = self.get_model_estimator(model_name)
+                estimator_text = str(estimator) if estimator is not None else "Golem sem estimador salvo"
+            except Exception as e:
+                estimator_text = f"❌ Não foi possível acordar o Golem: {str(e)}"
             info_text = f"""
 🏷️ Nome: {model_name}
 🧱 Dataset: {model_info['dataset']}
@@ -1222,10 +5288,15 @@ Nenhum bloco para analisar!
 📉 Erro (RMSE): {model_info['metrics']['rmse']:.4f}
 ⚡ Energia (MAE): {model_info['metrics']['mae']:.4f}
 🕐 Criado em: {model_info['created'].strftime("%Y-%m-%d %H:%M")}
-⏱️ Tempo de Treinamento: {model_info.get('training_time', 'N/A')} segundos
+⏱️ Tempo de Treinamento: {self._format_seconds(model_info.get('training_time'))} (CPU: {self._format_seconds(model_info.get('cpu_time'))})
+🧠 Estimador: {estimator_text}
+💾 Arquivo: {model_info.get('model_path') or 'apenas em memória'}
 """
             ttk.Label(info_frame, text=info_text, font=("Courier", 10), background="#3A3A3A", foreground="#E6D3A7", justify=tk.LEFT).pack(padx=10, pady=10)
 
+    def _format_seconds(self, value):
+        return f"{value:.2f} segundos" if isinstance(value, (int, float)) else "N/A"
+
     def show_reports(self):
         self.clear_content()
         reports_frame = ttk.Frame(self.content_frame, style="Main.TFrame")
@@ -1265,7 +5336,10 @@ e clique no botão "📥 Exportar Relatório".
         settings = [
             ("Tema da Interface", "minecraft_dark"),
             ("Máx. Registros na Visualização", "1000"),
-            ("Auto-save (minutos)", "5"),
+            ("Auto-save (minutos)", str(AUTOSAVE_INTERVAL_SEC // 60)),
+            ("Auto-save: snapshots por bloco", str(AUTOSAVE_KEEP_SNAPSHOTS)),
+            ("Auto-save: limite do baú (MB)", str(AUTOSAVE_MAX_MB)),
+            ("Formato do Auto-save", "parquet (zstd)"),
             ("Formato de Backup Padrão", "csv"),
             ("Precisão dos Golems", "automática")
         ]
@@ -1276,6 +5350,11 @@ e clique no botão "📥 Exportar Relatório".
             ttk.Label(frame, text=setting, font=("Courier", 10, "bold"), background="#3A3A3A", foreground="#9cdcfe").pack(side=tk.LEFT, padx=15, pady=8)
             ttk.Label(frame, text=value, font=("Courier", 10), background="#3A3A3A", foreground="#ce9178").pack(side=tk.RIGHT, padx=15, pady=8)
         
+        compact_frame = ttk.Frame(settings_frame, style="Card.TFrame", borderwidth=1, relief="solid")
+        compact_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(compact_frame, text="Compactar tipos ao carregar (categorias, downcast sem perda)", font=("Courier", 10, "bold"), background="#3A3A3A", foreground="#9cdcfe").pack(side=tk.LEFT, padx=15, pady=8)
+        ttk.Checkbutton(compact_frame, variable=self.compact_on_load).pack(side=tk.RIGHT, padx=15, pady=8)
+        
         btn_frame = ttk.Frame(settings_frame, style="Main.TFrame")
         btn_frame.pack(pady=30)
         ttk.Button(btn_frame, text="💾 Aplicar Configurações", style="Success.TButton", command=lambda: messagebox.showinfo("✅ Sucesso", "Configurações atualizadas com sucesso!")).pack(side=tk.LEFT, padx=10)
@@ -1293,22 +5372,48 @@ e clique no botão "📥 Exportar Relatório".
         desc_frame = ttk.Frame(notebook, style="Main.TFrame")
         notebook.add(desc_frame, text="📋 Descritivas")
         
-        numeric_df = df.select_dtypes(include=[np.number])
-        if not numeric_df.empty:
-            desc_stats = numeric_df.describe().round(4).T
-            tree = ttk.Treeview(desc_frame, columns=["metric"] + list(desc_stats.columns), show="headings")
+        def fill(stats):
+            if not desc_frame.winfo_exists():
+                return
+            for widget in desc_frame.winfo_children():
+                widget.destroy()
+            table = stats['table']
+            if table.empty:
+                return
+            if stats.get('approximate'):
+                self._approximate_banner(desc_frame, stats)
+                ttk.Button(desc_frame, text="🎯 Calcular Exato", style="Accent.TButton",
+                           command=lambda: self.compute_exact_analysis(dataset_name, load)).pack(pady=5)
+            labels = [DESCRIBE_LABELS.get(metric, metric) for metric in DESCRIBE_COLUMNS]
+            tree = ttk.Treeview(desc_frame, columns=["metric"] + labels, show="headings")
             tree.heading("metric", text="Métrica")
             tree.column("metric", width=100)
             
-            for col in desc_stats.columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=80)
+            for label in labels:
+                tree.heading(label, text=label)
+                tree.column(label, width=110 if stats.get('approximate') else 80)
             
-            for metric, row in desc_stats.iterrows():
-                values = [metric] + list(row.values)
-                tree.insert("", tk.END, values=values)
+            for metric, row in table.iterrows():
+                tree.insert("", tk.END, values=[metric] + [self._format_estimate(row, stat, 0 if stat == 'count' else 4) for stat in DESCRIBE_COLUMNS])
             
             tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        def failed(e):
+            if desc_frame.winfo_exists():
+                for widget in desc_frame.winfo_children():
+                    widget.destroy()
+                ttk.Label(desc_frame, text=f"❌ Erro ao calcular as estatísticas: {e}", style="Subheader.TLabel").pack(pady=50)
+        
+        def load():
+            # O motor estatístico roda num worker, como nas abas de Análise
+            if not desc_frame.winfo_exists():
+                return
+            for widget in desc_frame.winfo_children():
+                widget.destroy()
+            ttk.Label(desc_frame, text="⏳ Calculando estatísticas...", style="Subheader.TLabel").pack(pady=50)
+            self.run_in_background(lambda: self.get_column_stats(dataset_name), fill, failed)
+        
+        load()
 
     def quick_visualization(self, df, dataset_name):
         viz_win = tk.Toplevel(self.root)
@@ -1320,44 +5425,48 @@ e clique no botão "📥 Exportar Relatório".
         if not numeric_cols:
             ttk.Label(viz_win, text="⚠️ Nenhuma variável numérica para visualizar", style="Header.TLabel").pack(pady=50)
             return
+        approximate = self.engine.is_approximate(dataset_name)
+        source = self.engine.sample(dataset_name) if approximate else df
+        
+        def draw(fig):
+            axes = fig.subplots(2, 2).flatten()
+            for i, col in enumerate(numeric_cols):
+                if i < 4:
+                    ax = axes[i]
+                    ax.set_facecolor('#2F2F2F')
+                    values = source[col].dropna()
+                    if approximate:
+                        # Contagens da amostra escaladas para o bloco inteiro, com barra do IC binomial por faixa
+                        counts, edges = np.histogram(values.to_numpy(dtype=np.float64), bins=30)
+                        share = counts / max(len(source), 1)
+                        scale = len(df)
+                        half = APPROX_Z * np.sqrt(share * (1 - share) / max(len(source), 1)) * scale
+                        ax.bar(edges[:-1], share * scale, width=np.diff(edges), align='edge', alpha=0.7, color='#0078d7', edgecolor='white',
+                               yerr=half, ecolor='#FFA500', capsize=2)
+                        ax.set_title(f'Distribuição de {col} (estimada, IC {APPROX_CONFIDENCE:.0%})', color='#FFD700', fontsize=12)
+                    else:
+                        ax.hist(values, bins=30, alpha=0.7, color='#0078d7', edgecolor='white')
+                        ax.set_title(f'Distribuição de {col}', color='#FFD700', fontsize=12)
+                    ax.set_xlabel(col, color='#E6D3A7')
+                    ax.set_ylabel('Frequência', color='#E6D3A7')
+                    ax.tick_params(axis='both', colors='#E6D3A7')
+                    ax.grid(True, alpha=0.3, color='#555555')
+            fig.tight_layout()
         
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10), facecolor='#3A3A3A')
-        fig.patch.set_facecolor('#3A3A3A')
-        axes = axes.flatten()
-        
-        for i, col in enumerate(numeric_cols):
-            if i < 4:
-                ax = axes[i]
-                ax.set_facecolor('#2F2F2F')
-                ax.hist(df[col].dropna(), bins=30, alpha=0.7, color='#0078d7', edgecolor='white')
-                ax.set_title(f'Distribuição de {col}', color='#FFD700', fontsize=12)
-                ax.set_xlabel(col, color='#E6D3A7')
-                ax.set_ylabel('Frequência', color='#E6D3A7')
-                ax.tick_params(axis='both', colors='#E6D3A7')
-                ax.grid(True, alpha=0.3, color='#555555')
-        
-        plt.tight_layout()
-        canvas = FigureCanvasTkAgg(fig, master=viz_win)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        slot = f"visualizacao:{dataset_name}"
+        self.figures.show(slot, viz_win, (dataset_name, self.dataset_versions.get(dataset_name, 0), approximate), draw, figsize=(12, 10))
+        viz_win.bind("<Destroy>", lambda event: self.figures.release(slot, viz_win) if event.widget is viz_win else None)
 
     def train_quick_model(self, df, dataset_name):
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = self.get_profile(dataset_name)['numeric_cols']
         if len(numeric_cols) < 2:
             messagebox.showerror("Erro", "Dataset precisa de pelo menos 2 colunas numéricas para treinar um modelo!")
             return
         
-        X = df[numeric_cols[:-1]]
-        y = df[numeric_cols[-1]]
-        
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        
-        model = RandomForestRegressor(n_estimators=50, random_state=42)
-        model.fit(X_train, y_train)
-        
-        r2 = model.score(X_test, y_test)
-        messagebox.showinfo("✅ Golem Criado", f"Golem de Ferro treinado com sucesso para {dataset_name}!\nPrecisão (R²): {r2:.4f}")
-        self.log_activity(f"⚡ Golem rápido treinado para {dataset_name} com R²={r2:.4f}")
+        # Floresta adaptativa com teto baixo: para de plantar árvores assim que o OOB estabiliza
+        self.submit_training_job(dataset_name, numeric_cols[:-1], numeric_cols[-1], 'AdaptiveForest',
+                                 dict(GOLEM_TYPES['AdaptiveForest'][1], n_estimators_step=10, max_estimators=100),
+                                 base_name=f"Golem_Rapido_{dataset_name}", quick=True)
 
     def save_quick_analysis(self, df, dataset_name):
         directory = filedialog.askdirectory(title="💎 Salvar Análise Rápida")
@@ -1367,7 +5476,7 @@ e clique no botão "📥 Exportar Relatório".
         try:
             timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = os.path.join(directory, f"analise_rapida_{dataset_name}_{timestamp}.csv")
-            df.describe().to_csv(filename)
+            self.get_column_stats(dataset_name)['table'].to_csv(filename)
             messagebox.showinfo("✅ Sucesso", f"Análise rápida salva com sucesso!\nArquivo: {filename}")
         except Exception as e:
             messagebox.showerror("❌ Erro", f"Erro ao salvar análise:\n{str(e)}")
@@ -1383,21 +5492,22 @@ e clique no botão "📥 Exportar Relatório".
         try:
             timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = os.path.join(directory, f"relatorio_{dataset_name}_{timestamp}.txt")
-            df = self.datasets[dataset_name]
+            profile = self.get_profile(dataset_name)
             
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(f"📊 RELATÓRIO ESTATÍSTICO - {dataset_name}\n")
                 f.write(f"Gerado em: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write("=" * 60 + "\n")
-                f.write(f"📈 Dimensões: {df.shape[0]} linhas, {df.shape[1]} colunas\n")
-                f.write(f"🔍 Colunas: {', '.join(df.columns)}\n")
+                f.write(f"📈 Dimensões: {profile['rows']} linhas, {profile['cols']} colunas\n")
+                f.write(f"⚖️ Peso em memória: {profile['memory_bytes']/(1024*1024):.2f} MB\n")
+                f.write(f"🔍 Colunas: {', '.join(map(str, profile['dtypes']))}\n")
                 f.write("🧱 Tipos de Dados:\n")
-                for col, dtype in df.dtypes.items():
+                for col, dtype in profile['dtypes'].items():
                     f.write(f"   • {col}: {dtype}\n")
                 f.write("\n🕳️ Valores Nulos:\n")
-                for col, count in df.isnull().sum().items():
+                for col, count in profile['null_by_column'].items():
                     if count > 0:
-                        f.write(f"   • {col}: {count} ({count/len(df)*100:.2f}%)\n")
+                        f.write(f"   • {col}: {count} ({count/profile['rows']*100:.2f}%)\n")
             
             messagebox.showinfo("✅ Sucesso", f"Relatório estatístico exportado com sucesso!\nArquivo: {filename}")
         except Exception as e:
@@ -1406,16 +5516,138 @@ e clique no botão "📥 Exportar Relatório".
     def save_statistical_analysis(self, dataset_name):
         messagebox.showinfo("✅ Análise Salva", f"Análise estatística do bloco '{dataset_name}' salva no Baú de Dados!")
 
+def expand_dataset_paths(paths):
+    # Arquivos são usados como estão; diretórios viram todos os blocos suportados dentro deles
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                   if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def run_cli_task(command, path, options):
+    # Uma tarefa por bloco, num processo próprio quando --jobs > 1
+    start_time = time.perf_counter()
+    engine = MiningEngine()
+    result = {'path': path, 'command': command}
+    try:
+        if command == 'predict':
+            # Sem carregar o bloco: o arquivo passa em chunks pelo Golem direto para o destino
+            engine.load_models(options['models_dir'])
+            os.makedirs(options['to'], exist_ok=True)
+            output = os.path.join(options['to'], f"{os.path.splitext(os.path.basename(path))[0]}_previsoes.{options['format']}")
+            result['prediction'] = engine.predict_file(options['model'], path, output, workers=options.get('workers') or PREDICT_WORKERS)
+            result['status'] = 'done'
+            result['elapsed'] = time.perf_counter() - start_time
+            return result
+        name = engine.load(path, columns=options.get('columns'), predicates=options.get('where'))
+        result['dataset'] = name
+        if command == 'profile':
+            result.update(engine.profile_report(name, correlation=options.get('correlation', False), dangers=options.get('dangers', False)))
+        elif command == 'train':
+            model_name, info = engine.train(name, options['target'], options.get('features'), options['algorithm'], options.get('params'))
+            result['golem'] = {key: info[key] for key in ('target', 'features', 'algorithm', 'params', 'metrics', 'training_time', 'cpu_time')}
+            result['golem']['name'] = model_name
+            if options.get('models_dir'):
+                os.makedirs(options['models_dir'], exist_ok=True)
+                saved_count, bytes_written = engine.export_models(options['models_dir'])
+                result['golem'].update({'saved': saved_count, 'bytes_written': bytes_written})
+        elif command == 'export':
+            os.makedirs(options['to'], exist_ok=True)
+            result['file'] = engine.export_dataset(name, options['to'], options['format'])
+            report_file = os.path.splitext(result['file'])[0] + "_relatorio.json"
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(engine.profile_report(name), f, indent=2, ensure_ascii=False, default=to_jsonable)
+            result['report'] = report_file
+        result['status'] = 'done'
+    except Exception as e:
+        result.update({'status': 'error', 'error': str(e)})
+    result['elapsed'] = time.perf_counter() - start_time
+    return result
+
+
+def run_cli(args):
+    paths = expand_dataset_paths(args.paths)
+    options = {key: value for key, value in vars(args).items() if key not in ('command', 'paths', 'jobs', 'output', 'bench_stats', 'startup_timing')}
+    if options.get('params'):
+        options['params'] = json.loads(options['params'])
+    if args.jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs, mp_context=multiprocessing.get_context('spawn')) as pool:
+            results = list(pool.map(run_cli_task, [args.command] * len(paths), paths, [options] * len(paths)))
+    else:
+        results = [run_cli_task(args.command, path, options) for path in paths]
+    
+    text = json.dumps(results, indent=2, ensure_ascii=False, default=to_jsonable)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0 if all(result['status'] == 'done' for result in results) else 1
+
+
 def main():
+    parser = argparse.ArgumentParser(prog="bigminingcraft", description="⛏️ Minecraft Data Miner & AutoML")
+    parser.add_argument("--bench-stats", type=int, nargs='?', const=10_000_000, metavar="LINHAS",
+                        help="compara o motor estatístico com DataFrame.describe() e sai")
+    commands = parser.add_subparsers(dest="command", metavar="{profile,train,export,predict}",
+                                     help="modo sem interface: processa blocos e emite JSON (sem subcomando abre a interface)")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("paths", nargs='+', metavar="BLOCO", help="arquivos ou diretórios de blocos")
+    common.add_argument("--jobs", type=int, default=1, help="blocos processados em paralelo (processos)")
+    common.add_argument("--output", help="grava o JSON neste arquivo em vez da saída padrão")
+    common.add_argument("--columns", nargs='+', help="lê só estas colunas do bloco")
+    common.add_argument("--where", action="append", metavar="FILTRO",
+                        help="filtro coluna<op>valor aplicado na leitura (repetível; Parquet pula row groups)")
+    
+    profile_parser = commands.add_parser("profile", parents=[common], help="perfil + estatísticas por coluna")
+    profile_parser.add_argument("--correlation", action="store_true", help="inclui as conexões mais fortes")
+    profile_parser.add_argument("--dangers", action="store_true", help="inclui a varredura de perigos")
+    train_parser = commands.add_parser("train", parents=[common], help="forja um Golem por bloco")
+    train_parser.add_argument("--target", required=True, help="coluna alvo")
+    train_parser.add_argument("--features", nargs='+', help="colunas de entrada (padrão: todas as numéricas menos o alvo)")
+    train_parser.add_argument("--algorithm", default="RandomForest", choices=sorted(set(GOLEM_TYPES) | set(AUTOML_SEARCH_SPACE)), help="tipo de Golem")
+    train_parser.add_argument("--params", help="hiperparâmetros em JSON")
+    train_parser.add_argument("--models-dir", help="estábulo onde guardar os Golems forjados")
+    export_parser = commands.add_parser("export", parents=[common], help="converte blocos e grava relatório JSON")
+    export_parser.add_argument("--to", required=True, help="diretório de destino")
+    export_parser.add_argument("--format", default="parquet", choices=["parquet", "csv"])
+    predict_parser = commands.add_parser("predict", parents=[common], help="previsão em lote com um Golem do estábulo")
+    predict_parser.add_argument("--model", required=True, help="nome do Golem no índice do estábulo")
+    predict_parser.add_argument("--models-dir", default=GOLEM_STORE_DIR, help="estábulo com golems_index.json")
+    predict_parser.add_argument("--to", required=True, help="diretório de destino das previsões")
+    predict_parser.add_argument("--format", default="parquet", choices=["parquet", "csv"])
+    predict_parser.add_argument("--workers", type=int, help="threads de previsão por arquivo (padrão: todos os núcleos)")
+    
+    parser.add_argument("--startup-timing", action="store_true", help="imprime o tempo de cada fase da inicialização")
+    args = parser.parse_args()
+    if args.bench_stats:
+        print(json.dumps(benchmark_stats_engine(rows=args.bench_stats), indent=2))
+        return
+    if args.command:
+        if args.where:
+            try:
+                args.where = [parse_predicate(text) for text in args.where]
+            except ValueError as e:
+                parser.error(str(e))
+        raise SystemExit(run_cli(args))
+    
     root = tk.Tk()
-    app = MinecraftBigDataApp(root)
+    app = MinecraftBigDataApp(root, startup_timing=args.startup_timing)
     
     def on_closing():
         if messagebox.askokcancel("⛏️ Sair do Mundo", "Deseja realmente sair do mundo de Minecraft Data Miner?\nBlocos não salvos serão perdidos!"):
+            app.ingestion.cancel_all()
+            app.predictor.cancel_all()
+            app.training.shutdown()
+            app.figures.release_all()
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
 
 if __name__ == "__main__":
-    main()'
+    main()
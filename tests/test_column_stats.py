@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import BigMiningCraft as bmc
+
+
+QUANTILE_COLUMNS = [f"q{int(round(q * 100)):02d}" for q in bmc.STATS_QUANTILES]
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'normal': rng.normal(10, 3, 500),
+        'skewed': rng.exponential(2.0, 500),
+        'ints': rng.integers(-50, 50, 500),
+        'constant': np.full(500, 7.0),
+        'all_nan': np.full(500, np.nan),
+        'nullable': pd.array(rng.integers(0, 10, 500), dtype='Int64'),
+    })
+    df.loc[::7, 'normal'] = np.nan
+    df.loc[::11, 'nullable'] = pd.NA
+    return df
+
+
+def test_column_stats_match_pandas(frame):
+    table = bmc.compute_column_stats(frame)['table']
+    reference = frame.astype('float64')
+    for col in ['normal', 'skewed', 'ints', 'nullable']:
+        series = reference[col]
+        row = table.loc[col]
+        assert row['count'] == series.count()
+        assert row['nulls'] == series.isna().sum()
+        assert row['mean'] == pytest.approx(series.mean())
+        assert row['std'] == pytest.approx(series.std())
+        assert row['min'] == series.min() and row['max'] == series.max()
+        assert row['skew'] == pytest.approx(series.skew())
+        assert row['kurt'] == pytest.approx(series.kurt())
+        expected = series.quantile(list(bmc.STATS_QUANTILES)).to_numpy()
+        np.testing.assert_allclose(row[QUANTILE_COLUMNS].to_numpy(dtype=float), expected)
+
+
+def test_column_stats_constant_column(frame):
+    row = bmc.compute_column_stats(frame, ['constant'])['table'].loc['constant']
+    assert row['count'] == 500 and row['std'] == 0.0
+    assert row['min'] == row['max'] == 7.0
+    assert row['skew'] == 0.0 and row['kurt'] == 0.0
+    assert (row[QUANTILE_COLUMNS] == 7.0).all()
+
+
+def test_column_stats_all_nan_column(frame):
+    row = bmc.compute_column_stats(frame, ['all_nan'])['table'].loc['all_nan']
+    assert row['count'] == 0 and row['nulls'] == 500 and row['null_pct'] == 100.0
+    assert row[['mean', 'std', 'min', 'max', 'skew', 'kurt'] + QUANTILE_COLUMNS].isna().all()
+
+
+def test_column_stats_small_blocks_match_single_block(frame):
+    columns = ['normal', 'skewed', 'ints', 'nullable']
+    single = bmc.compute_column_stats(frame, columns)['table']
+    blocked = bmc.compute_column_stats(frame, columns, block_bytes=1)['table']
+    pd.testing.assert_frame_equal(single, blocked)
+
+
+def test_column_stats_empty_frame():
+    df = pd.DataFrame({'a': pd.Series([], dtype=np.float64), 'b': pd.Series([], dtype=np.int64)})
+    table = bmc.compute_column_stats(df)['table']
+    assert list(table.index) == ['a', 'b']
+    assert (table['count'] == 0).all() and (table['nulls'] == 0).all()
+    stat_columns = ['mean', 'std', 'var', 'min', 'max', 'skew', 'kurt'] + QUANTILE_COLUMNS
+    assert table[stat_columns].isna().all().all()
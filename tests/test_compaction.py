@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+import BigMiningCraft as bmc
+
+
+def test_compaction_round_trip_preserves_values():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({
+        'small_ints': rng.integers(-100, 100, 1000),
+        'unsigned': np.array(rng.integers(0, 256, 1000), dtype=np.uint8),
+        'wide_ints': rng.integers(0, 70_000, 1000),
+        'whole_floats': rng.integers(0, 1000, 1000).astype(float),
+        'halves': rng.integers(0, 100, 1000) / 2,
+        'precise': rng.normal(size=1000),
+        'labels': rng.choice(['ferro', 'ouro', 'diamante'], 1000),
+        'flags': rng.random(1000) > 0.5,
+    })
+    df.loc[::9, 'whole_floats'] = np.nan
+    compacted, report = bmc.compact_dataframe(df)
+    assert str(compacted['small_ints'].dtype) == 'int8'
+    assert str(compacted['unsigned'].dtype) == 'uint8'
+    assert str(compacted['wide_ints'].dtype) == 'int32'
+    assert str(compacted['whole_floats'].dtype) == 'Int16'
+    assert str(compacted['halves'].dtype) == 'float32'
+    assert str(compacted['precise'].dtype) == 'float64'
+    assert isinstance(compacted['labels'].dtype, pd.CategoricalDtype)
+    assert (report['bytes_after'] <= report['bytes_before']).all()
+    pd.testing.assert_frame_equal(compacted.astype(df.dtypes.to_dict()), df)
+
+def test_compaction_keeps_high_cardinality_text():
+    df = pd.DataFrame({'ids': [f"bloco-{i}" for i in range(1000)]})
+    compacted, _ = bmc.compact_dataframe(df)
+    assert not isinstance(compacted['ids'].dtype, pd.CategoricalDtype)
+
+
+def test_compaction_never_widens():
+    df = pd.DataFrame({'u16': np.array([0, 40_000, 65_535], dtype=np.uint16)})
+    compacted, _ = bmc.compact_dataframe(df)
+    assert compacted['u16'].dtype == np.uint16
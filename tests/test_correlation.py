@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import BigMiningCraft as bmc
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=400)
+    return pd.DataFrame({
+        'a': base,
+        'b': 2 * base + rng.normal(scale=0.5, size=400),
+        'c': rng.normal(size=400),
+        'd': -base + rng.normal(scale=2.0, size=400),
+        'e': rng.integers(0, 5, 400).astype(float),
+    })
+
+
+@pytest.mark.parametrize("method", ['pearson', 'spearman'])
+def test_correlation_matches_pandas(frame, method):
+    columns = list(frame.columns)
+    result = bmc.compute_correlation(frame, columns, method, block_cols=2)
+    np.testing.assert_allclose(result['matrix'], frame.corr(method=method).to_numpy(), atol=1e-10)
+
+
+def test_correlation_top_pairs_are_strongest(frame):
+    result = bmc.compute_correlation(frame, list(frame.columns), top_k=1)
+    assert [pair[:2] for pair in result['top_pairs']] == [('a', 'b')]
+
+
+def test_correlation_constant_column_is_nan(frame):
+    frame = frame.assign(constant=3.0)
+    result = bmc.compute_correlation(frame, ['a', 'constant'])
+    assert np.isnan(result['matrix'][0, 1])
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+import BigMiningCraft as bmc
+
+
+def _count(df, chunk_rows, n_partitions=bmc.DANGER_HASH_PARTITIONS, examples=10):
+    counter = bmc.DuplicateCounter(n_partitions)
+    for start in range(0, len(df), chunk_rows):
+        counter.add(df.iloc[start:start + chunk_rows], start)
+    return counter.finish(examples)
+
+
+def test_duplicate_counter_matches_pandas():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'a': rng.integers(0, 20, 3000), 'b': rng.choice(['x', 'y', 'z'], 3000)})
+    expected = df.duplicated()
+    for chunk_rows, partitions in ((3000, 1), (250, 16), (999, 256)):
+        count, examples = _count(df, chunk_rows, partitions)
+        assert count == expected.sum()
+        assert examples == np.flatnonzero(expected)[:10].tolist()
+
+
+def test_duplicate_counter_without_duplicates_or_rows():
+    assert _count(pd.DataFrame({'a': range(100)}), 30) == (0, [])
+    assert bmc.DuplicateCounter().finish() == (0, [])
+
+
+def test_scan_dangers_reports_duplicates():
+    df = pd.DataFrame({'a': [1.0, 2.0, 1.0, 3.0, 2.0], 'b': [5, 6, 5, 7, 6]})
+    dangers = bmc.scan_dangers(lambda: bmc.iter_frame_chunks(df, 2))
+    assert dangers['duplicates'] == 2
+    assert dangers['duplicate_examples'] == [2, 4]
@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+import BigMiningCraft as bmc
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("profundidade>=10", ('profundidade', '>=', '10')),
+    ("minerio == ouro", ('minerio', '==', 'ouro')),
+    ("a!=3", ('a', '!=', '3')),
+    ("b<-2.5", ('b', '<', '-2.5')),
+    ("c<=0", ('c', '<=', '0')),
+    ("d>1", ('d', '>', '1')),
+])
+def test_parse_predicate(text, expected):
+    assert bmc.parse_predicate(text) == expected
+
+
+@pytest.mark.parametrize("text", ["a=>3", "semoperador", ">=3", "a=3"])
+def test_parse_predicate_rejects_malformed(text):
+    with pytest.raises(ValueError):
+        bmc.parse_predicate(text)
+
+
+def test_check_pushdown_columns_reports_missing():
+    schema = {'columns': [('a', 'int64'), ('b', 'float64')]}
+    bmc.check_pushdown_columns("x.csv", schema, ['a'], [('b', '>', '1')])
+    with pytest.raises(ValueError, match="'c'"):
+        bmc.check_pushdown_columns("x.csv", schema, None, [('c', '>', '1')])
+
+
+def test_apply_predicates_drops_nulls():
+    df = pd.DataFrame({'a': pd.array([1, None, 5, 10], dtype='Int64')})
+    filtered = bmc.apply_predicates(df, [bmc.parse_predicate("a>=5")])
+    assert filtered['a'].tolist() == [5, 10]